@@ -58,6 +58,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name"]
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="user_created_id_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
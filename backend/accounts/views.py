@@ -5,6 +5,7 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.pagination import date_range_filters, keyset_paginate
 from config.views import BaseAPIView
 from .models import GamificationProfile
 from .serializers import (
@@ -140,9 +141,12 @@ class AdminUserListView(BaseAPIView):
                 status_code=status.HTTP_403_FORBIDDEN,
             )
         User = get_user_model()
-        qs = User.objects.all().select_related("gamification_profile").order_by("-created_at")[:200]
-        serializer = AdminUserSerializer(qs, many=True)
-        return self.respond(data={"users": serializer.data})
+        qs = User.objects.select_related("gamification_profile").filter(
+            **date_range_filters(request, "created_at")
+        )
+        page = keyset_paginate(qs, request, "created_at")
+        serializer = AdminUserSerializer(page.object_list, many=True)
+        return self.respond_paginated(page=page, data={"users": serializer.data})
 
 
 class AdminUserDetailView(BaseAPIView):
@@ -0,0 +1,130 @@
+"""config/pagination.py"""
+
+import base64
+import json
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 500
+
+
+class KeysetPage:
+    """Keyset page that can be passed to respond_paginated as-is (total is not counted)."""
+
+    number = None
+    count = None
+
+    def __init__(self, object_list: list, page_size: int, next_cursor: str | None, has_previous: bool):
+        self.object_list = object_list
+        self.per_page = page_size
+        self.next_cursor = next_cursor
+        self.paginator = self
+        self._has_previous = has_previous
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode((cursor + "=" * (-len(cursor) % 4)).encode("ascii"))
+        values = json.loads(raw)
+    except (ValueError, UnicodeError) as exc:
+        raise ValidationError({"cursor": "cursor 형식이 올바르지 않습니다."}) from exc
+    if not isinstance(values, list):
+        raise ValidationError({"cursor": "cursor 형식이 올바르지 않습니다."})
+    return values
+
+
+def decode_time_cursor(cursor: str, size: int = 2) -> list:
+    """Decode a [iso_datetime, int, ...] cursor back into (datetime, int, ...)."""
+    values = decode_cursor(cursor)
+    if len(values) != size:
+        raise ValidationError({"cursor": "cursor 형식이 올바르지 않습니다."})
+    moment = parse_datetime(str(values[0]))
+    if moment is None:
+        raise ValidationError({"cursor": "cursor 형식이 올바르지 않습니다."})
+    try:
+        return [moment, *(int(value) for value in values[1:])]
+    except (TypeError, ValueError) as exc:
+        raise ValidationError({"cursor": "cursor 형식이 올바르지 않습니다."}) from exc
+
+
+def parse_page_size(request: Any, default: int = DEFAULT_PAGE_SIZE) -> int:
+    value = request.query_params.get("page_size")
+    if value in (None, ""):
+        return default
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValidationError({"page_size": "page_size는 숫자여야 합니다."}) from exc
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def _parse_bound(value: str, field_name: str) -> tuple[datetime, bool]:
+    parsed = parse_datetime(value)
+    if parsed is not None:
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed, timezone.get_current_timezone())
+        return parsed, False
+    parsed_date = parse_date(value)
+    if parsed_date is None:
+        raise ValidationError({field_name: "날짜 형식이 올바르지 않습니다."})
+    start = timezone.make_aware(
+        datetime.combine(parsed_date, time.min), timezone.get_current_timezone()
+    )
+    return start, True
+
+
+def date_range_filters(request: Any, field: str) -> dict:
+    """Turn date_from/date_to query params into ORM filters (a bare date_to includes that whole day)."""
+    return build_date_range_filters(
+        request.query_params.get("date_from"),
+        request.query_params.get("date_to"),
+        field,
+    )
+
+
+def build_date_range_filters(date_from: str | None, date_to: str | None, field: str) -> dict:
+    filters = {}
+    if date_from:
+        filters[f"{field}__gte"], _ = _parse_bound(date_from, "date_from")
+    if date_to:
+        bound, is_date = _parse_bound(date_to, "date_to")
+        if is_date:
+            filters[f"{field}__lt"] = bound + timedelta(days=1)
+        else:
+            filters[f"{field}__lte"] = bound
+    return filters
+
+
+def keyset_paginate(queryset, request: Any, time_field: str) -> KeysetPage:
+    """Paginate newest-first on (time_field, id) without OFFSET, so deep pages cost the same."""
+    page_size = parse_page_size(request)
+    cursor = request.query_params.get("cursor")
+    if cursor:
+        moment, last_id = decode_time_cursor(cursor)
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__lt": moment}) | Q(**{time_field: moment, "id__lt": last_id})
+        )
+    rows = list(queryset.order_by(f"-{time_field}", "-id")[: page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, time_field).isoformat(), last.id])
+    return KeysetPage(rows, page_size, next_cursor, has_previous=bool(cursor))
@@ -26,7 +26,7 @@ def resolve_api_name(api: str | None, request: Any = None) -> str:
 
 
 def _build_pagination(page: Any) -> dict | None:
-    """Convert a PageNumberPagination page into a meta.pagination dict."""
+    """Convert a PageNumberPagination (or keyset) page into a meta.pagination dict."""
     if page is None:
         return None
     paginator = getattr(page, "paginator", None)
@@ -37,13 +37,16 @@ def _build_pagination(page: Any) -> dict | None:
     total = getattr(paginator, "count", None)
     has_next = page.has_next() if hasattr(page, "has_next") else None
     has_previous = page.has_previous() if hasattr(page, "has_previous") else None
-    return {
+    pagination = {
         "page": page_number,
         "page_size": page_size,
         "total": total,
         "has_next": has_next,
         "has_previous": has_previous,
     }
+    if hasattr(page, "next_cursor"):
+        pagination["next_cursor"] = page.next_cursor
+    return pagination
 
 
 def api_response(
@@ -137,6 +137,10 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -178,6 +182,9 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 월드컵 pick 저장 방식: rows(경기당 1행) / packed(연속 경기를 1행에 압축)
+WORLDCUP_PICK_STORAGE = env("WORLDCUP_PICK_STORAGE", default="rows")
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -11,6 +11,7 @@ from .models import (
     GameResult,
     Banner,
     BannerClickLog,
+    ImageMetadata,
 )
 
 admin.site.register(Game)
@@ -20,3 +21,4 @@ admin.site.register(WorldcupPickLog)
 admin.site.register(GameResult)
 admin.site.register(Banner)
 admin.site.register(BannerClickLog)
+admin.site.register(ImageMetadata)
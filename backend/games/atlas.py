@@ -0,0 +1,165 @@
+import hashlib
+import logging
+import os
+import threading
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from . import blob_store
+from .image_variants import media_relative_path
+from .models import Game
+
+logger = logging.getLogger(__name__)
+
+# 목록 썸네일(4:3)용 셀. 시트 하나에 8x8 = 64칸, 그보다 많으면 시트를 더 만든다.
+ATLAS_CELL_WIDTH = 160
+ATLAS_CELL_HEIGHT = 120
+ATLAS_COLUMNS = 8
+ATLAS_CELLS_PER_SHEET = 64
+ATLAS_QUALITY = 75
+ATLAS_DIR = "_atlas"
+
+_lock = threading.Lock()
+_running: set[int] = set()
+_rerun: set[int] = set()
+
+
+def _item_source(item) -> str | None:
+    """아틀라스에 넣을 로컬 파일. 160px 변환본이 있으면 그것을 쓴다."""
+    for url in ((item.image_variants or {}).get(str(ATLAS_CELL_WIDTH)), item.file_name):
+        relative_path = media_relative_path(url or "")
+        if relative_path and os.path.isfile(os.path.join(settings.MEDIA_ROOT, relative_path)):
+            return relative_path
+    return None
+
+
+def atlas_signature(sources: list[tuple[int, str, str]]) -> str:
+    digest = hashlib.sha1()
+    for item_id, file_name, source in sources:
+        digest.update(f"{item_id}\0{file_name}\0{source}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _render_cell(relative_path: str) -> Image.Image | None:
+    try:
+        with Image.open(os.path.join(settings.MEDIA_ROOT, relative_path)) as opened:
+            image = ImageOps.exif_transpose(opened).convert("RGB")
+            return ImageOps.fit(
+                image, (ATLAS_CELL_WIDTH, ATLAS_CELL_HEIGHT), Image.Resampling.LANCZOS
+            )
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning("아틀라스 이미지 로드 실패: %s", relative_path, exc_info=True)
+        return None
+
+
+def build_game_atlas(game: Game, force: bool = False) -> dict:
+    """활성 아이템 이미지를 시트 몇 장으로 묶고 좌표 manifest 를 Game.item_atlas 에 저장한다."""
+    items = list(game.items.filter(is_active=True).order_by("sort_order", "id"))
+    sources = []
+    for item in items:
+        source = _item_source(item)
+        if source:
+            sources.append((item.id, item.file_name, source))
+    signature = atlas_signature(sources)
+    previous = game.item_atlas or {}
+    if not force and previous.get("signature") == signature:
+        return previous
+
+    cells = []
+    for item_id, file_name, source in sources:
+        cell = _render_cell(source)
+        if cell is not None:
+            cells.append((item_id, file_name, cell))
+
+    storage = FileSystemStorage(location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL)
+    prefix = game.storage_prefix or f"worldcup/{game.slug}/"
+    manifest = {
+        "signature": signature,
+        "cell": [ATLAS_CELL_WIDTH, ATLAS_CELL_HEIGHT],
+        "columns": ATLAS_COLUMNS,
+        "sheets": [],
+        "items": {},
+    }
+    for sheet_index, start in enumerate(range(0, len(cells), ATLAS_CELLS_PER_SHEET)):
+        chunk = cells[start : start + ATLAS_CELLS_PER_SHEET]
+        rows = (len(chunk) + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+        columns = min(ATLAS_COLUMNS, len(chunk))
+        sheet = Image.new("RGB", (columns * ATLAS_CELL_WIDTH, rows * ATLAS_CELL_HEIGHT))
+        for offset, (item_id, file_name, cell) in enumerate(chunk):
+            column, row = offset % ATLAS_COLUMNS, offset // ATLAS_COLUMNS
+            sheet.paste(cell, (column * ATLAS_CELL_WIDTH, row * ATLAS_CELL_HEIGHT))
+            manifest["items"][str(item_id)] = {
+                "sheet": sheet_index,
+                "column": column,
+                "row": row,
+                "src": file_name,
+            }
+        buffer = BytesIO()
+        sheet.save(buffer, "WEBP", quality=ATLAS_QUALITY, method=4)
+        name = f"{prefix}{ATLAS_DIR}/atlas-{signature}-{sheet_index}.webp"
+        saved = blob_store.save_file(storage, name, ContentFile(buffer.getvalue()))
+        manifest["sheets"].append(
+            {"url": storage.url(saved), "columns": columns, "rows": rows}
+        )
+
+    # post_save 를 타면 카탈로그 캐시가 무효화되므로 update 로 저장한다.
+    Game.objects.filter(pk=game.pk).update(item_atlas=manifest)
+    game.item_atlas = manifest
+    current_urls = {sheet["url"] for sheet in manifest["sheets"]}
+    for sheet in previous.get("sheets", []):
+        if sheet.get("url") in current_urls:
+            continue
+        relative_path = media_relative_path(sheet.get("url", ""))
+        if relative_path:
+            try:
+                os.unlink(os.path.join(settings.MEDIA_ROOT, relative_path))
+            except FileNotFoundError:
+                pass
+    return manifest
+
+
+def _run(game_id: int) -> None:
+    while True:
+        try:
+            game = Game.objects.filter(pk=game_id).first()
+            if game is not None:
+                build_game_atlas(game)
+        except Exception:  # noqa: BLE001 - 백그라운드 실패는 요청에 영향을 주지 않는다
+            logger.exception("아틀라스 생성 실패: game_id=%s", game_id)
+        with _lock:
+            if game_id in _rerun:
+                _rerun.discard(game_id)
+                continue
+            _running.discard(game_id)
+            return
+
+
+def _run_in_thread(game_id: int) -> None:
+    try:
+        _run(game_id)
+    finally:
+        # 스레드마다 DB 연결이 따로 열리므로 끝나면 닫는다.
+        connection.close()
+
+
+def _start(game_id: int) -> None:
+    with _lock:
+        if game_id in _running:
+            # 생성 중에 또 바뀌었으면 끝난 뒤 한 번 더 만든다.
+            _rerun.add(game_id)
+            return
+        _running.add(game_id)
+    if not getattr(settings, "GAME_ATLAS_BACKGROUND", True):
+        _run(game_id)
+        return
+    threading.Thread(target=_run_in_thread, args=(game_id,), daemon=True).start()
+
+
+def schedule_atlas_build(game_id: int) -> None:
+    """커밋 뒤 백그라운드 스레드에서 게임의 아틀라스를 다시 만든다."""
+    transaction.on_commit(lambda: _start(game_id))
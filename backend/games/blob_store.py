@@ -0,0 +1,209 @@
+import hashlib
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# MEDIA_ROOT 아래 sha256 이름으로 저장되는 원본. 게임/초안/수정요청 경로의 파일은
+# 이 원본에 대한 하드링크라서 같은 이미지는 디스크에 한 번만 저장된다.
+# 참조 수는 파일시스템 링크 수(st_nlink)이고, 1 이면 어디서도 쓰지 않는 원본이다.
+BLOB_PREFIX = "blobs/sha256/"
+BLOB_TEMP_PREFIX = "blobs/tmp/"
+
+
+def _media_path(relative_path: str) -> str:
+    return os.path.join(settings.MEDIA_ROOT, relative_path)
+
+
+def blob_path(digest: str) -> str:
+    return f"{BLOB_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+def _write_temp(chunks) -> tuple[str, str]:
+    temp_dir = _media_path(BLOB_TEMP_PREFIX)
+    os.makedirs(temp_dir, exist_ok=True)
+    temp_abs = os.path.join(temp_dir, uuid.uuid4().hex)
+    digest = hashlib.sha256()
+    with open(temp_abs, "wb") as handle:
+        for chunk in chunks:
+            digest.update(chunk)
+            handle.write(chunk)
+    return temp_abs, digest.hexdigest()
+
+
+def _adopt_temp(temp_abs: str, digest: str) -> str:
+    """임시 파일을 원본 자리에 둔다. 이미 같은 원본이 있으면 임시 파일은 버린다."""
+    blob_rel = blob_path(digest)
+    blob_abs = _media_path(blob_rel)
+    os.makedirs(os.path.dirname(blob_abs), exist_ok=True)
+    try:
+        os.link(temp_abs, blob_abs)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(temp_abs)
+    return blob_rel
+
+
+def _iter_chunks(file_obj):
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    if hasattr(file_obj, "chunks"):
+        return file_obj.chunks()
+    return iter(lambda: file_obj.read(65536), b"")
+
+
+def content_digest(file_obj) -> str:
+    """업로드 파일의 sha256. 저장하지 않고 읽기만 한다."""
+    digest = hashlib.sha256()
+    for chunk in _iter_chunks(file_obj):
+        digest.update(chunk)
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    return digest.hexdigest()
+
+
+def store_blob(file_obj) -> str:
+    """업로드 파일을 원본 저장소에 넣고 원본의 상대 경로를 돌려준다."""
+    temp_abs, digest = _write_temp(_iter_chunks(file_obj))
+    return _adopt_temp(temp_abs, digest)
+
+
+def _link_or_copy(source_abs: str, dest_abs: str) -> None:
+    try:
+        os.link(source_abs, dest_abs)
+    except FileExistsError:
+        raise
+    except OSError:
+        # 하드링크를 지원하지 않는 파일시스템이면 복사로 대신한다.
+        shutil.copy2(source_abs, dest_abs)
+
+
+def link_into(storage, source_abs: str, dest_rel: str) -> str:
+    """source_abs 를 dest_rel 이름으로 연결하고 실제 저장된 상대 경로를 돌려준다.
+
+    dest_rel 이 이미 있으면 storage 의 규칙대로 다른 이름을 고른다.
+    """
+    os.makedirs(os.path.dirname(_media_path(dest_rel)), exist_ok=True)
+    name = dest_rel
+    while True:
+        dest_abs = _media_path(name)
+        if os.path.exists(dest_abs) and os.path.samefile(source_abs, dest_abs):
+            return name
+        try:
+            _link_or_copy(source_abs, dest_abs)
+            return name
+        except FileExistsError:
+            name = storage.get_available_name(dest_rel)
+
+
+def save_file(storage, dest_rel: str, file_obj) -> str:
+    """업로드 파일을 원본 저장소에 넣고 dest_rel 에 하드링크한다."""
+    blob_rel = store_blob(file_obj)
+    return link_into(storage, _media_path(blob_rel), dest_rel)
+
+
+def adopt_file(relative_path: str) -> bool:
+    """원본 저장소 밖의 media 파일을 같은 내용의 원본에 대한 하드링크로 바꾼다.
+
+    이미 다른 곳과 링크를 공유하는 파일은 건드리지 않는다. 바꿨으면 True.
+    """
+    file_abs = _media_path(relative_path)
+    if os.stat(file_abs).st_nlink > 1:
+        return False
+    digest = hashlib.sha256()
+    with open(file_abs, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    blob_abs = _media_path(blob_path(digest.hexdigest()))
+    os.makedirs(os.path.dirname(blob_abs), exist_ok=True)
+    try:
+        # 처음 보는 내용이면 파일 자신이 원본이 된다.
+        os.link(file_abs, blob_abs)
+        return True
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    replacement = f"{file_abs}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(blob_abs, replacement)
+    except OSError:
+        return False
+    os.replace(replacement, file_abs)
+    return True
+
+
+def iter_unreferenced_blobs(older_than: float):
+    """다른 경로에서 링크하지 않는(st_nlink == 1) 원본 중 older_than 이전에 바뀐 것."""
+    root = _media_path(BLOB_PREFIX)
+    for current, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(current, filename)
+            stat = os.stat(path)
+            # 링크가 추가/삭제되면 ctime 이 바뀌므로 방금 만든 원본은 건너뛴다.
+            if stat.st_nlink == 1 and stat.st_ctime < older_than:
+                yield path, stat.st_size
+
+
+def iter_stale_temp_files(older_than: float):
+    root = _media_path(BLOB_TEMP_PREFIX)
+    if not os.path.isdir(root):
+        return
+    for filename in os.listdir(root):
+        path = os.path.join(root, filename)
+        stat = os.stat(path)
+        if stat.st_mtime < older_than:
+            yield path, stat.st_size
+
+
+class MediaMoves:
+    """트랜잭션 안에서 media 파일을 옮기고, 트랜잭션이 실패하면 제자리로 되돌린다.
+
+    옮기기는 하드링크 후 원래 이름 삭제라서 바이트를 복사하지 않고, 대상 이름이
+    이미 있으면 덮어쓰지 않고 다른 이름을 고른다.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        # 원래 경로 -> (옮긴 경로, 이번에 새로 만든 이름인지)
+        self.moved: dict[str, tuple[str, bool]] = {}
+
+    def move(self, source_rel: str, dest_rel: str) -> str:
+        """옮긴 상대 경로를 돌려준다. 원본이 없으면 source_rel 을 그대로 돌려준다."""
+        if source_rel in self.moved:
+            return self.moved[source_rel][0]
+        source_abs = _media_path(source_rel)
+        if not os.path.exists(source_abs):
+            return source_rel
+        dest_abs = _media_path(dest_rel)
+        shared = os.path.exists(dest_abs) and os.path.samefile(source_abs, dest_abs)
+        name = link_into(self.storage, source_abs, dest_rel)
+        os.unlink(source_abs)
+        self.moved[source_rel] = (name, not shared)
+        return name
+
+    @contextmanager
+    def undo_on_error(self):
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+
+    def rollback(self) -> None:
+        for source_rel, (dest_rel, created) in reversed(list(self.moved.items())):
+            source_abs = _media_path(source_rel)
+            dest_abs = _media_path(dest_rel)
+            os.makedirs(os.path.dirname(source_abs), exist_ok=True)
+            try:
+                if created:
+                    os.rename(dest_abs, source_abs)
+                else:
+                    # 원래부터 게임 경로에 있던 같은 파일이면 지우지 않고 링크만 되살린다.
+                    os.link(dest_abs, source_abs)
+            except OSError:
+                continue
+        self.moved.clear()
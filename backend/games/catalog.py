@@ -0,0 +1,70 @@
+from django.core.cache import cache
+
+from .models import Game, GameStatus, GameVisibility
+from .serializers import GameListSerializer
+
+CATALOG_VERSION_KEY = "games:catalog:version"
+CATALOG_CACHE_TIMEOUT = 60 * 60
+CATALOG_MAX_PAGE_SIZE = 100
+
+
+def get_catalog_version() -> int:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY, 1)
+    return version
+
+
+def bump_catalog_version() -> None:
+    """Game 이 바뀌면 버전을 올려 이전 버전의 캐시를 모두 무효화한다."""
+    cache.add(CATALOG_VERSION_KEY, 1, timeout=None)
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, 1, timeout=None)
+
+
+def _load_catalog(game_type: str | None) -> dict:
+    """{"games": 직렬화한 게임 목록, "keys": 같은 순서의 (created_at, id)}. 버전별로 캐시한다."""
+    version = get_catalog_version()
+    key = f"games:catalog:v{version}:{game_type or 'all'}:keyed"
+    catalog = cache.get(key)
+    if catalog is None:
+        qs = Game.objects.filter(
+            status=GameStatus.ACTIVE, visibility=GameVisibility.PUBLIC
+        ).order_by("-created_at", "-id")
+        if game_type:
+            qs = qs.filter(type=game_type)
+        games = list(qs)
+        catalog = {
+            "games": [dict(row) for row in GameListSerializer(games, many=True).data],
+            "keys": [(game.created_at, game.id) for game in games],
+        }
+        cache.set(key, catalog, timeout=CATALOG_CACHE_TIMEOUT)
+    return catalog
+
+
+def get_catalog(game_type: str | None = None) -> list[dict]:
+    """공개 + 진행중 게임 목록을 직렬화한 결과 (최신순)."""
+    return _load_catalog(game_type)["games"]
+
+
+def page_catalog(
+    game_type: str | None, cursor: list | None, limit: int
+) -> tuple[list[dict], tuple | None]:
+    """(created_at, id) 역순 keyset 으로 카탈로그를 자른다.
+
+    cursor 는 앞 페이지 마지막 게임의 (created_at, id) 이고, 그 사이 게임이 추가/삭제되어도
+    위치가 밀리지 않는다. 반환값은 (게임 목록, 다음 cursor 키 또는 None).
+    """
+    catalog = _load_catalog(game_type)
+    keys = catalog["keys"]
+    start = 0
+    if cursor:
+        cursor_key = tuple(cursor)
+        start = next((index for index, key in enumerate(keys) if key < cursor_key), len(keys))
+    end = start + limit
+    page = catalog["games"][start:end]
+    next_key = keys[end - 1] if end < len(keys) else None
+    return page, next_key
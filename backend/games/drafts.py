@@ -0,0 +1,133 @@
+import os
+import shutil
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import GameEditRequest, GameEditRequestStatus, WorldcupDraft
+
+# 마지막 저장 후 이 시간이 지난 드래프트는 만료로 보고 조회에서 뺀다.
+# 실제 삭제는 sweep_media_prefixes 커맨드가 한다.
+WORLDCUP_DRAFT_TTL = timedelta(days=1)
+
+DRAFT_ROOT = "worldcup/drafts/"
+EDIT_REQUEST_ROOT = "worldcup/edit-requests/"
+
+
+def draft_cutoff():
+    return timezone.now() - WORLDCUP_DRAFT_TTL
+
+
+def active_drafts(user):
+    return WorldcupDraft.objects.filter(user=user, updated_at__gte=draft_cutoff())
+
+
+def prefix_usage(prefix: str) -> tuple[int, int]:
+    """prefix 아래 파일 크기 합. (실제로 비워지는 bytes, 원본 저장소와 공유하는 bytes)
+
+    하드링크가 남아 있는 파일은 지워도 원본이 남으므로 gc_media_blobs 가 치워야 비워진다.
+    """
+    freed = shared = 0
+    root = os.path.join(settings.MEDIA_ROOT, prefix)
+    for current, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                stat = os.stat(os.path.join(current, filename))
+            except FileNotFoundError:
+                continue
+            if stat.st_nlink > 1:
+                shared += stat.st_size
+            else:
+                freed += stat.st_size
+    return freed, shared
+
+
+def remove_prefix(prefix: str) -> None:
+    normalized = prefix.replace("\\", "/").strip("/")
+    if not normalized or ".." in normalized.split("/"):
+        return
+    abs_path = os.path.join(settings.MEDIA_ROOT, normalized)
+    if os.path.isdir(abs_path):
+        shutil.rmtree(abs_path, ignore_errors=True)
+    # worldcup/drafts/<user>/ 처럼 비어 버린 상위 폴더도 지운다.
+    parent = os.path.dirname(abs_path)
+    try:
+        os.rmdir(parent)
+    except OSError:
+        pass
+
+
+def iter_expired_draft_chunks(chunk_size: int):
+    """만료된 드래프트를 id 순서로 [(id, prefix), ...] 묶음씩 돌려준다."""
+    cutoff = draft_cutoff()
+    last_id = 0
+    while True:
+        rows = list(
+            WorldcupDraft.objects.filter(updated_at__lt=cutoff, id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "draft_prefix")[:chunk_size]
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+
+
+def delete_expired_drafts(rows) -> list[tuple[int, str]]:
+    """rows 중 아직 만료 상태인 드래프트를 지우고, 지운 (id, prefix) 를 돌려준다."""
+    ids = [row_id for row_id, _ in rows]
+    # 조회 후 다시 저장된 드래프트는 남긴다.
+    WorldcupDraft.objects.filter(id__in=ids, updated_at__lt=draft_cutoff()).delete()
+    remaining = set(WorldcupDraft.objects.filter(id__in=ids).values_list("id", flat=True))
+    return [(row_id, prefix) for row_id, prefix in rows if row_id not in remaining]
+
+
+def _iter_leaf_prefixes(root: str, older_than: float):
+    """root/<상위 id>/<uuid>/ 형태의 폴더 중 older_than 이전에 바뀐 것."""
+    root_abs = os.path.join(settings.MEDIA_ROOT, root)
+    if not os.path.isdir(root_abs):
+        return
+    for owner in sorted(os.listdir(root_abs)):
+        owner_abs = os.path.join(root_abs, owner)
+        if not os.path.isdir(owner_abs):
+            continue
+        for name in sorted(os.listdir(owner_abs)):
+            leaf_abs = os.path.join(owner_abs, name)
+            if os.path.isdir(leaf_abs) and os.stat(leaf_abs).st_mtime < older_than:
+                yield f"{root}{owner}/{name}/"
+
+
+def _referenced_draft_prefixes(prefixes: list[str]) -> set[str]:
+    return set(
+        WorldcupDraft.objects.filter(draft_prefix__in=prefixes).values_list(
+            "draft_prefix", flat=True
+        )
+    )
+
+
+def _referenced_edit_request_prefixes(prefixes: list[str]) -> set[str]:
+    # 승인/반려된 요청의 파일은 더 이상 쓰지 않는다.
+    return set(
+        GameEditRequest.objects.filter(
+            request_prefix__in=prefixes, status=GameEditRequestStatus.PENDING
+        ).values_list("request_prefix", flat=True)
+    )
+
+
+def iter_orphan_prefix_chunks(chunk_size: int, older_than: float):
+    """DB 어디서도 쓰지 않는 드래프트/수정요청 prefix 를 묶음씩 돌려준다."""
+    for root, referenced in (
+        (DRAFT_ROOT, _referenced_draft_prefixes),
+        (EDIT_REQUEST_ROOT, _referenced_edit_request_prefixes),
+    ):
+        chunk = []
+        for prefix in _iter_leaf_prefixes(root, older_than):
+            chunk.append(prefix)
+            if len(chunk) >= chunk_size:
+                in_use = referenced(chunk)
+                yield [prefix for prefix in chunk if prefix not in in_use]
+                chunk = []
+        if chunk:
+            in_use = referenced(chunk)
+            yield [prefix for prefix in chunk if prefix not in in_use]
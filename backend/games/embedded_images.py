@@ -0,0 +1,84 @@
+import base64
+import binascii
+import hashlib
+import re
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from rest_framework.exceptions import ValidationError
+
+from .image_validation import _validate_image_bytes
+
+EMBEDDED_IMAGE_PREFIX = "psycho/assets/"
+DATA_URL_RE = re.compile(r"^data:image/(png|jpeg|jpg|gif|webp);base64,", re.IGNORECASE)
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "jpg": ".jpg", "gif": ".gif", "webp": ".webp"}
+# data URL 의 MIME 이름 → Pillow 가 읽은 실제 형식
+IMAGE_FORMATS = {"png": "PNG", "jpeg": "JPEG", "jpg": "JPEG", "gif": "GIF", "webp": "WEBP"}
+EMBEDDED_IMAGE_MAX_BYTES = 5 * 1024 * 1024
+EMBEDDED_IMAGES_MAX_TOTAL_BYTES = 20 * 1024 * 1024
+
+
+def _get_storage() -> FileSystemStorage:
+    return FileSystemStorage(location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL)
+
+
+def _decode_image(value: str, field_path: str) -> tuple[bytes, str]:
+    """data URL 을 풀어 (바이트, 확장자) 를 돌려준다. 이미지가 아니거나 너무 크면 거절한다."""
+    match = DATA_URL_RE.match(value)
+    encoded = value[match.end() :]
+    # 디코딩 전에 길이로 먼저 거른다. base64 4글자가 3바이트다.
+    if len(encoded) // 4 * 3 > EMBEDDED_IMAGE_MAX_BYTES:
+        raise ValidationError({"content": f"이미지가 너무 큽니다: {field_path}"})
+    try:
+        data = base64.b64decode(encoded, validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise ValidationError({"content": f"이미지 데이터를 읽을 수 없습니다: {field_path}"}) from exc
+    if len(data) > EMBEDDED_IMAGE_MAX_BYTES:
+        raise ValidationError({"content": f"이미지가 너무 큽니다: {field_path}"})
+    mime = match.group(1).lower()
+    try:
+        image_format = _validate_image_bytes(data, "content")
+    except ValidationError as exc:
+        raise ValidationError({"content": f"이미지 데이터를 읽을 수 없습니다: {field_path}"}) from exc
+    if image_format != IMAGE_FORMATS[mime]:
+        raise ValidationError({"content": f"이미지 형식이 MIME 타입과 다릅니다: {field_path}"})
+    return data, IMAGE_EXTENSIONS[mime]
+
+
+def extract_embedded_images(content, storage=None):
+    """JSON 안의 data:image base64 문자열을 MEDIA_ROOT 파일로 옮기고 URL 로 바꾼다.
+
+    파일명은 내용의 SHA-256 이라 같은 이미지는 한 번만 저장된다.
+    모든 이미지를 먼저 검증하고, 하나라도 거절되면 파일을 쓰지 않는다.
+    반환값은 (바뀐 content, 옮긴 이미지 수).
+    """
+    storage = storage or _get_storage()
+    pending = {}
+    extracted = 0
+    total_bytes = 0
+
+    def convert(value, field_path):
+        nonlocal extracted, total_bytes
+        if isinstance(value, dict):
+            return {key: convert(item, f"{field_path}.{key}") for key, item in value.items()}
+        if isinstance(value, list):
+            return [convert(item, f"{field_path}[{index}]") for index, item in enumerate(value)]
+        if isinstance(value, str) and DATA_URL_RE.match(value):
+            data, extension = _decode_image(value, field_path)
+            total_bytes += len(data)
+            if total_bytes > EMBEDDED_IMAGES_MAX_TOTAL_BYTES:
+                raise ValidationError({"content": "문서에 담긴 이미지가 너무 큽니다."})
+            digest = hashlib.sha256(data).hexdigest()
+            name = f"{EMBEDDED_IMAGE_PREFIX}{digest[:2]}/{digest}{extension}"
+            pending[name] = data
+            extracted += 1
+            return storage.url(name)
+        return value
+
+    content = convert(content, "content")
+    for name, data in pending.items():
+        # 같은 내용이면 같은 파일명이므로 이미 있으면 다시 쓰지 않는다.
+        if not storage.exists(name):
+            storage.save(name, ContentFile(data))
+    return content, extracted
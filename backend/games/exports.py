@@ -0,0 +1,135 @@
+import csv
+import json
+
+from rest_framework.exceptions import ValidationError
+
+from config.pagination import build_date_range_filters
+
+from .models import GameChoiceLog, GameResult, WorldcupPickLog, WorldcupPickPack
+from .pick_store import unpack
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = ("csv", "ndjson")
+
+# dataset -> (모델, 기간 필터 기준 컬럼, 내보낼 컬럼)
+EXPORT_DATASETS = {
+    "choices": (
+        GameChoiceLog,
+        "started_at",
+        ["id", "game_id", "user_id", "source", "referer_url", "started_at", "finished_at"],
+    ),
+    "picks": (
+        WorldcupPickLog,
+        "created_at",
+        [
+            "id",
+            "choice_id",
+            "game_id",
+            "step_index",
+            "left_item_id",
+            "right_item_id",
+            "selected_item_id",
+            "created_at",
+        ],
+    ),
+    "results": (
+        GameResult,
+        "created_at",
+        ["id", "choice_id", "game_id", "winner_item_id", "result_title", "result_code", "created_at"],
+    ),
+}
+
+
+def get_export_fields(dataset: str) -> list[str]:
+    if dataset not in EXPORT_DATASETS:
+        raise ValidationError({"dataset": "choices, picks, results 중 하나여야 합니다."})
+    return EXPORT_DATASETS[dataset][2]
+
+
+def _iter_chunks(queryset, fields: list[str], chunk_size: int):
+    # MySQL 클라이언트 커서는 결과 전체를 메모리에 올리므로 id 구간으로 끊어서 조회한다.
+    last_id = 0
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).order_by("id").values_list(*fields)[:chunk_size]
+        )
+        if not chunk:
+            return
+        for row in chunk:
+            yield dict(zip(fields, row))
+        last_id = chunk[-1][0]
+
+
+def _iter_packed_rows(filters: dict, chunk_size: int):
+    packs = WorldcupPickPack.objects.filter(**filters)
+    last_id = 0
+    while True:
+        chunk = list(packs.filter(id__gt=last_id).order_by("id")[:chunk_size])
+        if not chunk:
+            return
+        for pack in chunk:
+            for pick in unpack(pack):
+                yield {
+                    "id": None,
+                    "choice_id": pick.choice_id,
+                    "game_id": pick.game_id,
+                    "step_index": pick.step_index,
+                    "left_item_id": pick.left_item_id,
+                    "right_item_id": pick.right_item_id,
+                    "selected_item_id": pick.selected_item_id,
+                    "created_at": pick.created_at,
+                }
+        last_id = chunk[-1].id
+
+
+def iter_export_rows(dataset: str, filters: dict, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """dataset 의 행을 dict 로 하나씩 돌려준다. filters 는 game_id / 기간 ORM 필터."""
+    model, _, fields = EXPORT_DATASETS[dataset]
+    yield from _iter_chunks(model.objects.filter(**filters), fields, chunk_size)
+    if dataset == "picks":
+        yield from _iter_packed_rows(filters, chunk_size)
+
+
+def build_export_filters(
+    dataset: str, game_id: int | None, date_from: str | None, date_to: str | None
+) -> dict:
+    _, time_field, _ = EXPORT_DATASETS[dataset]
+    filters = build_date_range_filters(date_from, date_to, time_field)
+    if game_id is not None:
+        filters["game_id"] = game_id
+    return filters
+
+
+def _format_value(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 버퍼."""
+
+    def write(self, value):
+        return value
+
+
+def render_csv(rows, fields: list[str]):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(
+            ["" if row[field] is None else _format_value(row[field]) for field in fields]
+        )
+
+
+def render_ndjson(rows, fields: list[str]):
+    for row in rows:
+        yield json.dumps(
+            {field: _format_value(row[field]) for field in fields}, ensure_ascii=False
+        ) + "\n"
+
+
+def render_export(rows, fields: list[str], export_format: str):
+    if export_format == "ndjson":
+        return render_ndjson(rows, fields)
+    return render_csv(rows, fields)
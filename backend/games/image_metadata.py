@@ -0,0 +1,107 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.utils import timezone
+from PIL import Image
+
+from .models import ImageMetadata
+
+PATH_MAX_LENGTH = ImageMetadata._meta.get_field("path").max_length
+
+
+def _media_path(relative_path: str) -> str:
+    return os.path.join(settings.MEDIA_ROOT, relative_path)
+
+
+def file_digest(abs_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(abs_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_current(metadata: ImageMetadata, stat: os.stat_result) -> bool:
+    return metadata.byte_size == stat.st_size and metadata.mtime_ns == stat.st_mtime_ns
+
+
+def lookup_many(relative_paths) -> dict[str, ImageMetadata]:
+    """경로별 색인을 한 번의 쿼리로 가져온다."""
+    relative_paths = set(relative_paths)
+    if not relative_paths:
+        return {}
+    return {
+        metadata.path: metadata
+        for metadata in ImageMetadata.objects.filter(path__in=relative_paths)
+    }
+
+
+def verify_media_image(relative_path: str, known: dict[str, ImageMetadata] | None = None) -> bool:
+    """media 파일이 이미지인지 확인한다. 파일이 없거나 이미지가 아니면 False.
+
+    크기/mtime 이 색인과 같으면 파일을 열지 않고, 새 경로라도 같은 내용(sha256)이
+    이미 검증된 적 있으면 Pillow 로 다시 열지 않는다.
+    """
+    abs_path = _media_path(relative_path)
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        return False
+    if known is None:
+        known = lookup_many([relative_path])
+    metadata = known.get(relative_path)
+    if metadata is not None and _is_current(metadata, stat):
+        return True
+
+    content_hash = file_digest(abs_path)
+    same_content = (
+        ImageMetadata.objects.filter(content_hash=content_hash)
+        .only("format", "width", "height")
+        .first()
+    )
+    if same_content is not None:
+        image_format = same_content.format
+        width, height = same_content.width, same_content.height
+    else:
+        try:
+            with Image.open(abs_path) as image:
+                image_format = image.format or ""
+                width, height = image.size
+                image.verify()
+        except Exception:  # noqa: BLE001 - 이미지 파싱 실패는 검증 실패로 처리
+            return False
+
+    if len(relative_path) > PATH_MAX_LENGTH:
+        return True
+    ImageMetadata.objects.update_or_create(
+        path=relative_path,
+        defaults={
+            "content_hash": content_hash,
+            "format": image_format,
+            "width": width,
+            "height": height,
+            "byte_size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "validated_at": timezone.now(),
+        },
+    )
+    return True
+
+
+def prune_missing_metadata(batch_size: int = 500) -> int:
+    """파일이 사라진 경로의 색인을 지우고 지운 개수를 돌려준다."""
+    removed = 0
+    last_id = 0
+    while True:
+        rows = list(
+            ImageMetadata.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "path")[:batch_size]
+        )
+        if not rows:
+            return removed
+        last_id = rows[-1][0]
+        missing = [row_id for row_id, path in rows if not os.path.exists(_media_path(path))]
+        if missing:
+            removed += ImageMetadata.objects.filter(id__in=missing).delete()[0]
@@ -1,15 +1,27 @@
 import base64
 import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from io import BytesIO
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import urljoin, urlparse
 
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
 from PIL import Image
 
+from .image_metadata import lookup_many, verify_media_image
+
 MAX_REMOTE_IMAGE_BYTES = 5 * 1024 * 1024
 REMOTE_IMAGE_TIMEOUT_SECONDS = 5
+# 배치 검증 전체에 주는 시간. 이 안에 끝나지 않은 URL 은 실패로 처리한다.
+REMOTE_IMAGE_BATCH_DEADLINE_SECONDS = 15
+REMOTE_IMAGE_MAX_WORKERS = 8
+REMOTE_IMAGE_CONNECTIONS_PER_HOST = 4
+REMOTE_IMAGE_MAX_REDIRECTS = 3
+REMOTE_IMAGE_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "image/*"}
+REMOTE_IMAGE_ERROR = "이미지 URL을 불러올 수 없습니다."
 
 
 def _read_limited(response, max_bytes: int, field_name: str) -> bytes:
@@ -24,10 +36,12 @@ def _read_limited(response, max_bytes: int, field_name: str) -> bytes:
     return bytes(data)
 
 
-def _validate_image_bytes(data: bytes, field_name: str) -> None:
+def _validate_image_bytes(data: bytes, field_name: str) -> str | None:
+    """이미지가 아니면 ValidationError. Pillow 가 읽은 형식 이름(PNG, JPEG ...)을 돌려준다."""
     try:
         with Image.open(BytesIO(data)) as image:
             image.verify()
+            return image.format
     except Exception as exc:  # noqa: BLE001
         raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."}) from exc
 
@@ -47,43 +61,186 @@ def validate_image_file(file_obj, field_name: str) -> None:
             pass
 
 
-def validate_image_url(image_url: str, field_name: str) -> None:
-    if not image_url:
-        return
-    value = str(image_url).strip()
+def _media_relative_path(value: str) -> str | None:
+    parsed = urlparse(value)
+    path = parsed.path if parsed.scheme else value
+    if path.startswith(settings.MEDIA_URL):
+        relative_path = path[len(settings.MEDIA_URL) :]
+        if ".." not in relative_path.split("/"):
+            return relative_path
+    return None
+
+
+def _validate_local_image(value: str, field_name: str, known=None) -> bool:
+    """원격 요청 없이 검증할 수 있으면 검증하고 True, 원격 URL 이면 False."""
     if value.startswith("data:image/"):
         try:
             header, encoded = value.split(",", 1)
             data = base64.b64decode(encoded, validate=True)
         except Exception as exc:  # noqa: BLE001
-            raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."}) from exc
+            raise ValidationError({field_name: REMOTE_IMAGE_ERROR}) from exc
         _validate_image_bytes(data, field_name)
-        return
+        return True
+    relative_path = _media_relative_path(value)
+    if relative_path is not None:
+        if not os.path.exists(os.path.join(settings.MEDIA_ROOT, relative_path)):
+            raise ValidationError({field_name: REMOTE_IMAGE_ERROR})
+        if not verify_media_image(relative_path, known):
+            raise ValidationError({field_name: "이미지 파일을 확인할 수 없습니다."})
+        return True
     parsed = urlparse(value)
-    path = parsed.path if parsed.scheme else value
-    if path.startswith(settings.MEDIA_URL):
-        relative_path = path[len(settings.MEDIA_URL) :]
-        file_path = os.path.join(settings.MEDIA_ROOT, relative_path)
-        if not os.path.exists(file_path):
-            raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."})
-        try:
-            with Image.open(file_path) as image:
-                image.verify()
-        except Exception as exc:  # noqa: BLE001
-            raise ValidationError({field_name: "이미지 파일을 확인할 수 없습니다."}) from exc
-        return
     if value.startswith("/"):
-        raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."})
-    if parsed.scheme in ("http", "https"):
+        raise ValidationError({field_name: REMOTE_IMAGE_ERROR})
+    if parsed.scheme in ("http", "https") and parsed.hostname:
+        return False
+    raise ValidationError({field_name: REMOTE_IMAGE_ERROR})
+
+
+class _HostConnection:
+    """호스트 하나에 대한 keep-alive 연결. 한 스레드에서만 사용한다."""
+
+    def __init__(self, scheme: str, netloc: str):
+        self.connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        self.netloc = netloc
+        self.connection = None
+
+    def request(self, target: str, timeout: float):
+        reused = self.connection is not None
+        if not reused:
+            self.connection = self.connection_class(self.netloc, timeout=timeout)
+        elif self.connection.sock is not None:
+            self.connection.sock.settimeout(timeout)
         try:
-            request = Request(
-                value,
-                headers={"User-Agent": "Mozilla/5.0", "Accept": "image/*"},
-            )
-            with urlopen(request, timeout=REMOTE_IMAGE_TIMEOUT_SECONDS) as response:
-                data = _read_limited(response, MAX_REMOTE_IMAGE_BYTES, field_name)
-        except Exception as exc:  # noqa: BLE001
-            raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."}) from exc
-        _validate_image_bytes(data, field_name)
-        return
-    raise ValidationError({field_name: "이미지 URL을 불러올 수 없습니다."})
+            self.connection.request("GET", target, headers=REMOTE_IMAGE_HEADERS)
+            return self.connection.getresponse()
+        except (HTTPException, ConnectionError):
+            self.close()
+            if not reused:
+                raise
+        # 서버가 keep-alive 연결을 먼저 닫았으면 새 연결로 한 번만 다시 시도한다.
+        self.connection = self.connection_class(self.netloc, timeout=timeout)
+        self.connection.request("GET", target, headers=REMOTE_IMAGE_HEADERS)
+        return self.connection.getresponse()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def _fetch_remote_image(connections: dict, url: str, deadline: float, field_name: str) -> bytes:
+    for _ in range(REMOTE_IMAGE_MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        remaining = deadline - time.monotonic()
+        if parsed.scheme not in ("http", "https") or not parsed.hostname or remaining <= 0:
+            break
+        key = (parsed.scheme, parsed.netloc.lower())
+        connection = connections.get(key)
+        if connection is None:
+            connection = connections[key] = _HostConnection(parsed.scheme, parsed.netloc)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        response = connection.request(target, min(REMOTE_IMAGE_TIMEOUT_SECONDS, remaining))
+        if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+            location = response.getheader("Location")
+            connection.close()
+            url = urljoin(url, location)
+            continue
+        if response.status != 200:
+            connection.close()
+            break
+        try:
+            return _read_limited(response, MAX_REMOTE_IMAGE_BYTES, field_name)
+        except ValidationError:
+            connection.close()
+            raise
+        finally:
+            if response.will_close:
+                connection.close()
+    raise ValidationError({field_name: REMOTE_IMAGE_ERROR})
+
+
+def _validate_lane(lane: list[tuple[str, str]], deadline: float, outcomes: dict) -> None:
+    """같은 호스트의 URL 들을 연결 하나로 차례대로 검증한다."""
+    connections = {}
+    try:
+        for field_name, url in lane:
+            try:
+                data = _fetch_remote_image(connections, url, deadline, field_name)
+                _validate_image_bytes(data, field_name)
+            except ValidationError as exc:
+                outcomes[field_name] = exc.detail[field_name]
+            except Exception:  # noqa: BLE001 - 네트워크 오류는 검증 에러로 처리
+                outcomes[field_name] = REMOTE_IMAGE_ERROR
+            else:
+                outcomes[field_name] = None
+    finally:
+        for connection in connections.values():
+            connection.close()
+
+
+def _validate_remote_images(entries: list[tuple[str, str]]) -> dict:
+    deadline = time.monotonic() + REMOTE_IMAGE_BATCH_DEADLINE_SECONDS
+    by_host = defaultdict(list)
+    for field_name, url in entries:
+        by_host[urlparse(url).netloc.lower()].append((field_name, url))
+    lanes = []
+    for host_entries in by_host.values():
+        lane_count = min(REMOTE_IMAGE_CONNECTIONS_PER_HOST, len(host_entries))
+        lanes.extend(host_entries[offset::lane_count] for offset in range(lane_count))
+
+    outcomes = {}
+    if len(lanes) == 1:
+        _validate_lane(lanes[0], deadline, outcomes)
+    else:
+        executor = ThreadPoolExecutor(max_workers=min(REMOTE_IMAGE_MAX_WORKERS, len(lanes)))
+        futures = [executor.submit(_validate_lane, lane, deadline, outcomes) for lane in lanes]
+        # 소켓 타임아웃이 남은 시간으로 잘리므로 조금만 더 기다린다.
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()) + 1)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    errors = {}
+    for field_name, _ in entries:
+        message = outcomes.get(field_name, REMOTE_IMAGE_ERROR)
+        if message is not None:
+            errors[field_name] = message
+    return errors
+
+
+def validate_image_urls(image_urls: dict[str, str]) -> None:
+    """{필드명: URL} 을 한 번에 검증한다.
+
+    원격 URL 은 호스트별 keep-alive 연결로 병렬 요청하고, 실패한 필드를 모두 모아
+    validate_image_url 과 같은 {필드명: 메시지} 형태의 ValidationError 로 올린다.
+    """
+    errors = {}
+    remote = []
+    values = {
+        field_name: str(image_url).strip()
+        for field_name, image_url in image_urls.items()
+        if image_url
+    }
+    # 이미 검증한 media 파일은 색인 조회 한 번으로 끝낸다.
+    known = lookup_many(
+        relative_path
+        for relative_path in map(_media_relative_path, values.values())
+        if relative_path is not None
+    )
+    for field_name, value in values.items():
+        try:
+            if _validate_local_image(value, field_name, known):
+                continue
+        except ValidationError as exc:
+            errors.update(exc.detail)
+            continue
+        remote.append((field_name, value))
+    if remote:
+        errors.update(_validate_remote_images(remote))
+    if errors:
+        ordered = {field_name: errors[field_name] for field_name in image_urls if field_name in errors}
+        raise ValidationError(ordered)
+
+
+def validate_image_url(image_url: str, field_name: str) -> None:
+    validate_image_urls({field_name: image_url})
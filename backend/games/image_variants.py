@@ -0,0 +1,275 @@
+import base64
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from . import blob_store
+from .image_metadata import file_digest
+from .models import Banner, Game, GameItem
+
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = (160, 480, 960)
+VARIANT_QUALITY = 80
+VARIANT_DIR = "_variants"
+VARIANT_DIGEST_LENGTH = 12
+VARIANT_MAX_WORKERS = 4
+VARIANT_BATCH_SIZE = 200
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+
+# describe_image 결과 키 -> 모델 필드
+ITEM_IMAGE_FIELDS = {
+    "variants": "image_variants",
+    "width": "image_width",
+    "height": "image_height",
+    "placeholder": "image_placeholder",
+}
+BANNER_IMAGE_FIELDS = {"variants": "image_variants"}
+GAME_THUMBNAIL_FIELDS = {
+    "width": "thumbnail_width",
+    "height": "thumbnail_height",
+    "placeholder": "thumbnail_placeholder",
+}
+
+_lock = threading.Lock()
+_running: set[tuple] = set()
+_pending: dict[tuple, dict] = {}
+
+
+def _empty_info() -> dict:
+    return {"variants": {}, "width": None, "height": None, "placeholder": ""}
+
+
+def media_relative_path(url: str) -> str | None:
+    """/media/ 아래 로컬 파일이면 MEDIA_ROOT 기준 상대 경로, 아니면 None."""
+    if not url:
+        return None
+    path = urlparse(url).path
+    if not path.startswith(settings.MEDIA_URL):
+        return None
+    relative_path = path[len(settings.MEDIA_URL) :]
+    if ".." in relative_path.split("/"):
+        return None
+    return relative_path
+
+
+def variant_path(relative_path: str, width: int, digest: str) -> str:
+    """원본 내용 해시를 이름에 넣어 cat.jpg / cat.png 나 같은 이름으로 바뀐 원본이 섞이지 않게 한다."""
+    directory, filename = os.path.split(relative_path)
+    stem = os.path.splitext(filename)[0]
+    short_digest = digest[:VARIANT_DIGEST_LENGTH]
+    return f"{directory}/{VARIANT_DIR}/{stem}-{short_digest}-{width}w.webp".lstrip("/")
+
+
+def _encode_variant(image: Image.Image, width: int) -> bytes:
+    height = max(1, round(image.height * width / image.width))
+    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    # exif 를 넘기지 않으므로 위치 정보 등 메타데이터는 남지 않는다.
+    resized.save(buffer, "WEBP", quality=VARIANT_QUALITY, method=4, exif=b"")
+    return buffer.getvalue()
+
+
+def _encode_placeholder(image: Image.Image) -> str:
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH * 4), Image.Resampling.BILINEAR)
+    buffer = BytesIO()
+    small.save(buffer, "WEBP", quality=PLACEHOLDER_QUALITY)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def describe_image(url: str, force: bool = False, widths=VARIANT_WIDTHS) -> dict:
+    """원본 크기, 16px 미리보기, 폭 단계별 WebP 를 한 번 열어서 만든다.
+
+    로컬 이미지가 아니면(외부 URL, 동영상 등) 빈 값들을 돌려준다.
+    """
+    info = _empty_info()
+    relative_path = media_relative_path(url)
+    if not relative_path:
+        return info
+    source_abs = os.path.join(settings.MEDIA_ROOT, relative_path)
+    if not os.path.isfile(source_abs):
+        return info
+    storage = FileSystemStorage(location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL)
+    try:
+        with Image.open(source_abs) as opened:
+            image = ImageOps.exif_transpose(opened)
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+            info["width"], info["height"] = image.size
+            info["placeholder"] = _encode_placeholder(image)
+            targets = [width for width in widths if width < image.width]
+            if widths and image.width <= widths[-1]:
+                # 원본이 가장 큰 단계보다 작으면 원본 폭 WebP 가 srcset 의 최대 후보가 된다.
+                targets.append(image.width)
+            digest = file_digest(source_abs) if targets else ""
+            for width in targets:
+                dest_rel = variant_path(relative_path, width, digest)
+                dest_abs = os.path.join(settings.MEDIA_ROOT, dest_rel)
+                if force and os.path.exists(dest_abs):
+                    os.unlink(dest_abs)
+                if not os.path.exists(dest_abs):
+                    dest_rel = blob_store.save_file(
+                        storage, dest_rel, ContentFile(_encode_variant(image, width))
+                    )
+                info["variants"][str(width)] = storage.url(dest_rel)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning("이미지 변환 실패: %s", relative_path, exc_info=True)
+        return _empty_info()
+    return info
+
+
+def refresh_variants(objects, url_field: str, fields: dict, force: bool = False) -> list:
+    """objects 의 이미지 정보 필드를 채우고 바뀐 객체 목록을 돌려준다 (저장은 호출한 쪽에서)."""
+    objects = list(objects)
+    if not objects:
+        return []
+    widths = VARIANT_WIDTHS if "variants" in fields else ()
+    with ThreadPoolExecutor(max_workers=min(VARIANT_MAX_WORKERS, len(objects))) as executor:
+        results = list(
+            executor.map(
+                lambda obj: describe_image(getattr(obj, url_field), force, widths), objects
+            )
+        )
+    changed = []
+    for obj, info in zip(objects, results):
+        dirty = False
+        for key, field in fields.items():
+            if getattr(obj, field) != info[key]:
+                setattr(obj, field, info[key])
+                dirty = True
+        if dirty:
+            changed.append(obj)
+    return changed
+
+
+def refresh_item_variants(items, force: bool = False) -> int:
+    changed = refresh_variants(items, "file_name", ITEM_IMAGE_FIELDS, force)
+    if changed:
+        GameItem.objects.bulk_update(changed, list(ITEM_IMAGE_FIELDS.values()))
+    return len(changed)
+
+
+def refresh_banner_variants(banners, force: bool = False) -> int:
+    changed = refresh_variants(banners, "image_url", BANNER_IMAGE_FIELDS, force)
+    if changed:
+        Banner.objects.bulk_update(changed, list(BANNER_IMAGE_FIELDS.values()))
+    return len(changed)
+
+
+def refresh_game_thumbnail(game: Game, force: bool = False) -> bool:
+    """썸네일 크기/미리보기를 갱신한다. save 로 저장해 카탈로그 캐시도 무효화된다."""
+    if not refresh_variants([game], "thumbnail_image_url", GAME_THUMBNAIL_FIELDS, force):
+        return False
+    game.save(update_fields=list(GAME_THUMBNAIL_FIELDS.values()))
+    return True
+
+
+def clear_image_fields(obj, fields: dict) -> list[str]:
+    """원본이 바뀐 객체의 이미지 정보를 비우고 비운 필드 이름을 돌려준다 (저장은 호출한 쪽에서).
+
+    새 정보가 만들어지기 전까지 화면은 원본 URL 만 쓴다.
+    """
+    empty = _empty_info()
+    for key, field in fields.items():
+        setattr(obj, field, empty[key])
+    return list(fields.values())
+
+
+def _refresh_game_images(game_id: int, job: dict) -> None:
+    if job["all_items"] or job["item_ids"]:
+        items = GameItem.objects.filter(game_id=game_id)
+        if not job["all_items"]:
+            items = items.filter(id__in=job["item_ids"])
+        last_id = 0
+        while True:
+            batch = list(items.filter(id__gt=last_id).order_by("id")[:VARIANT_BATCH_SIZE])
+            if not batch:
+                break
+            refresh_item_variants(batch)
+            last_id = batch[-1].id
+    if job["thumbnail"]:
+        game = Game.objects.filter(pk=game_id).first()
+        if game is not None:
+            refresh_game_thumbnail(game)
+    # atlas 가 이 모듈을 불러오므로 여기서 불러온다. 160px 변환본이 생겼으니 아틀라스도 다시 만든다.
+    from .atlas import schedule_atlas_build
+
+    schedule_atlas_build(game_id)
+
+
+def _merge_jobs(previous: dict | None, job: dict) -> dict:
+    if previous is None or "all_items" not in job:
+        return job
+    return {
+        "all_items": previous["all_items"] or job["all_items"],
+        "item_ids": previous["item_ids"] | job["item_ids"],
+        "thumbnail": previous["thumbnail"] or job["thumbnail"],
+    }
+
+
+def _run(key: tuple, job: dict) -> None:
+    kind, object_id = key
+    while True:
+        try:
+            if kind == "banner":
+                refresh_banner_variants(Banner.objects.filter(pk=object_id))
+            else:
+                _refresh_game_images(object_id, job)
+        except Exception:  # noqa: BLE001 - 백그라운드 실패는 요청에 영향을 주지 않는다
+            logger.exception("이미지 변환 실패: %s=%s", kind, object_id)
+        with _lock:
+            job = _pending.pop(key, None)
+            if job is None:
+                _running.discard(key)
+                return
+
+
+def _run_in_thread(key: tuple, job: dict) -> None:
+    try:
+        _run(key, job)
+    finally:
+        # 스레드마다 DB 연결이 따로 열리므로 끝나면 닫는다.
+        connection.close()
+
+
+def _start(key: tuple, job: dict) -> None:
+    with _lock:
+        if key in _running:
+            # 변환 중에 또 바뀌었으면 끝난 뒤 모아서 한 번 더 처리한다.
+            _pending[key] = _merge_jobs(_pending.get(key), job)
+            return
+        _running.add(key)
+    if not getattr(settings, "GAME_IMAGE_VARIANTS_BACKGROUND", True):
+        _run(key, job)
+        return
+    threading.Thread(target=_run_in_thread, args=(key, job), daemon=True).start()
+
+
+def schedule_game_images(game_id: int, item_ids=None, thumbnail: bool = False) -> None:
+    """커밋 뒤 백그라운드 스레드에서 아이템(과 썸네일)의 이미지 정보를 만들고 아틀라스를 다시 만든다.
+
+    item_ids 가 None 이면 게임의 모든 아이템을 처리한다.
+    """
+    job = {
+        "all_items": item_ids is None,
+        "item_ids": set(item_ids or ()),
+        "thumbnail": thumbnail,
+    }
+    transaction.on_commit(lambda: _start(("game", game_id), job))
+
+
+def schedule_banner_variants(banner_id: int) -> None:
+    """커밋 뒤 백그라운드 스레드에서 배너의 WebP 변환본을 만든다."""
+    transaction.on_commit(lambda: _start(("banner", banner_id), {}))
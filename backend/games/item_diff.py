@@ -0,0 +1,109 @@
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .image_variants import ITEM_IMAGE_FIELDS, clear_image_fields
+from .models import GameItem, GameItemSourceType
+
+ITEM_DIFF_FIELDS = ("name", "file_name", "sort_order")
+
+
+class ItemDiff:
+    """payload 아이템 목록과 게임의 기존 아이템 사이의 생성/수정/삭제 집합."""
+
+    def __init__(self):
+        self.to_create: list[GameItem] = []
+        self.to_update: list[GameItem] = []
+        self.to_delete: list[int] = []
+        self.update_fields: set[str] = set()
+        self.unchanged = 0
+
+    def summary(self) -> dict:
+        return {
+            "created": len(self.to_create),
+            "updated": len(self.to_update),
+            "deleted": len(self.to_delete),
+            "unchanged": self.unchanged,
+            "updated_fields": sorted(self.update_fields),
+        }
+
+
+def _parse_item_id(value) -> int | None:
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_sort_order(value) -> int:
+    try:
+        return int(value) if value is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def diff_items(game, payload_items, normalize_url, uploaded_by=None) -> ItemDiff:
+    """payload_items 를 기존 아이템과 비교한다.
+
+    normalize_url(image_url) 은 저장할 file_name 을 돌려준다 (파일 이동/복사 포함).
+    payload 에 없는 기존 아이템은 삭제 대상이다.
+    """
+    existing = {item.id: item for item in game.items.all()}
+    diff = ItemDiff()
+    changed_ids = set()
+    seen_ids = set()
+    for item_data in payload_items:
+        item_id = _parse_item_id(item_data.get("id"))
+        name = (item_data.get("name") or "").strip()
+        image_url = item_data.get("image_url")
+        sort_order = _parse_sort_order(item_data.get("sort_order"))
+        item = existing.get(item_id) if item_id is not None else None
+        if item is None:
+            if not image_url:
+                raise ValidationError({"items": "새 아이템에는 이미지가 필요합니다."})
+            diff.to_create.append(
+                GameItem(
+                    game=game,
+                    name=name,
+                    file_name=normalize_url(image_url),
+                    sort_order=sort_order,
+                    uploaded_by=uploaded_by,
+                    source_type=GameItemSourceType.USER_UPLOAD,
+                )
+            )
+            continue
+        seen_ids.add(item.id)
+        values = {"name": name, "sort_order": sort_order}
+        if image_url:
+            values["file_name"] = normalize_url(image_url)
+        for field, value in values.items():
+            if getattr(item, field) != value:
+                setattr(item, field, value)
+                diff.update_fields.add(field)
+                changed_ids.add(item.id)
+                if field == "file_name":
+                    # 이전 이미지의 변환본이 새 이미지로 보이지 않도록 비운다.
+                    clear_image_fields(item, ITEM_IMAGE_FIELDS)
+
+    now = timezone.now()
+    for item_id, item in existing.items():
+        if item_id not in seen_ids:
+            diff.to_delete.append(item_id)
+        elif item_id in changed_ids:
+            item.updated_at = now
+            diff.to_update.append(item)
+        else:
+            diff.unchanged += 1
+    return diff
+
+
+def apply_item_diff(diff: ItemDiff, batch_size: int = 500) -> None:
+    """bulk_create / bulk_update / 한 번의 delete 로 반영한다. 트랜잭션은 호출한 쪽에서."""
+    if diff.to_delete:
+        GameItem.objects.filter(id__in=diff.to_delete).delete()
+    if diff.to_update:
+        fields = [field for field in ITEM_DIFF_FIELDS if field in diff.update_fields]
+        if "file_name" in diff.update_fields:
+            fields.extend(ITEM_IMAGE_FIELDS.values())
+        GameItem.objects.bulk_update(diff.to_update, [*fields, "updated_at"], batch_size=batch_size)
+    if diff.to_create:
+        GameItem.objects.bulk_create(diff.to_create, batch_size=batch_size)
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from rest_framework.renderers import JSONRenderer
+
+from config.response import api_response
+
+
+def _max_entries() -> int:
+    return getattr(settings, "GAME_JSON_CACHE_SIZE", 64)
+
+
+class _CachedDocument:
+    def __init__(self, stamp: tuple, content):
+        self.stamp = stamp
+        self.content = content
+        # api 이름별로 응답 본문을 한 번만 렌더링해 둔다.
+        self.bodies: dict[str, tuple[bytes, str]] = {}
+
+
+_documents: "OrderedDict[str, _CachedDocument]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _file_stamp(abs_path: str) -> tuple:
+    stat = os.stat(abs_path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def load_json_document(abs_path: str) -> _CachedDocument:
+    """파싱한 JSON 을 LRU 로 캐시한다. 파일의 mtime/크기가 바뀌면 다시 읽는다."""
+    stamp = _file_stamp(abs_path)
+    with _lock:
+        document = _documents.get(abs_path)
+        if document is not None and document.stamp == stamp:
+            _documents.move_to_end(abs_path)
+            return document
+    with open(abs_path, "r", encoding="utf-8") as handle:
+        document = _CachedDocument(stamp, json.load(handle))
+    with _lock:
+        _documents[abs_path] = document
+        _documents.move_to_end(abs_path)
+        while len(_documents) > _max_entries():
+            _documents.popitem(last=False)
+    return document
+
+
+def invalidate_json_document(abs_path: str) -> None:
+    with _lock:
+        _documents.pop(abs_path, None)
+
+
+def clear_json_documents() -> None:
+    with _lock:
+        _documents.clear()
+
+
+def _render_body(document: _CachedDocument, api_name: str, normalized: str) -> tuple[bytes, str]:
+    body = document.bodies.get(api_name)
+    if body is None:
+        envelope = api_response(
+            data={"path": normalized, "content": document.content}, api=api_name
+        ).data
+        rendered = JSONRenderer().render(envelope)
+        etag = f'"{hashlib.sha256(rendered).hexdigest()[:32]}"'
+        body = (rendered, etag)
+        document.bodies[api_name] = body
+    return body
+
+
+def json_document_response(
+    request, abs_path: str, normalized: str, api_name: str, cache_control: str = "no-cache"
+) -> HttpResponse:
+    """미리 렌더링한 응답을 돌려주고, If-None-Match 가 맞으면 304 로 본문을 생략한다."""
+    document = load_json_document(abs_path)
+    rendered, etag = _render_body(document, api_name, normalized)
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        tags = parse_etags(if_none_match)
+        if "*" in tags or etag in (tag.removeprefix("W/") for tag in tags):
+            response = HttpResponse(status=304)
+            response["ETag"] = etag
+            response["Cache-Control"] = cache_control
+            return response
+    response = HttpResponse(rendered, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = cache_control
+    return response
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from games.atlas import build_game_atlas
+from games.models import Game, GameType
+
+
+class Command(BaseCommand):
+    help = "월드컵 게임의 아이템 썸네일 아틀라스(스프라이트 시트)를 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument("--force", action="store_true", help="바뀐 게 없어도 다시 생성")
+
+    def handle(self, *args, **options):
+        games = Game.objects.filter(type=GameType.WORLD_CUP).order_by("id")
+        if options.get("game_id"):
+            games = games.filter(pk=options["game_id"])
+        for game in games.iterator():
+            manifest = build_game_atlas(game, force=options["force"])
+            self.stdout.write(
+                f"game {game.id}: 시트 {len(manifest.get('sheets', []))}장, "
+                f"아이템 {len(manifest.get('items', {}))}개"
+            )
+        self.stdout.write(self.style.SUCCESS("완료"))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from games.image_variants import (
+    refresh_banner_variants,
+    refresh_game_thumbnail,
+    refresh_item_variants,
+)
+from games.models import Banner, Game, GameItem
+
+
+class Command(BaseCommand):
+    help = (
+        "아이템/배너 이미지의 WebP 리사이즈 버전(160/480/960)과 "
+        "아이템/썸네일의 크기, 미리보기를 만듭니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임의 아이템만 처리")
+        parser.add_argument("--force", action="store_true", help="이미 있는 파일도 다시 생성")
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        force = options["force"]
+        batch_size = max(1, options["batch_size"])
+        items = GameItem.objects.order_by("id")
+        if options.get("game_id"):
+            items = items.filter(game_id=options["game_id"])
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(items.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            updated += refresh_item_variants(batch, force)
+            last_id = batch[-1].id
+        self.stdout.write(f"아이템 {updated}개 갱신")
+
+        games = Game.objects.order_by("id")
+        if options.get("game_id"):
+            games = games.filter(pk=options["game_id"])
+        thumbnails = sum(refresh_game_thumbnail(game, force) for game in games.iterator())
+        self.stdout.write(f"썸네일 {thumbnails}개 갱신")
+
+        if not options.get("game_id"):
+            banners = refresh_banner_variants(Banner.objects.all(), force)
+            self.stdout.write(f"배너 {banners}개 갱신")
+        self.stdout.write(self.style.SUCCESS("완료"))
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from games.exports import (
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    build_export_filters,
+    iter_export_rows,
+    render_export,
+)
+
+
+class Command(BaseCommand):
+    help = "GameChoiceLog / WorldcupPickLog / GameResult 를 CSV 또는 NDJSON 으로 스트리밍 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=sorted(EXPORT_DATASETS))
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--game-id", type=int, help="특정 게임만 내보내기")
+        parser.add_argument("--date-from", help="시작 시각/날짜 (ISO 형식)")
+        parser.add_argument("--date-to", help="종료 시각/날짜 (ISO 형식, 날짜만 주면 그날 끝까지)")
+        parser.add_argument("--output", help="저장할 파일 경로 (기본: 표준 출력)")
+
+    def handle(self, *args, **options):
+        dataset = options["dataset"]
+        try:
+            filters = build_export_filters(
+                dataset,
+                options.get("game_id"),
+                options.get("date_from"),
+                options.get("date_to"),
+            )
+        except ValidationError as exc:
+            raise CommandError(str(exc.detail)) from exc
+        fields = EXPORT_DATASETS[dataset][2]
+        chunks = render_export(iter_export_rows(dataset, filters), fields, options["format"])
+
+        output = options.get("output")
+        if not output:
+            for chunk in chunks:
+                # 청크에 이미 줄바꿈이 들어 있으므로 ending 을 붙이지 않는다.
+                self.stdout.write(chunk, ending="")
+            return
+        written = 0
+        with open(output, "w", encoding="utf-8", newline="") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+                written += 1
+        self.stderr.write(self.style.SUCCESS(f"{output} 저장 완료 ({written}줄)"))
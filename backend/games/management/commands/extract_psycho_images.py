@@ -0,0 +1,63 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from games.embedded_images import extract_embedded_images
+from games.views import FRONTEND_JSON_BASE_DIR, JSON_BASE_DIR
+
+
+class Command(BaseCommand):
+    help = "psycho JSON 에 박혀 있는 base64 이미지를 MEDIA_ROOT 파일로 옮기고 URL 로 바꿉니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="변환할 JSON 파일 경로 (기본: frontend/src/utils/psycho, data/json/psycho 의 모든 파일)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="파일을 바꾸지 않고 변환 대상만 보고",
+        )
+
+    def _default_paths(self) -> list[str]:
+        paths = []
+        for base_dir in (FRONTEND_JSON_BASE_DIR, JSON_BASE_DIR):
+            psycho_dir = os.path.join(base_dir, "psycho")
+            if not os.path.isdir(psycho_dir):
+                continue
+            for filename in sorted(os.listdir(psycho_dir)):
+                if filename.endswith(".json"):
+                    paths.append(os.path.join(psycho_dir, filename))
+        return paths
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or self._default_paths()
+        dry_run = options["dry_run"]
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as handle:
+                raw = handle.read()
+            if "data:image/" not in raw:
+                continue
+            if dry_run:
+                self.stdout.write(f"{path}: {raw.count('data:image/')}개 이미지 ({len(raw)} bytes)")
+                continue
+            try:
+                content, extracted = extract_embedded_images(json.loads(raw))
+            except (json.JSONDecodeError, ValidationError) as exc:
+                raise CommandError(f"{path}: {exc}") from exc
+            if not extracted:
+                continue
+            output = json.dumps(content, ensure_ascii=False, indent=2)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                handle.write(output)
+            os.replace(temp_path, path)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{path}: 이미지 {extracted}개 이동 ({len(raw)} -> {len(output)} bytes)"
+                )
+            )
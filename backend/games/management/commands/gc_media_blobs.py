@@ -0,0 +1,68 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from games.blob_store import adopt_file, iter_stale_temp_files, iter_unreferenced_blobs
+from games.image_metadata import prune_missing_metadata
+
+ADOPT_PREFIXES = ("worldcup/", "wc-banner-media/")
+
+
+class Command(BaseCommand):
+    help = "어디서도 링크하지 않는 media 원본(blobs/sha256)을 지웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=24,
+            help="이 시간 안에 만들어지거나 링크가 바뀐 원본은 남김 (기본 24)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="지우지 않고 대상만 보고")
+        parser.add_argument(
+            "--adopt",
+            action="store_true",
+            help="먼저 worldcup/, wc-banner-media/ 의 기존 파일을 원본 하드링크로 바꿔 중복을 합침",
+        )
+
+    def _adopt_existing(self, dry_run: bool) -> int:
+        adopted = 0
+        for prefix in ADOPT_PREFIXES:
+            root = os.path.join(settings.MEDIA_ROOT, prefix)
+            for current, _, filenames in os.walk(root):
+                for filename in filenames:
+                    relative_path = os.path.relpath(
+                        os.path.join(current, filename), settings.MEDIA_ROOT
+                    )
+                    if dry_run:
+                        continue
+                    if adopt_file(relative_path):
+                        adopted += 1
+        return adopted
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        if options["adopt"]:
+            adopted = self._adopt_existing(dry_run)
+            self.stdout.write(f"원본으로 합친 파일: {adopted}개")
+
+        older_than = time.time() - options["grace_hours"] * 3600
+        removed = 0
+        freed = 0
+        candidates = list(iter_unreferenced_blobs(older_than))
+        candidates.extend(iter_stale_temp_files(older_than))
+        for path, size in candidates:
+            if not dry_run:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+            removed += 1
+            freed += size
+        if not dry_run:
+            pruned = prune_missing_metadata()
+            self.stdout.write(f"파일이 없는 이미지 메타데이터 삭제: {pruned}개")
+        action = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(self.style.SUCCESS(f"{action}: {removed}개, {freed} bytes"))
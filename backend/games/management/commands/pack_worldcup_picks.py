@@ -0,0 +1,87 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from games.models import WorldcupPickLog, WorldcupPickPack
+from games.pick_store import pack_run, split_packable_runs
+
+
+class Command(BaseCommand):
+    help = "기존 WorldcupPickLog 행을 세션 단위 WorldcupPickPack 으로 변환합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 트랜잭션에서 처리할 세션 수 (기본 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        rows = WorldcupPickLog.objects.all()
+        if options.get("game_id"):
+            rows = rows.filter(game_id=options["game_id"])
+
+        packed_rows = 0
+        created_packs = 0
+        last_choice_id = 0
+        while True:
+            # 세션 ID 순으로 batch_size 개씩 끊어서 처리한다.
+            choice_ids = list(
+                rows.filter(choice_id__gt=last_choice_id)
+                .order_by("choice_id")
+                .values_list("choice_id", flat=True)
+                .distinct()[:batch_size]
+            )
+            if not choice_ids:
+                break
+            last_choice_id = choice_ids[-1]
+
+            grouped = defaultdict(list)
+            for log in rows.filter(choice_id__in=choice_ids).order_by("choice_id", "step_index", "id"):
+                grouped[(log.choice_id, log.game_id)].append(log)
+
+            packs = []
+            row_ids = []
+            for (choice_id, game_id), logs in grouped.items():
+                by_step = {}
+                for log in logs:
+                    # 같은 step 이 중복되면 마지막 기록만 압축하고 나머지는 행으로 남긴다.
+                    by_step[log.step_index] = log
+                created_at = {log.id: log.created_at for log in by_step.values()}
+                picks = [
+                    {
+                        "id": log.id,
+                        "left_item_id": log.left_item_id,
+                        "right_item_id": log.right_item_id,
+                        "selected_item_id": log.selected_item_id,
+                        "step_index": log.step_index,
+                    }
+                    for log in by_step.values()
+                ]
+                runs, _ = split_packable_runs(picks)
+                for run in runs:
+                    packs.append(
+                        WorldcupPickPack(
+                            choice_id=choice_id,
+                            game_id=game_id,
+                            # 날짜 필터/집계가 바뀌지 않도록 run 첫 pick 의 시각을 유지한다.
+                            created_at=created_at[run[0]["id"]],
+                            **pack_run(run),
+                        )
+                    )
+                    row_ids.extend(pick["id"] for pick in run)
+
+            with transaction.atomic():
+                WorldcupPickPack.objects.bulk_create(packs, batch_size=1000)
+                WorldcupPickLog.objects.filter(id__in=row_ids).delete()
+            packed_rows += len(row_ids)
+            created_packs += len(packs)
+            self.stdout.write(f"choice {last_choice_id}까지: {len(row_ids)}행 → {len(packs)}팩")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"변환 완료: {packed_rows}행을 {created_packs}개 팩으로 압축")
+        )
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from games.models import GameChampionStat, GameResult, GameResultTotal
+from games.stats import (
+    count_champions,
+    get_champion_counts,
+    get_result_total,
+    rebuild_champion_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "게임별 우승 아이템 집계와 결과 합계를 결과 테이블 기준으로 재계산/검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="수정하지 않고 집계와 결과가 다른 게임만 보고",
+        )
+
+    def handle(self, *args, **options):
+        game_id = options.get("game_id")
+        if game_id:
+            game_ids = [game_id]
+        else:
+            # Meta.ordering 이 있으면 DISTINCT 에 정렬 컬럼이 붙으므로 정렬을 지운다.
+            game_ids = sorted(
+                set().union(
+                    *(
+                        model.objects.order_by().values_list("game_id", flat=True).distinct()
+                        for model in (GameResult, GameChampionStat, GameResultTotal)
+                    )
+                )
+            )
+
+        mismatched = 0
+        for current_id in game_ids:
+            if options.get("check"):
+                counts = count_champions(current_id)
+                if (
+                    counts != get_champion_counts(current_id)
+                    or sum(counts.values()) != get_result_total(current_id)
+                ):
+                    mismatched += 1
+                    self.stdout.write(f"game {current_id}: 집계 불일치")
+                continue
+            row_count = rebuild_champion_stats(current_id)
+            self.stdout.write(f"game {current_id}: 우승 아이템 {row_count}개 재계산")
+
+        if options.get("check"):
+            self.stdout.write(self.style.SUCCESS(f"검사 완료: 불일치 {mismatched}건"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"재계산 완료: {len(game_ids)}개 게임"))
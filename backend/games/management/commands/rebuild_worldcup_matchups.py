@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+
+from games.models import WorldcupMatchupStat, WorldcupPickLog, WorldcupPickPack
+from games.stats import count_game_matchups, get_game_matchups, rebuild_matchup_stats
+
+
+class Command(BaseCommand):
+    help = "월드컵 아이템 쌍별 맞대결 통계를 pick 로그 기준으로 백필/재계산/검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="pick 로그를 한 번에 읽는 행 수 (기본 2000)",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="수정하지 않고 통계와 로그가 다른 게임만 보고",
+        )
+
+    def handle(self, *args, **options):
+        game_id = options.get("game_id")
+        chunk_size = max(1, options["chunk_size"])
+        if game_id:
+            game_ids = [game_id]
+        else:
+            # Meta.ordering 이 있으면 DISTINCT 에 정렬 컬럼이 붙으므로 정렬을 지운다.
+            game_ids = sorted(
+                set().union(
+                    *(
+                        model.objects.order_by().values_list("game_id", flat=True).distinct()
+                        for model in (WorldcupPickLog, WorldcupPickPack, WorldcupMatchupStat)
+                    )
+                )
+            )
+
+        mismatched = 0
+        for current_id in game_ids:
+            if options.get("check"):
+                if count_game_matchups(current_id, chunk_size) != get_game_matchups(current_id):
+                    mismatched += 1
+                    self.stdout.write(f"game {current_id}: 맞대결 통계 불일치")
+                continue
+            pair_count = rebuild_matchup_stats(current_id, chunk_size)
+            self.stdout.write(f"game {current_id}: {pair_count}개 아이템 쌍 재계산")
+
+        if options.get("check"):
+            self.stdout.write(self.style.SUCCESS(f"검사 완료: 불일치 {mismatched}건"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"재계산 완료: {len(game_ids)}개 게임"))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from games.models import WorldcupItemStat, WorldcupPickLog, WorldcupPickPack
+from games.ratings import replay_ratings
+
+
+class Command(BaseCommand):
+    help = "월드컵 아이템 Elo 레이팅을 pick 로그 전체를 다시 재생해 재계산합니다 (numpy 필요)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="한 번에 읽어 계산하는 경기 수 (기본 5000)",
+        )
+
+    def handle(self, *args, **options):
+        game_id = options.get("game_id")
+        chunk_size = max(1, options["chunk_size"])
+        if game_id:
+            game_ids = [game_id]
+        else:
+            # Meta.ordering 이 있으면 DISTINCT 에 정렬 컬럼이 붙으므로 정렬을 지운다.
+            game_ids = sorted(
+                set().union(
+                    *(
+                        model.objects.order_by().values_list("game_id", flat=True).distinct()
+                        for model in (WorldcupPickLog, WorldcupPickPack, WorldcupItemStat)
+                    )
+                )
+            )
+
+        for current_id in game_ids:
+            match_count = replay_ratings(current_id, chunk_size)
+            self.stdout.write(f"game {current_id}: {match_count}개 경기 재생")
+
+        self.stdout.write(self.style.SUCCESS(f"재계산 완료: {len(game_ids)}개 게임"))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from games.models import WorldcupItemStat, WorldcupPickLog, WorldcupPickPack
+from games.stats import count_pick_wins, get_item_wins, rebuild_item_stats
+
+
+class Command(BaseCommand):
+    help = "월드컵 아이템 승리 카운터를 pick 로그 기준으로 재계산/검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game-id", type=int, help="특정 게임만 처리")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="수정하지 않고 카운터와 로그가 다른 게임만 보고",
+        )
+
+    def handle(self, *args, **options):
+        game_id = options.get("game_id")
+        if game_id:
+            game_ids = [game_id]
+        else:
+            # Meta.ordering 이 있으면 DISTINCT 에 정렬 컬럼이 붙으므로 정렬을 지운다.
+            game_ids = sorted(
+                set().union(
+                    *(
+                        model.objects.order_by().values_list("game_id", flat=True).distinct()
+                        for model in (WorldcupPickLog, WorldcupPickPack, WorldcupItemStat)
+                    )
+                )
+            )
+
+        mismatched = 0
+        for current_id in game_ids:
+            if options.get("check"):
+                if count_pick_wins(current_id) != get_item_wins(current_id):
+                    mismatched += 1
+                    self.stdout.write(f"game {current_id}: 카운터 불일치")
+                continue
+            item_count = rebuild_item_stats(current_id)
+            self.stdout.write(f"game {current_id}: {item_count}개 아이템 재계산")
+
+        if options.get("check"):
+            self.stdout.write(self.style.SUCCESS(f"검사 완료: 불일치 {mismatched}건"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"재계산 완료: {len(game_ids)}개 게임"))
@@ -0,0 +1,50 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from games.rollups import get_processed_until, reset_watermark, run_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "게임별 세션/종료/선택/결과 수를 시간·일 단위로 집계합니다. "
+        "마지막으로 처리한 시각 이후만 읽으므로 cron 등으로 주기적으로 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-hours",
+            type=int,
+            default=24,
+            help="한 트랜잭션에서 처리할 시간 수 (기본 24)",
+        )
+        parser.add_argument(
+            "--since",
+            help="이 날짜/시각 이후를 다시 집계 (예: 2025-01-01 또는 2025-01-01T09:00)",
+        )
+
+    def handle(self, *args, **options):
+        since_value = options.get("since")
+        if since_value:
+            since = parse_datetime(since_value)
+            if since is None:
+                day = parse_date(since_value)
+                if day is None:
+                    raise CommandError("--since 형식이 올바르지 않습니다.")
+                since = datetime.combine(day, time.min)
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            reset_watermark(since)
+
+        chunks = 0
+        for start, end in run_rollups(options["chunk_hours"]):
+            chunks += 1
+            self.stdout.write(
+                f"{timezone.localtime(start):%Y-%m-%d %H:%M} ~ {timezone.localtime(end):%Y-%m-%d %H:%M} 집계"
+            )
+
+        processed_until = get_processed_until()
+        until_text = timezone.localtime(processed_until).isoformat() if processed_until else "-"
+        self.stdout.write(self.style.SUCCESS(f"집계 완료: {chunks}개 구간, 처리 완료 시각 {until_text}"))
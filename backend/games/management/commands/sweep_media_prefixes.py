@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from games.drafts import (
+    delete_expired_drafts,
+    iter_expired_draft_chunks,
+    iter_orphan_prefix_chunks,
+    prefix_usage,
+    remove_prefix,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 월드컵 드래프트와 DB 에서 쓰지 않는 드래프트/수정요청 폴더를 지웁니다. "
+        "cron 등으로 주기적으로 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=200)
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=6,
+            help="이 시간 안에 바뀐 폴더는 고아여도 남김 (기본 6)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="지우지 않고 대상만 보고")
+
+    def handle(self, *args, **options):
+        chunk_size = max(1, options["chunk_size"])
+        dry_run = options["dry_run"]
+        totals = {"drafts": 0, "prefixes": 0, "freed": 0, "shared": 0}
+
+        def sweep(prefixes):
+            for prefix in prefixes:
+                freed, shared = prefix_usage(prefix)
+                totals["prefixes"] += 1
+                totals["freed"] += freed
+                totals["shared"] += shared
+                if not dry_run:
+                    remove_prefix(prefix)
+
+        for rows in iter_expired_draft_chunks(chunk_size):
+            if dry_run:
+                totals["drafts"] += len(rows)
+                sweep(prefix for _, prefix in rows if prefix)
+                continue
+            deleted = delete_expired_drafts(rows)
+            totals["drafts"] += len(deleted)
+            sweep(prefix for _, prefix in deleted if prefix)
+
+        older_than = time.time() - options["grace_hours"] * 3600
+        for prefixes in iter_orphan_prefix_chunks(chunk_size, older_than):
+            sweep(prefixes)
+
+        action = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action}: 드래프트 {totals['drafts']}개, 폴더 {totals['prefixes']}개, "
+                f"{totals['freed']} bytes "
+                f"(원본 저장소와 공유하는 {totals['shared']} bytes 는 gc_media_blobs 로 정리)"
+            )
+        )
@@ -0,0 +1,74 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def forwards(apps, schema_editor):
+    WorldcupPickLog = apps.get_model("games", "WorldcupPickLog")
+    WorldcupItemStat = apps.get_model("games", "WorldcupItemStat")
+    rows = (
+        WorldcupPickLog.objects.exclude(selected_item_id__isnull=True)
+        # Meta.ordering 컬럼이 GROUP BY 에 끼지 않도록 정렬을 지운다.
+        .order_by()
+        .values("game_id", "selected_item_id")
+        .annotate(wins=models.Count("id"))
+    )
+    WorldcupItemStat.objects.bulk_create(
+        [
+            WorldcupItemStat(
+                game_id=row["game_id"],
+                item_id=row["selected_item_id"],
+                wins=row["wins"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def backwards(apps, schema_editor):
+    WorldcupItemStat = apps.get_model("games", "WorldcupItemStat")
+    WorldcupItemStat.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0018_add_worldcup_draft_code"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorldcupItemStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("wins", models.IntegerField(default=0, verbose_name="승리 수")),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="item_stats",
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+                (
+                    "item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats",
+                        to="games.gameitem",
+                        verbose_name="아이템",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "월드컵 아이템 통계",
+                "verbose_name_plural": "월드컵 아이템 통계",
+                "db_table": "gaimification_worldcup_item_stat",
+                "constraints": [
+                    models.UniqueConstraint(fields=("game", "item"), name="uniq_worldcup_item_stat"),
+                ],
+            },
+        ),
+        migrations.RunPython(forwards, backwards),
+    ]
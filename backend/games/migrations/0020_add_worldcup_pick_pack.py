@@ -0,0 +1,47 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0019_add_worldcup_item_stat"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorldcupPickPack",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("first_step", models.IntegerField(default=0, verbose_name="시작 선택 순서")),
+                ("match_count", models.IntegerField(verbose_name="경기 수")),
+                ("item_ids", models.BinaryField(verbose_name="아이템 ID 배열")),
+                ("selections", models.BinaryField(verbose_name="선택 비트맵")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시각")),
+                (
+                    "choice",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pick_packs",
+                        to="games.gamechoicelog",
+                        verbose_name="게임 세션",
+                    ),
+                ),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pick_packs",
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "월드컵 압축 선택 로그",
+                "verbose_name_plural": "월드컵 압축 선택 로그",
+                "db_table": "gaimification_worldcup_pick_pack",
+                "ordering": ["choice_id", "first_step", "id"],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0020_add_worldcup_pick_pack"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamechoicelog",
+            index=models.Index(fields=["started_at", "id"], name="choice_log_started_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="worldcuppicklog",
+            index=models.Index(fields=["created_at", "id"], name="pick_log_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="worldcuppickpack",
+            index=models.Index(fields=["created_at", "id"], name="pick_pack_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="gameresult",
+            index=models.Index(fields=["created_at", "id"], name="game_result_created_id_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0021_add_log_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gameitem",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, verbose_name="리사이즈 이미지"),
+        ),
+        migrations.AddField(
+            model_name="banner",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, verbose_name="리사이즈 이미지"),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0022_add_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="item_atlas",
+            field=models.JSONField(blank=True, default=dict, verbose_name="아이템 아틀라스"),
+        ),
+    ]
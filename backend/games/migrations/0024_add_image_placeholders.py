@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0023_add_game_item_atlas"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="thumbnail_width",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="썸네일 너비"),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="thumbnail_height",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="썸네일 높이"),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="thumbnail_placeholder",
+            field=models.TextField(blank=True, verbose_name="썸네일 미리보기"),
+        ),
+        migrations.AddField(
+            model_name="gameitem",
+            name="image_width",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="이미지 너비"),
+        ),
+        migrations.AddField(
+            model_name="gameitem",
+            name="image_height",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="이미지 높이"),
+        ),
+        migrations.AddField(
+            model_name="gameitem",
+            name="image_placeholder",
+            field=models.TextField(blank=True, verbose_name="이미지 미리보기"),
+        ),
+    ]
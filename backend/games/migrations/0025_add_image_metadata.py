@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0024_add_image_placeholders"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImageMetadata",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("path", models.CharField(max_length=255, unique=True, verbose_name="media 경로")),
+                ("content_hash", models.CharField(db_index=True, max_length=64, verbose_name="sha256")),
+                ("format", models.CharField(max_length=16, verbose_name="이미지 포맷")),
+                ("width", models.PositiveIntegerField(verbose_name="너비")),
+                ("height", models.PositiveIntegerField(verbose_name="높이")),
+                ("byte_size", models.PositiveBigIntegerField(verbose_name="파일 크기")),
+                ("mtime_ns", models.BigIntegerField(verbose_name="파일 수정 시각(ns)")),
+                ("validated_at", models.DateTimeField(verbose_name="검증 시각")),
+            ],
+            options={
+                "db_table": "gaimification_image_metadata",
+                "verbose_name": "이미지 메타데이터",
+                "verbose_name_plural": "이미지 메타데이터",
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    GameResult = apps.get_model("games", "GameResult")
+    GameChampionStat = apps.get_model("games", "GameChampionStat")
+    rows = (
+        GameResult.objects.order_by()
+        .values("game_id", "winner_item_id")
+        .annotate(champion_count=models.Count("id"))
+    )
+    GameChampionStat.objects.bulk_create(
+        [
+            GameChampionStat(
+                game_id=row["game_id"],
+                winner_item_id=row["winner_item_id"],
+                champion_count=row["champion_count"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def backwards(apps, schema_editor):
+    GameChampionStat = apps.get_model("games", "GameChampionStat")
+    GameChampionStat.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0025_add_image_metadata"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameChampionStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("champion_count", models.IntegerField(default=0, verbose_name="우승 횟수")),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="champion_stats",
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+                (
+                    "winner_item",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="champion_stats",
+                        to="games.gameitem",
+                        verbose_name="우승 아이템",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "gaimification_game_champion_stat",
+                "verbose_name": "게임 우승 집계",
+                "verbose_name_plural": "게임 우승 집계",
+                "constraints": [
+                    models.UniqueConstraint(fields=("game", "winner_item"), name="uniq_game_champion_stat")
+                ],
+            },
+        ),
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,61 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    GameResult = apps.get_model("games", "GameResult")
+    GameResultTotal = apps.get_model("games", "GameResultTotal")
+    rows = (
+        GameResult.objects.order_by()
+        .values("game_id")
+        .annotate(result_count=models.Count("id"))
+    )
+    GameResultTotal.objects.bulk_create(
+        [
+            GameResultTotal(game_id=row["game_id"], result_count=row["result_count"])
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def backwards(apps, schema_editor):
+    GameResultTotal = apps.get_model("games", "GameResultTotal")
+    GameResultTotal.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0026_add_game_champion_stat"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamechampionstat",
+            index=models.Index(fields=["game", "champion_count"], name="champion_stat_count_idx"),
+        ),
+        migrations.CreateModel(
+            name="GameResultTotal",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="result_total",
+                        serialize=False,
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+                ("result_count", models.IntegerField(default=0, verbose_name="결과 수")),
+            ],
+            options={
+                "db_table": "gaimification_game_result_total",
+                "verbose_name": "게임 결과 합계",
+                "verbose_name_plural": "게임 결과 합계",
+            },
+        ),
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,57 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0027_add_game_result_total"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorldcupMatchupStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("a_wins", models.IntegerField(default=0, verbose_name="A 승리 수")),
+                ("b_wins", models.IntegerField(default=0, verbose_name="B 승리 수")),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="matchup_stats",
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+                (
+                    "item_a",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="games.gameitem",
+                        verbose_name="아이템 A",
+                    ),
+                ),
+                (
+                    "item_b",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="games.gameitem",
+                        verbose_name="아이템 B",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "gaimification_worldcup_matchup_stat",
+                "verbose_name": "월드컵 맞대결 통계",
+                "verbose_name_plural": "월드컵 맞대결 통계",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "item_a", "item_b"), name="uniq_worldcup_matchup_stat"
+                    )
+                ],
+            },
+        ),
+    ]
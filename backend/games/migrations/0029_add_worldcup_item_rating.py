@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0028_add_worldcup_matchup_stat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worldcupitemstat",
+            name="rating",
+            field=models.FloatField(default=1500.0, verbose_name="레이팅"),
+        ),
+    ]
@@ -0,0 +1,72 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0029_add_worldcup_item_rating"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamechoicelog",
+            index=models.Index(fields=["finished_at"], name="choice_log_finished_idx"),
+        ),
+        migrations.CreateModel(
+            name="GameActivityRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "시간"), ("day", "일")],
+                        max_length=10,
+                        verbose_name="집계 단위",
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField(verbose_name="구간 시작 시각")),
+                ("sessions_started", models.IntegerField(default=0, verbose_name="시작 세션 수")),
+                ("sessions_finished", models.IntegerField(default=0, verbose_name="종료 세션 수")),
+                ("picks", models.IntegerField(default=0, verbose_name="선택 수")),
+                ("results", models.IntegerField(default=0, verbose_name="결과 수")),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_rollups",
+                        to="games.game",
+                        verbose_name="게임",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "gaimification_game_activity_rollup",
+                "verbose_name": "게임 활동 집계",
+                "verbose_name_plural": "게임 활동 집계",
+                "indexes": [
+                    models.Index(fields=["granularity", "bucket_start"], name="activity_rollup_bucket_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "granularity", "bucket_start"),
+                        name="uniq_game_activity_rollup",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=50, unique=True, verbose_name="집계 이름")),
+                ("processed_until", models.DateTimeField(verbose_name="처리 완료 시각")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 시각")),
+            ],
+            options={
+                "db_table": "gaimification_rollup_watermark",
+                "verbose_name": "집계 진행 위치",
+                "verbose_name_plural": "집계 진행 위치",
+            },
+        ),
+    ]
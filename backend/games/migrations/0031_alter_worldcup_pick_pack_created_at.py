@@ -0,0 +1,17 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0030_add_game_activity_rollup"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="worldcuppickpack",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name="생성 시각"),
+        ),
+    ]
@@ -2,6 +2,7 @@
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 # --------------------------------------------------
@@ -88,6 +89,14 @@ class Game(TimeStampedModel):
     start_at = models.DateTimeField(null=True, blank=True, verbose_name="노출 시작 시각")
     end_at = models.DateTimeField(null=True, blank=True, verbose_name="노출 종료 시각")
 
+    # 썸네일 원본 크기와 16px WebP data URI (이미지가 오기 전 자리/흐린 미리보기용)
+    thumbnail_width = models.PositiveIntegerField(null=True, blank=True, verbose_name="썸네일 너비")
+    thumbnail_height = models.PositiveIntegerField(null=True, blank=True, verbose_name="썸네일 높이")
+    thumbnail_placeholder = models.TextField(blank=True, verbose_name="썸네일 미리보기")
+
+    # 아이템 썸네일 스프라이트 시트 manifest (games.atlas 가 백그라운드에서 채운다)
+    item_atlas = models.JSONField(default=dict, blank=True, verbose_name="아이템 아틀라스")
+
     class Meta:
         db_table = "gaimification_game"
         ordering = ["-created_at"]
@@ -151,6 +160,14 @@ class GameItem(TimeStampedModel):
 
     report_count = models.IntegerField(default=0, verbose_name="신고 횟수")
 
+    # {"160": "/media/.../_variants/a-<해시>-160w.webp", ...} 폭은 960 이하, 원본보다 크지 않다.
+    image_variants = models.JSONField(default=dict, blank=True, verbose_name="리사이즈 이미지")
+
+    # 원본 크기(EXIF 회전 반영)와 16px WebP data URI
+    image_width = models.PositiveIntegerField(null=True, blank=True, verbose_name="이미지 너비")
+    image_height = models.PositiveIntegerField(null=True, blank=True, verbose_name="이미지 높이")
+    image_placeholder = models.TextField(blank=True, verbose_name="이미지 미리보기")
+
     class Meta:
         db_table = "gaimification_game_item"
         ordering = ["sort_order", "id"]
@@ -332,6 +349,10 @@ class GameChoiceLog(TimeStampedModel):
     class Meta:
         db_table = "gaimification_game_choice_log"
         ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["started_at", "id"], name="choice_log_started_id_idx"),
+            models.Index(fields=["finished_at"], name="choice_log_finished_idx"),
+        ]
         verbose_name = "게임 선택 로그"
         verbose_name_plural = "게임 선택 로그"
 
@@ -387,6 +408,9 @@ class WorldcupPickLog(models.Model):
     class Meta:
         db_table = "gaimification_worldcup_pick_log"
         ordering = ["choice_id", "step_index", "id"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="pick_log_created_id_idx"),
+        ]
         verbose_name = "월드컵 선택 로그"
         verbose_name_plural = "월드컵 선택 로그"
 
@@ -394,6 +418,185 @@ class WorldcupPickLog(models.Model):
         return f"Choice #{self.id} (choice {self.choice_id})"
 
 
+# --------------------------------------------------
+# WorldcupPickPack (세션 단위 압축 선택 로그)
+# --------------------------------------------------
+class WorldcupPickPack(models.Model):
+    choice = models.ForeignKey(
+        GameChoiceLog,
+        on_delete=models.CASCADE,
+        related_name="pick_packs",
+        verbose_name="게임 세션",
+    )
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="pick_packs",
+        verbose_name="게임",
+    )
+
+    # step_index 가 first_step 부터 연속된 match_count 개의 경기
+    first_step = models.IntegerField(default=0, verbose_name="시작 선택 순서")
+    match_count = models.IntegerField(verbose_name="경기 수")
+    # 경기마다 (왼쪽, 오른쪽) 아이템 ID 를 int64 little-endian 으로 이어 붙인 배열
+    item_ids = models.BinaryField(verbose_name="아이템 ID 배열")
+    # 경기 순서대로 1비트씩, 1이면 오른쪽 아이템 선택
+    selections = models.BinaryField(verbose_name="선택 비트맵")
+
+    # 기존 로그를 변환할 때는 원래 pick 시각을 넣는다 (pack_worldcup_picks)
+    created_at = models.DateTimeField(default=timezone.now, verbose_name="생성 시각")
+
+    class Meta:
+        db_table = "gaimification_worldcup_pick_pack"
+        ordering = ["choice_id", "first_step", "id"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="pick_pack_created_id_idx"),
+        ]
+        verbose_name = "월드컵 압축 선택 로그"
+        verbose_name_plural = "월드컵 압축 선택 로그"
+
+    def __str__(self) -> str:
+        return f"PickPack #{self.id} (choice {self.choice_id})"
+
+
+# --------------------------------------------------
+# WorldcupItemStat (아이템별 누적 승리 수)
+# --------------------------------------------------
+class WorldcupItemStat(models.Model):
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="item_stats",
+        verbose_name="게임",
+    )
+    item = models.ForeignKey(
+        GameItem,
+        on_delete=models.CASCADE,
+        related_name="stats",
+        verbose_name="아이템",
+    )
+
+    # pick 저장 시 증분 갱신, rebuild_worldcup_stats 커맨드로 재계산
+    wins = models.IntegerField(default=0, verbose_name="승리 수")
+    # Elo 레이팅. pick 저장 시 갱신, rebuild_worldcup_ratings 커맨드로 재계산
+    rating = models.FloatField(default=1500.0, verbose_name="레이팅")
+
+    class Meta:
+        db_table = "gaimification_worldcup_item_stat"
+        constraints = [
+            models.UniqueConstraint(fields=["game", "item"], name="uniq_worldcup_item_stat"),
+        ]
+        verbose_name = "월드컵 아이템 통계"
+        verbose_name_plural = "월드컵 아이템 통계"
+
+    def __str__(self) -> str:
+        return f"ItemStat {self.item_id} of game {self.game_id}"
+
+
+# --------------------------------------------------
+# WorldcupMatchupStat (아이템 쌍별 맞대결 결과)
+# --------------------------------------------------
+class WorldcupMatchupStat(models.Model):
+    """두 아이템이 맞붙은 결과. item_a_id < item_b_id 로 한 쌍당 한 행만 둔다."""
+
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="matchup_stats",
+        verbose_name="게임",
+    )
+    item_a = models.ForeignKey(
+        GameItem,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="아이템 A",
+    )
+    item_b = models.ForeignKey(
+        GameItem,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="아이템 B",
+    )
+
+    # pick 저장 시 증분 갱신, rebuild_worldcup_matchups 커맨드로 재계산
+    a_wins = models.IntegerField(default=0, verbose_name="A 승리 수")
+    b_wins = models.IntegerField(default=0, verbose_name="B 승리 수")
+
+    class Meta:
+        db_table = "gaimification_worldcup_matchup_stat"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "item_a", "item_b"], name="uniq_worldcup_matchup_stat"
+            ),
+        ]
+        verbose_name = "월드컵 맞대결 통계"
+        verbose_name_plural = "월드컵 맞대결 통계"
+
+    def __str__(self) -> str:
+        return f"Matchup {self.item_a_id} vs {self.item_b_id} of game {self.game_id}"
+
+
+# --------------------------------------------------
+# GameChampionStat (게임별 우승 아이템 집계)
+# --------------------------------------------------
+class GameChampionStat(models.Model):
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="champion_stats",
+        verbose_name="게임",
+    )
+    # 결과의 winner_item 과 같이 비어 있을 수 있다 (미지정/삭제된 아이템)
+    winner_item = models.ForeignKey(
+        GameItem,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="champion_stats",
+        verbose_name="우승 아이템",
+    )
+
+    # 결과 저장 시 증분 갱신, rebuild_champion_stats 커맨드로 재계산
+    champion_count = models.IntegerField(default=0, verbose_name="우승 횟수")
+
+    class Meta:
+        db_table = "gaimification_game_champion_stat"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "winner_item"], name="uniq_game_champion_stat"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["game", "champion_count"], name="champion_stat_count_idx"),
+        ]
+        verbose_name = "게임 우승 집계"
+        verbose_name_plural = "게임 우승 집계"
+
+    def __str__(self) -> str:
+        return f"ChampionStat {self.winner_item_id} of game {self.game_id}"
+
+
+class GameResultTotal(models.Model):
+    game = models.OneToOneField(
+        Game,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="result_total",
+        verbose_name="게임",
+    )
+
+    # GameChampionStat 과 같이 갱신된다 (합계를 매번 더하지 않기 위해 따로 둔다)
+    result_count = models.IntegerField(default=0, verbose_name="결과 수")
+
+    class Meta:
+        db_table = "gaimification_game_result_total"
+        verbose_name = "게임 결과 합계"
+        verbose_name_plural = "게임 결과 합계"
+
+    def __str__(self) -> str:
+        return f"ResultTotal of game {self.game_id}"
+
+
 # --------------------------------------------------
 # GameResult (최종 결과)
 # --------------------------------------------------
@@ -452,6 +655,9 @@ class GameResult(models.Model):
     class Meta:
         db_table = "gaimification_game_result"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="game_result_created_id_idx"),
+        ]
         verbose_name = "게임 결과"
         verbose_name_plural = "게임 결과"
 
@@ -459,6 +665,68 @@ class GameResult(models.Model):
         return f"Result of choice {self.choice_id}"
 
 
+# --------------------------------------------------
+# GameActivityRollup (시간/일 단위 활동 집계)
+# --------------------------------------------------
+class GameActivityGranularity(models.TextChoices):
+    HOUR = "hour", "시간"
+    DAY = "day", "일"
+
+
+class GameActivityRollup(models.Model):
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="activity_rollups",
+        verbose_name="게임",
+    )
+    granularity = models.CharField(
+        max_length=10,
+        choices=GameActivityGranularity.choices,
+        verbose_name="집계 단위",
+    )
+    # hour 는 정시, day 는 TIME_ZONE 기준 자정
+    bucket_start = models.DateTimeField(verbose_name="구간 시작 시각")
+
+    # rollup_game_activity 커맨드가 채운다
+    sessions_started = models.IntegerField(default=0, verbose_name="시작 세션 수")
+    sessions_finished = models.IntegerField(default=0, verbose_name="종료 세션 수")
+    picks = models.IntegerField(default=0, verbose_name="선택 수")
+    results = models.IntegerField(default=0, verbose_name="결과 수")
+
+    class Meta:
+        db_table = "gaimification_game_activity_rollup"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "granularity", "bucket_start"],
+                name="uniq_game_activity_rollup",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"], name="activity_rollup_bucket_idx"),
+        ]
+        verbose_name = "게임 활동 집계"
+        verbose_name_plural = "게임 활동 집계"
+
+    def __str__(self) -> str:
+        return f"Activity {self.granularity} {self.bucket_start} of game {self.game_id}"
+
+
+class RollupWatermark(models.Model):
+    name = models.CharField(max_length=50, unique=True, verbose_name="집계 이름")
+    # 이 시각 이전 구간은 집계가 끝났다
+    processed_until = models.DateTimeField(verbose_name="처리 완료 시각")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 시각")
+
+    class Meta:
+        db_table = "gaimification_rollup_watermark"
+        verbose_name = "집계 진행 위치"
+        verbose_name_plural = "집계 진행 위치"
+
+    def __str__(self) -> str:
+        return f"{self.name} until {self.processed_until}"
+
+
 # --------------------------------------------------
 # Banner / BannerClickLog (선택: 광고/유입 분석 용)
 # --------------------------------------------------
@@ -503,6 +771,8 @@ class Banner(TimeStampedModel):
     start_at = models.DateTimeField(null=True, blank=True, verbose_name="노출 시작 시각")
     end_at = models.DateTimeField(null=True, blank=True, verbose_name="노출 종료 시각")
 
+    image_variants = models.JSONField(default=dict, blank=True, verbose_name="리사이즈 이미지")
+
     class Meta:
         db_table = "gaimification_banner"
         ordering = ["-is_active", "-priority", "id"]
@@ -598,3 +868,27 @@ class WorldcupDraft(models.Model):
 
     def __str__(self) -> str:
         return f"WorldcupDraft #{self.id} (user {self.user_id})"
+
+
+# --------------------------------------------------
+# ImageMetadata (media 이미지 검증 결과 색인)
+# --------------------------------------------------
+class ImageMetadata(models.Model):
+    # MEDIA_ROOT 기준 상대 경로 (예: worldcup/ab12cd/item-1.jpg)
+    path = models.CharField(max_length=255, unique=True, verbose_name="media 경로")
+    content_hash = models.CharField(max_length=64, db_index=True, verbose_name="sha256")
+    format = models.CharField(max_length=16, verbose_name="이미지 포맷")
+    width = models.PositiveIntegerField(verbose_name="너비")
+    height = models.PositiveIntegerField(verbose_name="높이")
+    byte_size = models.PositiveBigIntegerField(verbose_name="파일 크기")
+    # 파일이 바뀌었는지는 크기 + mtime 으로 판단한다.
+    mtime_ns = models.BigIntegerField(verbose_name="파일 수정 시각(ns)")
+    validated_at = models.DateTimeField(verbose_name="검증 시각")
+
+    class Meta:
+        db_table = "gaimification_image_metadata"
+        verbose_name = "이미지 메타데이터"
+        verbose_name_plural = "이미지 메타데이터"
+
+    def __str__(self) -> str:
+        return f"{self.path} ({self.format} {self.width}x{self.height})"
@@ -0,0 +1,232 @@
+import struct
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Q
+
+from .models import Game, GameItem, WorldcupPickLog, WorldcupPickPack
+
+PICK_STORAGE_ROWS = "rows"
+PICK_STORAGE_PACKED = "packed"
+
+
+def get_pick_storage() -> str:
+    return getattr(settings, "WORLDCUP_PICK_STORAGE", PICK_STORAGE_ROWS)
+
+
+class DecodedPick:
+    """WorldcupPickPack 에서 풀어낸 경기 1건. WorldcupPickLog 와 같은 속성을 가진다."""
+
+    def __init__(self, pack, step_index, left_item_id, right_item_id, selected_item_id):
+        self.id = None
+        self.pack_id = pack.id
+        self.choice_id = pack.choice_id
+        self.game_id = pack.game_id
+        self.step_index = step_index
+        self.left_item_id = left_item_id
+        self.right_item_id = right_item_id
+        self.selected_item_id = selected_item_id
+        self.created_at = pack.created_at
+        self.game = None
+        self.left_item = None
+        self.right_item = None
+        self.selected_item = None
+
+
+def _is_packable(pick: dict) -> bool:
+    left_id = pick.get("left_item_id")
+    right_id = pick.get("right_item_id")
+    selected_id = pick.get("selected_item_id")
+    return bool(left_id and right_id and selected_id in (left_id, right_id))
+
+
+def split_packable_runs(picks: list[dict]) -> tuple[list[list[dict]], list[dict]]:
+    """step_index 가 연속된 pick 묶음(run)과 압축할 수 없는 나머지로 나눈다."""
+    runs = []
+    leftovers = []
+    current = []
+    for pick in sorted(picks, key=lambda entry: entry["step_index"]):
+        if not _is_packable(pick):
+            leftovers.append(pick)
+            continue
+        if current and pick["step_index"] != current[-1]["step_index"] + 1:
+            runs.append(current)
+            current = []
+        current.append(pick)
+    if current:
+        runs.append(current)
+    return runs, leftovers
+
+
+def pack_run(run: list[dict]) -> dict:
+    """연속된 pick 을 (좌, 우) 아이템 ID 배열과 선택 비트맵으로 압축한다."""
+    item_ids = []
+    selections = bytearray((len(run) + 7) // 8)
+    for offset, pick in enumerate(run):
+        item_ids.extend((pick["left_item_id"], pick["right_item_id"]))
+        if pick["selected_item_id"] == pick["right_item_id"]:
+            selections[offset >> 3] |= 1 << (offset & 7)
+    return {
+        "first_step": run[0]["step_index"],
+        "match_count": len(run),
+        "item_ids": struct.pack(f"<{len(item_ids)}q", *item_ids),
+        "selections": bytes(selections),
+    }
+
+
+def unpack(pack) -> list[DecodedPick]:
+    item_ids = struct.unpack(f"<{pack.match_count * 2}q", bytes(pack.item_ids))
+    selections = bytes(pack.selections)
+    decoded = []
+    for offset in range(pack.match_count):
+        left_id = item_ids[offset * 2]
+        right_id = item_ids[offset * 2 + 1]
+        picked_right = (selections[offset >> 3] >> (offset & 7)) & 1
+        decoded.append(
+            DecodedPick(
+                pack,
+                pack.first_step + offset,
+                left_id,
+                right_id,
+                right_id if picked_right else left_id,
+            )
+        )
+    return decoded
+
+
+def build_packs(choice, game, picks: list[dict]) -> tuple[list, list[dict]]:
+    runs, leftovers = split_packable_runs(picks)
+    packs = [WorldcupPickPack(choice=choice, game=game, **pack_run(run)) for run in runs]
+    return packs, leftovers
+
+
+def write_picks(choice, game, picks: list[dict]) -> None:
+    """설정된 저장 방식(rows/packed)으로 pick 을 기록한다. 트랜잭션 안에서 호출한다."""
+    if get_pick_storage() == PICK_STORAGE_PACKED:
+        packs, picks = build_packs(choice, game, picks)
+        if packs:
+            WorldcupPickPack.objects.bulk_create(packs)
+    if picks:
+        WorldcupPickLog.objects.bulk_create(
+            [
+                WorldcupPickLog(
+                    choice=choice,
+                    game=game,
+                    left_item_id=pick.get("left_item_id"),
+                    right_item_id=pick.get("right_item_id"),
+                    selected_item_id=pick.get("selected_item_id"),
+                    step_index=pick["step_index"],
+                )
+                for pick in picks
+            ]
+        )
+
+
+def _iter_by_id(queryset, chunk_size: int):
+    # MySQL 클라이언트 커서는 iterator() 로도 결과 전체를 메모리에 올리므로 id 구간으로 끊어서 조회한다.
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id).order_by("id")[:chunk_size])
+        if not chunk:
+            return
+        yield from chunk
+        last_id = chunk[-1].id
+
+
+def iter_packed_picks(game_id: int | None = None, chunk_size: int = 2000):
+    packs = WorldcupPickPack.objects.all()
+    if game_id is not None:
+        packs = packs.filter(game_id=game_id)
+    for pack in _iter_by_id(packs, chunk_size):
+        yield from unpack(pack)
+
+
+def iter_game_picks(game_id: int | None = None, chunk_size: int = 2000):
+    """행 저장분과 압축 저장분을 합쳐 pick 을 하나씩 돌려준다."""
+    rows = WorldcupPickLog.objects.all()
+    if game_id is not None:
+        rows = rows.filter(game_id=game_id)
+    yield from _iter_by_id(rows, chunk_size)
+    yield from iter_packed_picks(game_id, chunk_size)
+
+
+def picks_for_choice(choice_id: int) -> list:
+    picks = list(WorldcupPickLog.objects.filter(choice_id=choice_id))
+    for pack in WorldcupPickPack.objects.filter(choice_id=choice_id):
+        picks.extend(unpack(pack))
+    picks.sort(key=lambda pick: (pick.step_index, pick.created_at))
+    return picks
+
+
+def count_choice_wins(game_id: int, choice_id: int) -> dict[int, int] | None:
+    """세션 하나의 아이템별 승리 수. pick 이 하나도 없으면 None."""
+    picks = [pick for pick in picks_for_choice(choice_id) if pick.game_id == game_id]
+    if not picks:
+        return None
+    return dict(Counter(pick.selected_item_id for pick in picks if pick.selected_item_id))
+
+
+def _attach_related(decoded: list[DecodedPick]) -> None:
+    item_ids = set()
+    for pick in decoded:
+        item_ids.update((pick.left_item_id, pick.right_item_id))
+    items = GameItem.objects.in_bulk(list(item_ids))
+    games = Game.objects.in_bulk(list({pick.game_id for pick in decoded}))
+    for pick in decoded:
+        pick.game = games.get(pick.game_id)
+        pick.left_item = items.get(pick.left_item_id)
+        pick.right_item = items.get(pick.right_item_id)
+        pick.selected_item = items.get(pick.selected_item_id)
+
+
+def page_picks(filters: dict, cursor: list | None, limit: int) -> tuple[list, list | None]:
+    """관리자 로그용 pick 페이지.
+
+    행 저장분과 압축 저장분을 (생성 시각, 종류, id) 역순 keyset 하나로 이어서 넘긴다.
+    종류는 압축분이 1, 행이 0 이고, 압축분은 페이지 경계에서 쪼개지 않는다.
+    반환값은 (pick 목록, 다음 cursor 키 또는 None).
+    """
+    rows = WorldcupPickLog.objects.filter(**filters).select_related(
+        "game", "left_item", "right_item", "selected_item"
+    )
+    packs = WorldcupPickPack.objects.filter(**filters)
+    if cursor:
+        moment, kind, last_id = cursor
+        if kind == 0:
+            rows = rows.filter(Q(created_at__lt=moment) | Q(created_at=moment, id__lt=last_id))
+            packs = packs.filter(created_at__lt=moment)
+        else:
+            rows = rows.filter(created_at__lte=moment)
+            packs = packs.filter(Q(created_at__lt=moment) | Q(created_at=moment, id__lt=last_id))
+
+    entries = [
+        ((row.created_at, 0, row.id), row)
+        for row in rows.order_by("-created_at", "-id")[: limit + 1]
+    ]
+    entries.extend(
+        ((pack.created_at, 1, pack.id), pack)
+        for pack in packs.order_by("-created_at", "-id")[: limit + 1]
+    )
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+
+    page = []
+    decoded = []
+    consumed = 0
+    for _, entry in entries:
+        if len(page) >= limit:
+            break
+        consumed += 1
+        if isinstance(entry, WorldcupPickPack):
+            picks = unpack(entry)
+            picks.reverse()
+            decoded.extend(picks)
+            page.extend(picks)
+        else:
+            page.append(entry)
+    if decoded:
+        _attach_related(decoded)
+    next_key = None
+    if consumed < len(entries):
+        moment, kind, last_id = entries[consumed - 1][0]
+        next_key = [moment, kind, last_id]
+    return page, next_key
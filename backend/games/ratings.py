@@ -0,0 +1,153 @@
+import heapq
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import GameItem, WorldcupItemStat, WorldcupPickLog, WorldcupPickPack
+from .pick_store import unpack
+
+ELO_BASE_RATING = 1500.0
+ELO_K_FACTOR = 32.0
+ELO_SCALE = 400.0
+
+
+def _valid_matches(picks) -> list[tuple[int, int]]:
+    """(left, right, selected) 목록을 (승자, 패자) 목록으로 바꾼다. 순서는 유지한다."""
+    matches = []
+    for left_id, right_id, selected_id in picks:
+        if not left_id or not right_id or left_id == right_id:
+            continue
+        if selected_id == left_id:
+            matches.append((left_id, right_id))
+        elif selected_id == right_id:
+            matches.append((right_id, left_id))
+    return matches
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / ELO_SCALE))
+
+
+def update_ratings(stats: dict, picks) -> None:
+    """잠근 {item_id: WorldcupItemStat} 의 rating 을 pick 순서대로 바꾼다. 저장은 호출한 쪽에서."""
+    for winner_id, loser_id in _valid_matches(picks):
+        winner, loser = stats[winner_id], stats[loser_id]
+        delta = ELO_K_FACTOR * (1.0 - expected_score(winner.rating, loser.rating))
+        winner.rating += delta
+        loser.rating -= delta
+
+
+def get_item_ratings(game_id: int) -> dict[int, float]:
+    return dict(
+        WorldcupItemStat.objects.filter(game_id=game_id).values_list("item_id", "rating")
+    )
+
+
+def _iter_by_time(queryset, chunk_size: int):
+    """(created_at, id) 순서의 keyset 페이지로 끊어 읽는다.
+
+    MySQL 클라이언트 커서는 iterator() 로도 결과 전체를 메모리에 올린다.
+    """
+    last = None
+    while True:
+        page = queryset
+        if last is not None:
+            page = page.filter(
+                Q(created_at__gt=last.created_at) | Q(created_at=last.created_at, id__gt=last.id)
+            )
+        chunk = list(page.order_by("created_at", "id")[:chunk_size])
+        if not chunk:
+            return
+        yield from chunk
+        last = chunk[-1]
+
+
+def iter_picks_in_order(game_id: int, chunk_size: int = 2000):
+    """행 저장분과 압축 저장분을 저장 시각 순으로 합쳐 (left, right, selected) 를 돌려준다."""
+    rows = (
+        (row.created_at, row.left_item_id, row.right_item_id, row.selected_item_id)
+        for row in _iter_by_time(
+            WorldcupPickLog.objects.filter(game_id=game_id).only(
+                "created_at", "left_item_id", "right_item_id", "selected_item_id"
+            ),
+            chunk_size,
+        )
+    )
+    # 변환된 팩은 id 가 나중이어도 원래 pick 시각을 가지므로 시각 순으로 읽는다.
+    packed = (
+        (pick.created_at, pick.left_item_id, pick.right_item_id, pick.selected_item_id)
+        for pack in _iter_by_time(WorldcupPickPack.objects.filter(game_id=game_id), chunk_size)
+        for pick in unpack(pack)
+    )
+    for _, left_id, right_id, selected_id in heapq.merge(rows, packed, key=lambda row: row[0]):
+        yield left_id, right_id, selected_id
+
+
+def _iter_chunks(iterable, chunk_size: int):
+    chunk = []
+    for value in iterable:
+        chunk.append(value)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _replay_chunk(np, ratings, winners, losers) -> None:
+    """한 묶음의 경기를 ratings 배열에 순서대로 반영한다.
+
+    같은 아이템이 나오지 않는 경기끼리 한 단계(wave)로 묶어 NumPy 로 한꺼번에 계산한다.
+    아이템마다 경기 순서가 유지되므로 한 건씩 반영한 결과와 같다.
+    """
+    last_wave = {}
+    waves = np.empty(len(winners), dtype=np.int64)
+    for index, (winner, loser) in enumerate(zip(winners.tolist(), losers.tolist())):
+        wave = max(last_wave.get(winner, -1), last_wave.get(loser, -1)) + 1
+        last_wave[winner] = last_wave[loser] = wave
+        waves[index] = wave
+    order = np.argsort(waves, kind="stable")
+    bounds = np.flatnonzero(np.diff(waves[order])) + 1
+    for group in np.split(order, bounds):
+        group_winners = winners[group]
+        group_losers = losers[group]
+        expected = 1.0 / (
+            1.0 + 10.0 ** ((ratings[group_losers] - ratings[group_winners]) / ELO_SCALE)
+        )
+        delta = ELO_K_FACTOR * (1.0 - expected)
+        ratings[group_winners] += delta
+        ratings[group_losers] -= delta
+
+
+def replay_ratings(game_id: int, chunk_size: int = 5000) -> int:
+    """원본 pick 로그 전체를 다시 재생해 게임의 레이팅을 만든다. 반환값은 반영한 경기 수."""
+    # 배치 재계산에서만 쓰므로 요청 처리 경로에서는 numpy 를 불러오지 않는다.
+    import numpy as np
+
+    item_ids = list(GameItem.objects.filter(game_id=game_id).values_list("id", flat=True))
+    index_of = {item_id: index for index, item_id in enumerate(item_ids)}
+    ratings = np.full(len(item_ids), ELO_BASE_RATING, dtype=np.float64)
+
+    replayed = 0
+    for chunk in _iter_chunks(iter_picks_in_order(game_id, chunk_size), chunk_size):
+        # 압축 저장분에는 삭제된 아이템 ID 가 남아 있을 수 있다.
+        pairs = [
+            (index_of[winner_id], index_of[loser_id])
+            for winner_id, loser_id in _valid_matches(chunk)
+            if winner_id in index_of and loser_id in index_of
+        ]
+        if not pairs:
+            continue
+        matches = np.array(pairs, dtype=np.int64)
+        _replay_chunk(np, ratings, matches[:, 0], matches[:, 1])
+        replayed += len(pairs)
+
+    # stats 가 이 모듈을 불러오므로 여기서 불러온다.
+    from .stats import lock_item_stats
+
+    with transaction.atomic():
+        stats = lock_item_stats(game_id, item_ids)
+        for stat in stats.values():
+            stat.rating = float(ratings[index_of[stat.item_id]])
+        WorldcupItemStat.objects.bulk_update(list(stats.values()), ["rating"], batch_size=1000)
+    return replayed
@@ -0,0 +1,149 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import models, transaction
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from .models import (
+    GameActivityGranularity,
+    GameActivityRollup,
+    GameChoiceLog,
+    GameResult,
+    RollupWatermark,
+    WorldcupPickLog,
+    WorldcupPickPack,
+)
+
+WATERMARK_NAME = "game_activity"
+ROLLUP_FIELDS = ("sessions_started", "sessions_finished", "picks", "results")
+
+# 커밋이 늦게 끝나는 요청을 놓치지 않도록 최근 몇 분은 다음 실행으로 미룬다.
+ROLLUP_SETTLE_DELAY = timedelta(minutes=5)
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def local_day_start(day) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _hourly(queryset, time_field: str, start, end, value) -> dict:
+    """{(game_id, 정시): 값} 을 한 번의 GROUP BY 로 구한다."""
+    rows = (
+        queryset.filter(**{f"{time_field}__gte": start, f"{time_field}__lt": end})
+        .annotate(bucket=TruncHour(time_field, tzinfo=dt_timezone.utc))
+        .values("game_id", "bucket")
+        .annotate(value=value)
+        .order_by()
+    )
+    return {(row["game_id"], row["bucket"]): row["value"] or 0 for row in rows}
+
+
+def count_hourly_activity(start: datetime, end: datetime) -> dict:
+    """[start, end) 구간의 원본 로그를 시간 단위로 센다. {(game_id, 정시): {필드: 값}}"""
+    buckets = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+    sources = (
+        ("sessions_started", GameChoiceLog.objects.all(), "started_at", models.Count("id")),
+        ("sessions_finished", GameChoiceLog.objects.all(), "finished_at", models.Count("id")),
+        ("picks", WorldcupPickLog.objects.all(), "created_at", models.Count("id")),
+        ("picks", WorldcupPickPack.objects.all(), "created_at", models.Sum("match_count")),
+        ("results", GameResult.objects.all(), "created_at", models.Count("id")),
+    )
+    for field, queryset, time_field, value in sources:
+        for key, count in _hourly(queryset, time_field, start, end, value).items():
+            buckets[key][field] += count
+    return buckets
+
+
+def _replace_rollups(granularity: str, start: datetime, end: datetime, buckets: dict) -> None:
+    GameActivityRollup.objects.filter(
+        granularity=granularity, bucket_start__gte=start, bucket_start__lt=end
+    ).delete()
+    GameActivityRollup.objects.bulk_create(
+        [
+            GameActivityRollup(
+                game_id=game_id, granularity=granularity, bucket_start=bucket_start, **values
+            )
+            for (game_id, bucket_start), values in buckets.items()
+            if any(values.values())
+        ],
+        batch_size=1000,
+    )
+
+
+def _rollup_days(start: datetime, end: datetime) -> None:
+    """[start, end) 와 겹치는 날의 일 단위 집계를 시간 단위 집계에서 다시 만든다."""
+    first_day = timezone.localtime(start).date()
+    last_day = timezone.localtime(end - timedelta(microseconds=1)).date()
+    day_start = local_day_start(first_day)
+    day_end = local_day_start(last_day + timedelta(days=1))
+    buckets = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+    for row in GameActivityRollup.objects.filter(
+        granularity=GameActivityGranularity.HOUR,
+        bucket_start__gte=day_start,
+        bucket_start__lt=day_end,
+    ).values("game_id", "bucket_start", *ROLLUP_FIELDS):
+        day = timezone.localtime(row["bucket_start"]).date()
+        values = buckets[(row["game_id"], local_day_start(day))]
+        for field in ROLLUP_FIELDS:
+            values[field] += row[field]
+    _replace_rollups(GameActivityGranularity.DAY, day_start, day_end, buckets)
+
+
+def _earliest_activity() -> datetime | None:
+    # 선택/결과/종료는 모두 세션 시작 뒤에 생긴다.
+    first = GameChoiceLog.objects.order_by("started_at").values_list("started_at", flat=True).first()
+    return floor_hour(first) if first else None
+
+
+def get_processed_until() -> datetime | None:
+    return (
+        RollupWatermark.objects.filter(name=WATERMARK_NAME)
+        .values_list("processed_until", flat=True)
+        .first()
+    )
+
+
+def reset_watermark(since: datetime) -> None:
+    """since 이후 구간을 다음 실행에서 다시 집계하게 한다."""
+    since = floor_hour(since)
+    updated = RollupWatermark.objects.filter(
+        name=WATERMARK_NAME, processed_until__gt=since
+    ).update(processed_until=since)
+    if not updated:
+        RollupWatermark.objects.get_or_create(
+            name=WATERMARK_NAME, defaults={"processed_until": since}
+        )
+
+
+def run_rollups(chunk_hours: int = 24, until: datetime | None = None):
+    """처리 완료 시각 이후의 지난 정시 구간을 chunk_hours 씩 집계한다. 처리한 (시작, 끝) 을 돌려준다."""
+    end_limit = floor_hour(until or timezone.now() - ROLLUP_SETTLE_DELAY)
+    start = get_processed_until()
+    if start is None:
+        start = _earliest_activity()
+        if start is None:
+            return
+        RollupWatermark.objects.get_or_create(
+            name=WATERMARK_NAME, defaults={"processed_until": start}
+        )
+    step = timedelta(hours=max(1, chunk_hours))
+    while start < end_limit:
+        chunk_end = min(start + step, end_limit)
+        with transaction.atomic():
+            watermark = RollupWatermark.objects.select_for_update().get(name=WATERMARK_NAME)
+            if watermark.processed_until != start:
+                # 다른 실행이 먼저 처리했다.
+                return
+            _replace_rollups(
+                GameActivityGranularity.HOUR, start, chunk_end, count_hourly_activity(start, chunk_end)
+            )
+            _rollup_days(start, chunk_end)
+            watermark.processed_until = chunk_end
+            watermark.save(update_fields=["processed_until", "updated_at"])
+        yield start, chunk_end
+        start = chunk_end
@@ -16,7 +16,16 @@ class GameListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Game
-        fields = ["id", "title", "slug", "type", "thumbnail_image_url"]
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "type",
+            "thumbnail_image_url",
+            "thumbnail_width",
+            "thumbnail_height",
+            "thumbnail_placeholder",
+        ]
 
 
 class GameDetailSerializer(serializers.ModelSerializer):
@@ -33,7 +42,11 @@ class GameDetailSerializer(serializers.ModelSerializer):
             "slug",
             "type",
             "thumbnail_image_url",
+            "thumbnail_width",
+            "thumbnail_height",
+            "thumbnail_placeholder",
             "items",
+            "item_atlas",
             "created_by",
         ]
 
@@ -63,6 +76,7 @@ class BannerSerializer(serializers.ModelSerializer):
             "name",
             "position",
             "image_url",
+            "image_variants",
             "link_type",
             "link_url",
             "game",
@@ -89,6 +103,7 @@ class AdminBannerSerializer(serializers.ModelSerializer):
             "name",
             "position",
             "image_url",
+            "image_variants",
             "link_type",
             "link_url",
             "game",
@@ -114,7 +129,16 @@ class AdminBannerSerializer(serializers.ModelSerializer):
 class GameItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = GameItem
-        fields = ["id", "name", "file_name", "sort_order"]
+        fields = [
+            "id",
+            "name",
+            "file_name",
+            "image_variants",
+            "image_width",
+            "image_height",
+            "image_placeholder",
+            "sort_order",
+        ]
 
 
 class GameAdminListSerializer(serializers.ModelSerializer):
@@ -338,6 +362,9 @@ class AdminGameEditRequestDetailSerializer(serializers.ModelSerializer):
 class GameChoiceLogCreateSerializer(serializers.Serializer):
     game_id = serializers.IntegerField()
     source = serializers.CharField(required=False, allow_blank=True)
+    # tournament: 서버가 대진표를 발급하고 결과를 한 번에 제출받는 모드
+    mode = serializers.ChoiceField(choices=["tournament"], required=False)
+    round_size = serializers.IntegerField(required=False, min_value=2)
 
     def validate_game_id(self, value):
         if value <= 0:
@@ -389,6 +416,66 @@ class WorldcupPickLogCreateSerializer(serializers.Serializer):
         return attrs
 
 
+class WorldcupPickEntrySerializer(serializers.Serializer):
+    left_item_id = serializers.IntegerField(required=False, allow_null=True)
+    right_item_id = serializers.IntegerField(required=False, allow_null=True)
+    selected_item_id = serializers.IntegerField(required=False, allow_null=True)
+    step_index = serializers.IntegerField(min_value=0)
+
+    def validate(self, attrs):
+        # 배치 요청에서는 아이템 ID 집합을 한 번만 조회해 context로 넘겨받는다.
+        item_ids = self.context.get("item_ids") or set()
+        for field_name in ("left_item_id", "right_item_id", "selected_item_id"):
+            item_id = attrs.get(field_name)
+            if item_id is not None and item_id not in item_ids:
+                raise serializers.ValidationError({field_name: "게임 아이템을 찾을 수 없습니다."})
+        left_item_id = attrs.get("left_item_id")
+        right_item_id = attrs.get("right_item_id")
+        selected_item_id = attrs.get("selected_item_id")
+        if selected_item_id and left_item_id and right_item_id:
+            if selected_item_id not in (left_item_id, right_item_id):
+                raise serializers.ValidationError(
+                    {"selected_item_id": "선택된 아이템이 좌/우 아이템에 포함되지 않습니다."}
+                )
+        return attrs
+
+
+class WorldcupPickBatchCreateSerializer(serializers.Serializer):
+    choice_id = serializers.IntegerField()
+    game_id = serializers.IntegerField()
+    picks = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=512,
+    )
+
+    def validate(self, attrs):
+        session = GameChoiceLog.objects.filter(id=attrs["choice_id"]).first()
+        if not session:
+            raise serializers.ValidationError({"choice_id": "선택 로그를 찾을 수 없습니다."})
+        game = Game.objects.filter(id=attrs["game_id"]).first()
+        if not game:
+            raise serializers.ValidationError({"game_id": "게임을 찾을 수 없습니다."})
+        if session.game_id != game.id:
+            raise serializers.ValidationError("세션과 게임이 일치하지 않습니다.")
+
+        attrs["choice"] = session
+        attrs["game"] = game
+        attrs["item_ids"] = set(
+            GameItem.objects.filter(game_id=game.id).values_list("id", flat=True)
+        )
+        return attrs
+
+
+class WorldcupTournamentSubmitSerializer(serializers.Serializer):
+    choice_id = serializers.IntegerField()
+    bracket_token = serializers.CharField()
+    picks = serializers.CharField(allow_blank=True)
+    result_title = serializers.CharField(required=False, allow_blank=True)
+    share_url = serializers.URLField(required=False, allow_blank=True)
+    result_payload = serializers.JSONField(required=False, allow_null=True)
+
+
 class GameResultCreateSerializer(serializers.Serializer):
     choice_id = serializers.IntegerField()
     game_id = serializers.IntegerField()
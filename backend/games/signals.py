@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .catalog import bump_catalog_version
+from .models import Game
+
+
+@receiver(post_save, sender=Game, dispatch_uid="games.catalog.game_saved")
+@receiver(post_delete, sender=Game, dispatch_uid="games.catalog.game_deleted")
+def invalidate_catalog(sender, **kwargs):
+    # 커밋 전에 올리면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있다.
+    transaction.on_commit(bump_catalog_version)
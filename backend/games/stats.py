@@ -0,0 +1,336 @@
+from collections import Counter, defaultdict
+
+from django.db import models, transaction
+
+from .models import (
+    GameChampionStat,
+    GameItem,
+    GameResult,
+    GameResultTotal,
+    WorldcupItemStat,
+    WorldcupMatchupStat,
+    WorldcupPickLog,
+)
+from .pick_store import iter_game_picks, iter_packed_picks
+from .ratings import update_ratings
+
+
+def lock_item_stats(game_id: int, item_ids) -> dict[int, WorldcupItemStat]:
+    """아이템 통계 행을 item_id 순서로 한 번에 잠근다. 없는 행은 만들고 잠근다.
+
+    동시에 들어온 pick 들이 행을 서로 다른 순서로 잠가 교착되지 않도록,
+    통계를 바꾸는 쪽은 모두 이 함수로 먼저 잠그고 메모리에서 값을 바꾼다.
+    """
+    item_ids = sorted({item_id for item_id in item_ids if item_id})
+    if not item_ids:
+        return {}
+
+    def _lock(ids):
+        return {
+            stat.item_id: stat
+            for stat in WorldcupItemStat.objects.select_for_update()
+            .filter(game_id=game_id, item_id__in=ids)
+            .order_by("item_id")
+        }
+
+    stats = _lock(item_ids)
+    missing = [item_id for item_id in item_ids if item_id not in stats]
+    if missing:
+        # 이미 있는 키는 건드리지 않도록 없는 행만 넣는다.
+        WorldcupItemStat.objects.bulk_create(
+            [WorldcupItemStat(game_id=game_id, item_id=item_id) for item_id in missing],
+            ignore_conflicts=True,
+        )
+        stats.update(_lock(missing))
+    return stats
+
+
+def apply_pick_counters(game_id: int, selected_item_ids) -> None:
+    """pick 저장 시 아이템별 승리 수를 증분 반영한다. 트랜잭션 안에서 호출한다."""
+    counts = Counter(item_id for item_id in selected_item_ids if item_id)
+    if not counts:
+        return
+    stats = lock_item_stats(game_id, counts)
+    for item_id, delta in counts.items():
+        stats[item_id].wins += delta
+    WorldcupItemStat.objects.bulk_update(list(stats.values()), ["wins"])
+
+
+def apply_pick_stats(game_id: int, picks) -> None:
+    """pick (left, right, selected) 목록의 승리 수와 Elo 레이팅을 한 번의 잠금으로 반영한다.
+
+    관련 행을 모두 item_id 순서로 잠근 뒤에만 값을 바꾼다. 트랜잭션 안에서 호출한다.
+    """
+    picks = list(picks)
+    item_ids = {item_id for pick in picks for item_id in pick}
+    stats = lock_item_stats(game_id, item_ids)
+    if not stats:
+        return
+    for _, _, selected_id in picks:
+        if selected_id:
+            stats[selected_id].wins += 1
+    update_ratings(stats, picks)
+    WorldcupItemStat.objects.bulk_update(list(stats.values()), ["wins", "rating"])
+
+
+def get_item_wins(game_id: int) -> dict[int, int]:
+    # 진 경기만 있는 아이템도 레이팅 때문에 행이 있으므로 0 승은 뺀다.
+    return dict(
+        WorldcupItemStat.objects.filter(game_id=game_id)
+        .exclude(wins=0)
+        .values_list("item_id", "wins")
+    )
+
+
+def count_pick_wins(game_id: int) -> dict[int, int]:
+    """원본 pick 로그(행 + 압축 저장분)에서 아이템별 승리 수를 직접 집계한다."""
+    counts = Counter(
+        {
+            row["selected_item_id"]: row["wins"]
+            for row in WorldcupPickLog.objects.filter(game_id=game_id)
+            .exclude(selected_item_id__isnull=True)
+            .values("selected_item_id")
+            .annotate(wins=models.Count("id"))
+        }
+    )
+    counts.update(pick.selected_item_id for pick in iter_packed_picks(game_id))
+    # 압축 저장분에는 삭제된 아이템 ID 가 남아 있을 수 있다.
+    existing_ids = set(
+        GameItem.objects.filter(game_id=game_id, id__in=list(counts)).values_list("id", flat=True)
+    )
+    return {item_id: wins for item_id, wins in counts.items() if item_id in existing_ids}
+
+
+def rebuild_item_stats(game_id: int) -> int:
+    """게임 하나의 카운터를 원본 로그 기준으로 다시 만든다. 반환값은 아이템 수."""
+    counts = count_pick_wins(game_id)
+    with transaction.atomic():
+        # 같은 행의 레이팅은 남겨 두고 승리 수만 바꾼다.
+        WorldcupItemStat.objects.filter(game_id=game_id).exclude(item_id__in=list(counts)).update(
+            wins=0
+        )
+        WorldcupItemStat.objects.bulk_create(
+            [WorldcupItemStat(game_id=game_id, item_id=item_id) for item_id in counts],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+        stats = list(WorldcupItemStat.objects.filter(game_id=game_id, item_id__in=list(counts)))
+        for stat in stats:
+            stat.wins = counts[stat.item_id]
+        WorldcupItemStat.objects.bulk_update(stats, ["wins"], batch_size=1000)
+    return len(counts)
+
+
+def count_matchups(picks) -> dict[tuple[int, int], list[int]]:
+    """(left, right, selected) 목록을 {(작은 ID, 큰 ID): [A 승리, B 승리]} 로 모은다."""
+    counts = defaultdict(lambda: [0, 0])
+    for left_id, right_id, selected_id in picks:
+        if not left_id or not right_id or left_id == right_id:
+            continue
+        if selected_id not in (left_id, right_id):
+            continue
+        item_a, item_b = sorted((left_id, right_id))
+        counts[(item_a, item_b)][0 if selected_id == item_a else 1] += 1
+    return dict(counts)
+
+
+def apply_matchup_counters(game_id: int, picks) -> None:
+    """pick 저장 시 아이템 쌍별 맞대결 결과를 증분 반영한다. picks 는 (left, right, selected)."""
+    counts = count_matchups(picks)
+    if not counts:
+        return
+    # 아이템 통계와 같이 (item_a, item_b) 순서로 먼저 잠그고 메모리에서 더한다.
+    pairs = sorted(counts)
+
+    def _lock(keys):
+        condition = models.Q()
+        for item_a, item_b in keys:
+            condition |= models.Q(item_a_id=item_a, item_b_id=item_b)
+        return {
+            (stat.item_a_id, stat.item_b_id): stat
+            for stat in WorldcupMatchupStat.objects.select_for_update()
+            .filter(condition, game_id=game_id)
+            .order_by("item_a_id", "item_b_id")
+        }
+
+    stats = _lock(pairs)
+    missing = [pair for pair in pairs if pair not in stats]
+    if missing:
+        WorldcupMatchupStat.objects.bulk_create(
+            [
+                WorldcupMatchupStat(game_id=game_id, item_a_id=item_a, item_b_id=item_b)
+                for item_a, item_b in missing
+            ],
+            ignore_conflicts=True,
+        )
+        stats.update(_lock(missing))
+    for pair, (a_delta, b_delta) in counts.items():
+        stats[pair].a_wins += a_delta
+        stats[pair].b_wins += b_delta
+    WorldcupMatchupStat.objects.bulk_update(list(stats.values()), ["a_wins", "b_wins"])
+
+
+def get_matchup(game_id: int, left_item_id: int, right_item_id: int) -> tuple[int, int]:
+    """(왼쪽 승리 수, 오른쪽 승리 수). 맞붙은 적이 없으면 (0, 0)."""
+    item_a, item_b = sorted((left_item_id, right_item_id))
+    row = (
+        WorldcupMatchupStat.objects.filter(game_id=game_id, item_a_id=item_a, item_b_id=item_b)
+        .values_list("a_wins", "b_wins")
+        .first()
+    )
+    a_wins, b_wins = row or (0, 0)
+    if left_item_id == item_a:
+        return a_wins, b_wins
+    return b_wins, a_wins
+
+
+def get_game_matchups(game_id: int) -> dict[tuple[int, int], list[int]]:
+    return {
+        (item_a, item_b): [a_wins, b_wins]
+        for item_a, item_b, a_wins, b_wins in WorldcupMatchupStat.objects.filter(
+            game_id=game_id
+        ).values_list("item_a_id", "item_b_id", "a_wins", "b_wins")
+    }
+
+
+def count_game_matchups(game_id: int, chunk_size: int = 2000) -> dict[tuple[int, int], list[int]]:
+    """원본 pick 로그(행 + 압축 저장분)를 chunk_size 씩 읽어 맞대결 결과를 직접 집계한다."""
+    counts = count_matchups(
+        (pick.left_item_id, pick.right_item_id, pick.selected_item_id)
+        for pick in iter_game_picks(game_id, chunk_size)
+    )
+    # 압축 저장분에는 삭제된 아이템 ID 가 남아 있을 수 있다.
+    existing_ids = set(GameItem.objects.filter(game_id=game_id).values_list("id", flat=True))
+    return {
+        pair: wins
+        for pair, wins in counts.items()
+        if pair[0] in existing_ids and pair[1] in existing_ids
+    }
+
+
+def rebuild_matchup_stats(game_id: int, chunk_size: int = 2000) -> int:
+    """게임 하나의 맞대결 통계를 원본 로그 기준으로 다시 만든다. 반환값은 아이템 쌍 수."""
+    counts = count_game_matchups(game_id, chunk_size)
+    with transaction.atomic():
+        WorldcupMatchupStat.objects.filter(game_id=game_id).delete()
+        WorldcupMatchupStat.objects.bulk_create(
+            [
+                WorldcupMatchupStat(
+                    game_id=game_id,
+                    item_a_id=item_a,
+                    item_b_id=item_b,
+                    a_wins=a_wins,
+                    b_wins=b_wins,
+                )
+                for (item_a, item_b), (a_wins, b_wins) in counts.items()
+            ],
+            batch_size=1000,
+        )
+    return len(counts)
+
+
+def apply_champion_counter(game_id: int, winner_item_id: int | None) -> None:
+    """결과 저장 시 (게임, 우승 아이템) 집계와 게임 결과 합계를 1 올린다. 트랜잭션 안에서 호출한다."""
+    GameResultTotal.objects.bulk_create(
+        [GameResultTotal(game_id=game_id)], ignore_conflicts=True
+    )
+    GameResultTotal.objects.filter(game_id=game_id).update(
+        result_count=models.F("result_count") + 1
+    )
+    if winner_item_id is None:
+        # NULL 은 unique 제약에 걸리지 않으므로 기존 행을 먼저 갱신한다.
+        updated = GameChampionStat.objects.filter(
+            game_id=game_id, winner_item__isnull=True
+        ).update(champion_count=models.F("champion_count") + 1)
+        if not updated:
+            GameChampionStat.objects.create(game_id=game_id, champion_count=1)
+        return
+    GameChampionStat.objects.bulk_create(
+        [GameChampionStat(game_id=game_id, winner_item_id=winner_item_id)],
+        ignore_conflicts=True,
+    )
+    GameChampionStat.objects.filter(game_id=game_id, winner_item_id=winner_item_id).update(
+        champion_count=models.F("champion_count") + 1
+    )
+
+
+def get_champion_counts(game_id: int) -> dict[int | None, int]:
+    """{우승 아이템 ID(미지정은 None): 우승 횟수}"""
+    counts = Counter()
+    for winner_item_id, champion_count in GameChampionStat.objects.filter(
+        game_id=game_id
+    ).values_list("winner_item_id", "champion_count"):
+        counts[winner_item_id] += champion_count
+    return dict(counts)
+
+
+def get_result_total(game_id: int) -> int:
+    return (
+        GameResultTotal.objects.filter(game_id=game_id)
+        .values_list("result_count", flat=True)
+        .first()
+        or 0
+    )
+
+
+def get_champion_share(game_id: int, winner_item_id: int | None) -> dict | None:
+    """우승 아이템이 같은 결과 비율과 백분위(더 드문 우승 아이템을 고른 비율, 동률은 절반).
+
+    게임 합계 1행과 우승 집계 행만 읽으므로 결과 수와 무관하게 일정한 비용이다.
+    """
+    if winner_item_id is None:
+        return None
+    total = get_result_total(game_id)
+    if total <= 0:
+        return None
+    same = (
+        GameChampionStat.objects.filter(game_id=game_id, winner_item_id=winner_item_id)
+        .values_list("champion_count", flat=True)
+        .first()
+        or 0
+    )
+    if same <= 0:
+        return None
+    more_popular = (
+        GameChampionStat.objects.filter(game_id=game_id, champion_count__gt=same).aggregate(
+            total=models.Sum("champion_count")
+        )["total"]
+        or 0
+    )
+    less_popular = max(total - same - more_popular, 0)
+    return {
+        "total_results": total,
+        "same_champion_count": same,
+        "same_champion_percent": round(same * 100 / total, 1),
+        "percentile": round((less_popular + same / 2) * 100 / total, 1),
+    }
+
+
+def count_champions(game_id: int) -> dict[int | None, int]:
+    """원본 결과 테이블에서 우승 아이템별 횟수를 직접 집계한다."""
+    return {
+        row["winner_item_id"]: row["count"]
+        for row in GameResult.objects.filter(game_id=game_id)
+        .values("winner_item_id")
+        .annotate(count=models.Count("id"))
+    }
+
+
+def rebuild_champion_stats(game_id: int) -> int:
+    """게임 하나의 우승 집계를 결과 테이블 기준으로 다시 만든다. 반환값은 행 수."""
+    counts = count_champions(game_id)
+    with transaction.atomic():
+        GameResultTotal.objects.update_or_create(
+            game_id=game_id, defaults={"result_count": sum(counts.values())}
+        )
+        GameChampionStat.objects.filter(game_id=game_id).delete()
+        GameChampionStat.objects.bulk_create(
+            [
+                GameChampionStat(
+                    game_id=game_id, winner_item_id=winner_item_id, champion_count=count
+                )
+                for winner_item_id, count in counts.items()
+            ],
+            batch_size=1000,
+        )
+    return len(counts)
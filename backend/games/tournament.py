@@ -0,0 +1,93 @@
+import base64
+import binascii
+import random
+
+from django.core import signing
+from rest_framework.exceptions import ValidationError
+
+BRACKET_SALT = "games.worldcup.bracket"
+BRACKET_MAX_AGE_SECONDS = 60 * 60 * 24
+MAX_ROUND_SIZE = 64
+
+
+def resolve_round_size(item_count: int, requested: int | None = None) -> int:
+    """아이템 수 안에서 가능한 가장 큰 2의 거듭제곱 강수를 고른다 (최대 64강)."""
+    limit = min(item_count, MAX_ROUND_SIZE)
+    if requested:
+        limit = min(limit, requested)
+    if limit < 2:
+        return 0
+    return 1 << (limit.bit_length() - 1)
+
+
+def build_bracket(item_ids: list[int], round_size: int) -> list[int]:
+    """강수만큼 랜덤으로 뽑아 섞은 대진 순서. (0,1), (2,3) ... 순으로 대결한다."""
+    return random.SystemRandom().sample(list(item_ids), round_size)
+
+
+def sign_bracket(choice_id: int, game_id: int, item_ids: list[int]) -> str:
+    return signing.dumps(
+        {"c": choice_id, "g": game_id, "i": list(item_ids)},
+        salt=BRACKET_SALT,
+        compress=True,
+    )
+
+
+def load_bracket(token: str) -> dict:
+    try:
+        data = signing.loads(token, salt=BRACKET_SALT, max_age=BRACKET_MAX_AGE_SECONDS)
+    except signing.SignatureExpired as exc:
+        raise ValidationError({"bracket_token": "대진표가 만료되었습니다."}) from exc
+    except signing.BadSignature as exc:
+        raise ValidationError({"bracket_token": "대진표가 올바르지 않습니다."}) from exc
+    return {"choice_id": data["c"], "game_id": data["g"], "item_ids": data["i"]}
+
+
+def encode_pick_bits(bits: list[int]) -> str:
+    """경기 순서대로 0(왼쪽 승)/1(오른쪽 승) 비트를 base64url 문자열로 만든다."""
+    packed = bytearray((len(bits) + 7) // 8)
+    for index, bit in enumerate(bits):
+        if bit:
+            packed[index >> 3] |= 1 << (index & 7)
+    return base64.urlsafe_b64encode(bytes(packed)).decode("ascii").rstrip("=")
+
+
+def decode_pick_bits(encoded: str, match_count: int) -> list[int]:
+    padded = encoded + "=" * (-len(encoded) % 4)
+    try:
+        packed = base64.urlsafe_b64decode(padded.encode("ascii"))
+    except (binascii.Error, UnicodeEncodeError, ValueError) as exc:
+        raise ValidationError({"picks": "pick 인코딩이 올바르지 않습니다."}) from exc
+    if len(packed) != (match_count + 7) // 8:
+        raise ValidationError({"picks": "pick 개수가 대진표와 일치하지 않습니다."})
+    bits = [(packed[index >> 3] >> (index & 7)) & 1 for index in range(match_count)]
+    tail_bits = len(packed) * 8 - match_count
+    if tail_bits and packed[-1] >> (8 - tail_bits):
+        raise ValidationError({"picks": "pick 개수가 대진표와 일치하지 않습니다."})
+    return bits
+
+
+def expand_bracket(item_ids: list[int], bits: list[int]) -> tuple[list[dict], int]:
+    """대진표와 비트열로 경기별 pick 목록과 우승 아이템을 복원한다."""
+    if len(bits) != len(item_ids) - 1:
+        raise ValidationError({"picks": "pick 개수가 대진표와 일치하지 않습니다."})
+    picks = []
+    entrants = list(item_ids)
+    step = 0
+    while len(entrants) > 1:
+        winners = []
+        for index in range(0, len(entrants), 2):
+            left_id, right_id = entrants[index], entrants[index + 1]
+            selected_id = right_id if bits[step] else left_id
+            picks.append(
+                {
+                    "left_item_id": left_id,
+                    "right_item_id": right_id,
+                    "selected_item_id": selected_id,
+                    "step_index": step,
+                }
+            )
+            winners.append(selected_id)
+            step += 1
+        entrants = winners
+    return picks, entrants[0]
@@ -7,7 +7,10 @@ from .views import (
     GameResultCreateView,
     GameResultDetailView,
     WorldcupPickLogCreateView,
+    WorldcupPickLogBatchCreateView,
     WorldcupPickSummaryView,
+    WorldcupMatchupView,
+    WorldcupTournamentSubmitView,
     WorldcupCreateView,
     PsychoTemplateSaveView,
     BannerListView,
@@ -26,7 +29,9 @@ from .views import (
     AdminGameUpdateView,
     AdminGameChoiceLogListView,
     AdminGameResultListView,
+    AdminGameActivityView,
     AdminWorldcupPickLogListView,
+    AdminLogExportView,
     AdminGameEditRequestListView,
     AdminGameEditRequestDetailView,
     AdminGameEditRequestApproveView,
@@ -48,7 +53,18 @@ urlpatterns = [
     path("<int:game_id>/", GameDetailView.as_view(), name="detail"),
     path("session/", GameChoiceLogCreateView.as_view(), name="session_create"),
     path("worldcup/pick/", WorldcupPickLogCreateView.as_view(), name="worldcup_pick_create"),
+    path(
+        "worldcup/pick/batch/",
+        WorldcupPickLogBatchCreateView.as_view(),
+        name="worldcup_pick_batch_create",
+    ),
     path("worldcup/pick/summary/", WorldcupPickSummaryView.as_view(), name="worldcup_pick_summary"),
+    path("worldcup/matchup/", WorldcupMatchupView.as_view(), name="worldcup_matchup"),
+    path(
+        "worldcup/tournament/submit/",
+        WorldcupTournamentSubmitView.as_view(),
+        name="worldcup_tournament_submit",
+    ),
     path("worldcup/create/", WorldcupCreateView.as_view(), name="worldcup_create"),
     path("worldcup/drafts/", WorldcupDraftListView.as_view(), name="worldcup_drafts"),
     path(
@@ -71,7 +87,9 @@ urlpatterns = [
     path("admin/games/<int:game_id>/delete/", AdminGameDeleteView.as_view(), name="admin_games_delete"),
     path("admin/logs/choices/", AdminGameChoiceLogListView.as_view(), name="admin_logs_choice"),
     path("admin/logs/picks/", AdminWorldcupPickLogListView.as_view(), name="admin_logs_pick"),
+    path("admin/logs/export/", AdminLogExportView.as_view(), name="admin_logs_export"),
     path("admin/results/", AdminGameResultListView.as_view(), name="admin_results_list"),
+    path("admin/activity/", AdminGameActivityView.as_view(), name="admin_activity"),
     path("admin/edit-requests/", AdminGameEditRequestListView.as_view(), name="admin_edit_requests"),
     path("admin/edit-requests/<int:request_id>/", AdminGameEditRequestDetailView.as_view(), name="admin_edit_requests_detail"),
     path("admin/edit-requests/approve/", AdminGameEditRequestApproveView.as_view(), name="admin_edit_requests_approve"),
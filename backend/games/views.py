@@ -1,17 +1,31 @@
 import os
+import math
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from urllib.parse import urlparse
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
 from django.db import models, transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from django.utils.text import slugify
+from config.pagination import (
+    KeysetPage,
+    date_range_filters,
+    decode_time_cursor,
+    encode_cursor,
+    keyset_paginate,
+    parse_page_size,
+)
 from config.views import BaseAPIView
+from . import blob_store
 from .models import (
     Game,
+    GameActivityGranularity,
+    GameActivityRollup,
     GameChoiceLog,
     GameItem,
     GameItemSourceType,
@@ -22,6 +36,7 @@ from .models import (
     GameEditRequestAction,
     GameResult,
     GameStatus,
+    GameType,
     GameVisibility,
     Banner,
     BannerLinkType,
@@ -45,8 +60,53 @@ from .serializers import (
     BannerSerializer,
     AdminBannerSerializer,
     WorldcupPickLogCreateSerializer,
+    WorldcupPickBatchCreateSerializer,
+    WorldcupPickEntrySerializer,
+    WorldcupTournamentSubmitSerializer,
+)
+from .catalog import CATALOG_MAX_PAGE_SIZE, get_catalog, page_catalog
+from .embedded_images import extract_embedded_images
+from .exports import (
+    EXPORT_FORMATS,
+    build_export_filters,
+    get_export_fields,
+    iter_export_rows,
+    render_export,
+)
+from .atlas import schedule_atlas_build
+from .drafts import active_drafts
+from .image_validation import validate_image_file, validate_image_urls
+from .image_variants import (
+    BANNER_IMAGE_FIELDS,
+    GAME_THUMBNAIL_FIELDS,
+    ITEM_IMAGE_FIELDS,
+    clear_image_fields,
+    media_relative_path,
+    schedule_banner_variants,
+    schedule_game_images,
+)
+from .item_diff import apply_item_diff, diff_items
+from .json_documents import invalidate_json_document, json_document_response
+from .pick_store import count_choice_wins, page_picks, write_picks
+from .stats import (
+    apply_champion_counter,
+    apply_matchup_counters,
+    apply_pick_stats,
+    get_champion_counts,
+    get_champion_share,
+    get_item_wins,
+    get_matchup,
+)
+from .rollups import ROLLUP_FIELDS, get_processed_until
+from .ratings import ELO_BASE_RATING, get_item_ratings
+from .tournament import (
+    build_bracket,
+    decode_pick_bits,
+    expand_bracket,
+    load_bracket,
+    resolve_round_size,
+    sign_bracket,
 )
-from .image_validation import validate_image_file, validate_image_url
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, MultiPartParser, JSONParser
@@ -88,6 +148,10 @@ def _resolve_frontend_json_path(normalized: str) -> str:
     return abs_path
 
 
+# 월드컵 생성 시 파일을 동시에 저장하는 스레드 수
+MEDIA_STAGE_MAX_WORKERS = 8
+
+
 def _cleanup_media_prefix(prefix: str | None) -> None:
     if not prefix:
         return
@@ -103,9 +167,18 @@ class GameListView(BaseAPIView):
     api_name = "games.list"
     
     def get(self, request, *args, **kwargs):
-        qs = Game.objects.filter(status="ACTIVE", visibility="PUBLIC")
-        serializer = GameListSerializer(qs, many=True)
-        return self.respond(data={"games": serializer.data})
+        game_type = request.query_params.get("type") or None
+        if game_type and game_type not in GameType.values:
+            raise ValidationError({"type": "올바른 게임 타입이 아닙니다."})
+        cursor = request.query_params.get("cursor")
+        if not cursor and not request.query_params.get("page_size"):
+            return self.respond(data={"games": get_catalog(game_type)})
+        cursor_key = decode_time_cursor(cursor) if cursor else None
+        page_size = min(parse_page_size(request, default=20), CATALOG_MAX_PAGE_SIZE)
+        games, next_key = page_catalog(game_type, cursor_key, page_size)
+        next_cursor = encode_cursor([next_key[0].isoformat(), next_key[1]]) if next_key else None
+        page = KeysetPage(games, page_size, next_cursor, has_previous=bool(cursor))
+        return self.respond_paginated(page=page, data={"games": games})
 
 
 class TodayPickView(BaseAPIView):
@@ -146,6 +219,19 @@ class GameChoiceLogCreateView(BaseAPIView):
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
         game = get_object_or_404(Game, pk=data["game_id"])
+        bracket_item_ids = None
+        if data.get("mode") == "tournament":
+            if game.type != GameType.WORLD_CUP:
+                raise ValidationError({"mode": "월드컵 게임만 토너먼트 모드를 지원합니다."})
+            item_ids = list(
+                game.items.filter(is_active=True)
+                .order_by("sort_order", "id")
+                .values_list("id", flat=True)
+            )
+            round_size = resolve_round_size(len(item_ids), data.get("round_size"))
+            if not round_size:
+                raise ValidationError({"game_id": "아이템은 최소 2개 필요합니다."})
+            bracket_item_ids = build_bracket(item_ids, round_size)
         session = GameChoiceLog.objects.create(
             game=game,
             user=request.user if request.user.is_authenticated else None,
@@ -155,9 +241,68 @@ class GameChoiceLogCreateView(BaseAPIView):
             user_agent=request.META.get("HTTP_USER_AGENT", ""),
             ip_address=request.META.get("REMOTE_ADDR", ""),
         )
-        return self.respond(
-            data={"session_id": session.id},
-        )
+        response_data = {"session_id": session.id}
+        if bracket_item_ids is not None:
+            response_data["bracket"] = {
+                "round_size": len(bracket_item_ids),
+                "item_ids": bracket_item_ids,
+                "token": sign_bracket(session.id, game.id, bracket_item_ids),
+            }
+        return self.respond(data=response_data)
+
+
+RANKING_SORT_WINS = "wins"
+RANKING_SORT_RATING = "rating"
+
+
+def _parse_ranking_sort(request) -> str:
+    sort = request.query_params.get("sort") or RANKING_SORT_WINS
+    if sort not in (RANKING_SORT_WINS, RANKING_SORT_RATING):
+        raise ValidationError({"sort": "sort는 wins 또는 rating 이어야 합니다."})
+    return sort
+
+
+def _build_worldcup_ranking(
+    items, counts: dict[int, int], ratings: dict[int, float] | None = None
+) -> list[dict]:
+    """ratings 를 주면 각 항목에 rating 을 넣고 레이팅 순으로 정렬한다."""
+    ranking = [
+        {
+            "id": item.id,
+            "name": item.name,
+            "file_name": item.file_name or "",
+            "sort_order": item.sort_order,
+            "wins": int(counts.get(item.id, 0) or 0),
+        }
+        for item in items
+    ]
+    if ratings is None:
+        ranking.sort(key=lambda entry: (-entry["wins"], entry["sort_order"], entry["id"]))
+        return ranking
+    for entry in ranking:
+        entry["rating"] = round(ratings.get(entry["id"], ELO_BASE_RATING), 1)
+    ranking.sort(
+        key=lambda entry: (-entry["rating"], -entry["wins"], entry["sort_order"], entry["id"])
+    )
+    return ranking
+
+
+def _worldcup_round_count(total_items: int) -> int:
+    if total_items <= 0:
+        return 0
+    return int(math.ceil(math.log2(total_items)))
+
+
+def _record_worldcup_picks(choice, game, picks: list[dict]) -> None:
+    """검증된 pick 목록을 한 번에 저장하고 카운터를 갱신한다. 트랜잭션 안에서 호출한다."""
+    write_picks(choice, game, picks)
+    matches = [
+        (pick.get("left_item_id"), pick.get("right_item_id"), pick.get("selected_item_id"))
+        for pick in sorted(picks, key=lambda entry: entry["step_index"])
+    ]
+    # 아이템 통계 → 맞대결 통계 순서로 잠근다.
+    apply_pick_stats(game.id, matches)
+    apply_matchup_counters(game.id, matches)
 
 
 class WorldcupPickLogCreateView(BaseAPIView):
@@ -167,17 +312,47 @@ class WorldcupPickLogCreateView(BaseAPIView):
         serializer = WorldcupPickLogCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
-        pick = WorldcupPickLog.objects.create(
-            choice=data["choice"],
-            game=data["game"],
-            left_item=data.get("left_item"),
-            right_item=data.get("right_item"),
-            selected_item=data.get("selected_item"),
-            step_index=data["step_index"],
-        )
+        with transaction.atomic():
+            pick = WorldcupPickLog.objects.create(
+                choice=data["choice"],
+                game=data["game"],
+                left_item=data.get("left_item"),
+                right_item=data.get("right_item"),
+                selected_item=data.get("selected_item"),
+                step_index=data["step_index"],
+            )
+            matches = [(pick.left_item_id, pick.right_item_id, pick.selected_item_id)]
+            apply_pick_stats(pick.game_id, matches)
+            apply_matchup_counters(pick.game_id, matches)
         return self.respond(data={"pick_id": pick.id})
 
 
+class WorldcupPickLogBatchCreateView(BaseAPIView):
+    api_name = "games.worldcup.pick.batch_create"
+
+    def post(self, request, *args, **kwargs):
+        serializer = WorldcupPickBatchCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        choice = data["choice"]
+        game = data["game"]
+        context = {"item_ids": data["item_ids"]}
+
+        picks = []
+        errors = []
+        for index, raw_pick in enumerate(data["picks"]):
+            entry = WorldcupPickEntrySerializer(data=raw_pick, context=context)
+            if not entry.is_valid():
+                # 잘못된 pick만 건너뛰고 나머지는 그대로 저장한다.
+                errors.append({"index": index, "errors": entry.errors})
+                continue
+            picks.append(entry.validated_data)
+        if picks:
+            with transaction.atomic():
+                _record_worldcup_picks(choice, game, picks)
+        return self.respond(data={"created": len(picks), "errors": errors})
+
+
 class WorldcupPickSummaryView(BaseAPIView):
     api_name = "games.worldcup.pick.summary"
 
@@ -195,43 +370,26 @@ class WorldcupPickSummaryView(BaseAPIView):
             choice_id_value = int(choice_id) if choice_id else None
         except (TypeError, ValueError):
             raise ValidationError({"choice_id": "choice_id는 숫자여야 합니다."})
+        sort = _parse_ranking_sort(request)
 
-        logs = WorldcupPickLog.objects.select_related("game").filter(game_id=game_id_value)
         if choice_id_value is not None:
-            logs = logs.filter(choice_id=choice_id_value)
-
-        if not logs.exists():
-            return self.respond(data={"summary": None})
+            # 세션 하나의 pick은 수십 건이므로 원본 로그에서 바로 집계한다.
+            counts = count_choice_wins(game_id_value, choice_id_value)
+            if counts is None:
+                return self.respond(data={"summary": None})
+        else:
+            counts = get_item_wins(game_id_value)
+            if not counts:
+                return self.respond(data={"summary": None})
 
         game = get_object_or_404(Game, id=game_id_value)
         items = list(game.items.all().order_by("sort_order", "id"))
-
-        counts = {
-            row["selected_item_id"]: row["wins"]
-            for row in logs.values("selected_item_id")
-            .exclude(selected_item_id__isnull=True)
-            .annotate(wins=models.Count("id"))
-        }
-
-        ranking = [
-            {
-                "id": item.id,
-                "name": item.name,
-                "file_name": item.file_name or "",
-                "sort_order": item.sort_order,
-                "wins": int(counts.get(item.id, 0) or 0),
-            }
-            for item in items
-        ]
-        ranking.sort(key=lambda entry: (-entry["wins"], entry["sort_order"], entry["id"]))
+        ratings = get_item_ratings(game.id) if sort == RANKING_SORT_RATING else None
+        ranking = _build_worldcup_ranking(items, counts, ratings)
 
         champion = ranking[0] if ranking else None
         total_items = len(items)
-        round_count = 0
-        if total_items > 0:
-            import math
-
-            round_count = int(math.ceil(math.log2(total_items)))
+        round_count = _worldcup_round_count(total_items)
 
         return self.respond(
             data={
@@ -247,6 +405,113 @@ class WorldcupPickSummaryView(BaseAPIView):
         )
 
 
+class WorldcupMatchupView(BaseAPIView):
+    api_name = "games.worldcup.matchup"
+
+    def get(self, request, *args, **kwargs):
+        values = {}
+        for field in ("game_id", "left_item_id", "right_item_id"):
+            raw_value = request.query_params.get(field)
+            if not raw_value:
+                raise ValidationError({field: f"{field}가 필요합니다."})
+            try:
+                values[field] = int(raw_value)
+            except (TypeError, ValueError):
+                raise ValidationError({field: f"{field}는 숫자여야 합니다."})
+        if values["left_item_id"] == values["right_item_id"]:
+            raise ValidationError({"right_item_id": "서로 다른 아이템이어야 합니다."})
+
+        left_wins, right_wins = get_matchup(
+            values["game_id"], values["left_item_id"], values["right_item_id"]
+        )
+        total = left_wins + right_wins
+
+        def _side(item_id: int, wins: int) -> dict:
+            return {
+                "id": item_id,
+                "wins": wins,
+                "percent": round(wins * 100 / total, 1) if total else None,
+            }
+
+        return self.respond(
+            data={
+                "total": total,
+                "left": _side(values["left_item_id"], left_wins),
+                "right": _side(values["right_item_id"], right_wins),
+            }
+        )
+
+
+class WorldcupTournamentSubmitView(BaseAPIView):
+    api_name = "games.worldcup.tournament.submit"
+
+    def post(self, request, *args, **kwargs):
+        serializer = WorldcupTournamentSubmitSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        bracket = load_bracket(data["bracket_token"])
+        if bracket["choice_id"] != data["choice_id"]:
+            raise ValidationError({"bracket_token": "세션과 대진표가 일치하지 않습니다."})
+
+        item_ids = bracket["item_ids"]
+        bits = decode_pick_bits(data["picks"], len(item_ids) - 1)
+        picks, winner_id = expand_bracket(item_ids, bits)
+
+        with transaction.atomic():
+            choice = (
+                GameChoiceLog.objects.select_for_update()
+                .select_related("game")
+                .filter(id=data["choice_id"], game_id=bracket["game_id"])
+                .first()
+            )
+            if not choice:
+                raise ValidationError({"choice_id": "선택 로그를 찾을 수 없습니다."})
+            if GameResult.objects.filter(choice_id=choice.id).exists():
+                raise ValidationError({"choice_id": "이미 결과가 등록된 선택 로그입니다."})
+            game = choice.game
+            items = {
+                item.id: item
+                for item in GameItem.objects.filter(game_id=game.id, id__in=item_ids)
+            }
+            if len(items) != len(item_ids):
+                raise ValidationError({"bracket_token": "대진표의 아이템이 변경되었습니다."})
+
+            _record_worldcup_picks(choice, game, picks)
+
+            winner = items[winner_id]
+            payload = data.get("result_payload")
+            payload_dict = dict(payload) if isinstance(payload, dict) else {}
+            # 우승자와 라운드는 대진표에서 계산한 값으로 덮어쓴다. 결과 화면이 이 payload 를 읽는다.
+            payload_dict["round"] = len(item_ids)
+            payload_dict["champion"] = {
+                "id": winner.id,
+                "name": winner.name,
+                "file_name": winner.file_name,
+                "sort_order": winner.sort_order,
+            }
+            result = GameResult.objects.create(
+                choice=choice,
+                game=game,
+                winner_item=winner,
+                result_title=data.get("result_title") or f"{game.title} 우승",
+                result_code="WORLD_CUP",
+                share_url=data.get("share_url", ""),
+                result_payload=payload_dict,
+            )
+            apply_champion_counter(game.id, winner.id)
+            if not choice.finished_at:
+                choice.finished_at = timezone.now()
+                choice.save(update_fields=["finished_at"])
+
+        return self.respond(
+            data={
+                "result_id": result.id,
+                "winner_item_id": winner.id,
+                "pick_count": len(picks),
+            }
+        )
+
+
 class GameResultCreateView(BaseAPIView):
     api_name = "games.result.create"
 
@@ -254,19 +519,21 @@ class GameResultCreateView(BaseAPIView):
         serializer = GameResultCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
-        result = GameResult.objects.create(
-            choice=data["choice"],
-            game=data["game"],
-            winner_item=data.get("winner_item"),
-            result_title=data["result_title"],
-            result_code=data.get("result_code", ""),
-            result_image_url=data.get("result_image_url", ""),
-            share_url=data.get("share_url", ""),
-            result_payload=data.get("result_payload"),
-        )
-        if not result.choice.finished_at:
-            result.choice.finished_at = timezone.now()
-            result.choice.save(update_fields=["finished_at"])
+        with transaction.atomic():
+            result = GameResult.objects.create(
+                choice=data["choice"],
+                game=data["game"],
+                winner_item=data.get("winner_item"),
+                result_title=data["result_title"],
+                result_code=data.get("result_code", ""),
+                result_image_url=data.get("result_image_url", ""),
+                share_url=data.get("share_url", ""),
+                result_payload=data.get("result_payload"),
+            )
+            apply_champion_counter(result.game_id, result.winner_item_id)
+            if not result.choice.finished_at:
+                result.choice.finished_at = timezone.now()
+                result.choice.save(update_fields=["finished_at"])
         return self.respond(data={"result_id": result.id})
 
 
@@ -281,6 +548,7 @@ class GameResultDetailView(BaseAPIView):
             choice_id_value = int(choice_id)
         except (TypeError, ValueError):
             raise ValidationError({"choice_id": "choice_id는 숫자여야 합니다."})
+        sort = _parse_ranking_sort(request)
 
         result = (
             GameResult.objects.select_related("game", "winner_item")
@@ -295,31 +563,11 @@ class GameResultDetailView(BaseAPIView):
         payload = data.get("result_payload")
         if result.game.type == "WORLD_CUP":
             payload_dict = payload if isinstance(payload, dict) else {}
-            logs = WorldcupPickLog.objects.select_related("game").filter(game_id=result.game_id)
             items = list(result.game.items.all().order_by("sort_order", "id"))
-            counts = {
-                row["selected_item_id"]: row["wins"]
-                for row in logs.values("selected_item_id")
-                .exclude(selected_item_id__isnull=True)
-                .annotate(wins=models.Count("id"))
-            }
-            ranking = [
-                {
-                    "id": item.id,
-                    "name": item.name,
-                    "file_name": item.file_name or "",
-                    "sort_order": item.sort_order,
-                    "wins": int(counts.get(item.id, 0) or 0),
-                }
-                for item in items
-            ]
-            ranking.sort(key=lambda entry: (-entry["wins"], entry["sort_order"], entry["id"]))
+            ratings = get_item_ratings(result.game_id) if sort == RANKING_SORT_RATING else None
+            ranking = _build_worldcup_ranking(items, get_item_wins(result.game_id), ratings)
             total_items = len(items)
-            round_count = 0
-            if total_items > 0:
-                import math
-
-                round_count = int(math.ceil(math.log2(total_items)))
+            round_count = _worldcup_round_count(total_items)
             if not payload_dict.get("total_items"):
                 payload_dict["total_items"] = total_items
             if not payload_dict.get("round"):
@@ -327,6 +575,9 @@ class GameResultDetailView(BaseAPIView):
             if not payload_dict.get("champion"):
                 payload_dict["champion"] = ranking[0] if ranking else None
             payload_dict["ranking"] = ranking
+            payload_dict["champion_share"] = get_champion_share(
+                result.game_id, result.winner_item_id
+            )
             data["result_payload"] = payload_dict
         return self.respond(data={"result": data})
 
@@ -355,6 +606,7 @@ class PsychoTemplateSaveView(BaseAPIView):
         if not isinstance(content, dict):
             raise ValidationError({"content": "JSON 객체만 저장할 수 있습니다."})
 
+        content, _ = extract_embedded_images(content)
         content["slug"] = safe_slug
         if not content.get("game_slug"):
             content["game_slug"] = safe_slug
@@ -365,6 +617,7 @@ class PsychoTemplateSaveView(BaseAPIView):
         os.makedirs(os.path.dirname(frontend_path), exist_ok=True)
         with open(frontend_path, "w", encoding="utf-8") as handle:
             json.dump(content, handle, ensure_ascii=False, indent=2)
+        invalidate_json_document(frontend_path)
 
         return self.respond(data={"path": normalized, "slug": safe_slug})
 
@@ -378,9 +631,7 @@ class GameJsonReadView(BaseAPIView):
         frontend_path = _resolve_frontend_json_path(normalized)
         if not os.path.exists(frontend_path):
             raise ValidationError({"path": f"파일이 없습니다: {normalized}"})
-        with open(frontend_path, "r", encoding="utf-8") as handle:
-            content = json.load(handle)
-        return self.respond(data={"path": normalized, "content": content})
+        return json_document_response(request, frontend_path, normalized, self.api_name)
 
 
 def _require_staff(view, request):
@@ -436,7 +687,8 @@ class WorldcupCreateView(BaseAPIView):
     api_name = "games.worldcup.create"
     parser_classes = (MultiPartParser, FormParser)
 
-    def _parse_items(self, request):
+    def _parse_items(self, request, image_urls: dict):
+        """image_urls 에 검증할 {필드명: URL} 을 모아 둔다. 검증은 validate_image_urls 로 한 번에."""
         items = []
         index = 0
         while True:
@@ -450,7 +702,7 @@ class WorldcupCreateView(BaseAPIView):
             if image is not None:
                 validate_image_file(image, f"items[{index}].image")
             elif image_url:
-                validate_image_url(image_url, f"items[{index}].image_url")
+                image_urls[f"items[{index}].image_url"] = image_url
             items.append((name or "", image, image_url))
             index += 1
         return items
@@ -481,7 +733,7 @@ class WorldcupCreateView(BaseAPIView):
         safe_base = slugify(base) or fallback
         safe_ext = ext.lower() or ".jpg"
         filename = f"{safe_base}{safe_ext}"
-        saved_path = storage.save(f"{storage_prefix}{filename}", file_obj)
+        saved_path = blob_store.save_file(storage, f"{storage_prefix}{filename}", file_obj)
         return storage.url(saved_path)
 
     def _copy_from_media_url(self, storage, storage_prefix: str, media_url: str) -> str:
@@ -499,18 +751,40 @@ class WorldcupCreateView(BaseAPIView):
         safe_base = slugify(base) or "item"
         safe_ext = ext.lower() or ".jpg"
         filename = f"{safe_base}{safe_ext}"
-        dest_rel = f"{storage_prefix}{filename}"
-        dest_abs = os.path.join(settings.MEDIA_ROOT, dest_rel)
-        os.makedirs(os.path.dirname(dest_abs), exist_ok=True)
-        shutil.copy2(source_path, dest_abs)
+        # 같은 파일에 대한 하드링크라 복사 비용이 들지 않는다.
+        dest_rel = blob_store.link_into(storage, source_path, f"{storage_prefix}{filename}")
         return storage.url(dest_rel)
 
+    def _stage_files(self, storage, storage_prefix: str, items, thumbnail, thumbnail_url):
+        """아이템/썸네일 파일을 storage_prefix 에 병렬로 저장하고 (아이템 URL 목록, 썸네일 URL) 을 돌려준다."""
+
+        def stage(file_obj, media_url, fallback):
+            if file_obj is not None:
+                return self._save_file(storage, storage_prefix, file_obj, fallback)
+            if media_url:
+                return self._copy_from_media_url(storage, storage_prefix, media_url)
+            raise ValidationError({"items": "아이템 이미지가 필요합니다."})
+
+        jobs = [
+            (image, image_url, f"item-{sort_order + 1}")
+            for sort_order, (_, image, image_url) in enumerate(items)
+        ]
+        if thumbnail is not None or thumbnail_url:
+            jobs.append((thumbnail, thumbnail_url, "thumbnail"))
+        with ThreadPoolExecutor(max_workers=min(MEDIA_STAGE_MAX_WORKERS, len(jobs))) as executor:
+            futures = [executor.submit(stage, *job) for job in jobs]
+        # 모든 작업이 끝난 뒤에 첫 에러를 올려서 정리할 때 쓰는 중인 파일이 없게 한다.
+        urls = [future.result() for future in futures]
+        item_urls = urls[: len(items)]
+        return item_urls, urls[len(items)] if len(urls) > len(items) else item_urls[0]
+
     def post(self, request, *args, **kwargs):
         title = (request.data.get("title") or "").strip()
         if not title:
             raise ValidationError({"title": "게임 제목을 입력해 주세요."})
         description = (request.data.get("description") or "").strip()
-        items = self._parse_items(request)
+        image_urls = {}
+        items = self._parse_items(request, image_urls)
         if len(items) < 2:
             raise ValidationError({"items": "아이템은 최소 2개 필요합니다."})
 
@@ -519,7 +793,8 @@ class WorldcupCreateView(BaseAPIView):
         if thumbnail is not None:
             validate_image_file(thumbnail, "thumbnail")
         elif thumbnail_url:
-            validate_image_url(thumbnail_url, "thumbnail_url")
+            image_urls["thumbnail_url"] = thumbnail_url
+        validate_image_urls(image_urls)
 
         slug = self._build_unique_slug(title)
         storage_prefix = f"worldcup/{slug}/"
@@ -527,75 +802,57 @@ class WorldcupCreateView(BaseAPIView):
             location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL
         )
 
-        with transaction.atomic():
-            game = Game.objects.create(
-                title=title,
-                description=description,
-                slug=slug,
-                type="WORLD_CUP",
-                status="ACTIVE",
-                created_by=request.user if request.user.is_authenticated else None,
-                is_official=bool(request.user.is_authenticated and request.user.is_staff),
-                visibility="PRIVATE",
-                thumbnail_image_url="",
-                storage_prefix=storage_prefix,
+        # 파일은 트랜잭션 밖에서 병렬로 먼저 저장하고, 트랜잭션에서는 행만 넣는다.
+        try:
+            item_urls, thumbnail_url = self._stage_files(
+                storage, storage_prefix, items, thumbnail, thumbnail_url
             )
-
-            GameItem = game.items.model
-            item_urls = []
-            for sort_order, (name, image, image_url) in enumerate(items):
-                if image is not None:
-                    url = self._save_file(
-                        storage, storage_prefix, image, f"item-{sort_order + 1}"
-                    )
-                elif image_url:
-                    url = self._copy_from_media_url(storage, storage_prefix, image_url)
-                else:
-                    raise ValidationError({"items": "아이템 이미지가 필요합니다."})
-                item_urls.append(url)
-                GameItem.objects.create(
-                    game=game,
-                    name=name,
-                    file_name=url,
-                    sort_order=sort_order,
-                    uploaded_by=request.user if request.user.is_authenticated else None,
-                    source_type=(
-                        GameItemSourceType.OFFICIAL
-                        if request.user.is_authenticated and request.user.is_staff
-                        else GameItemSourceType.USER_UPLOAD
-                    ),
+            user = request.user if request.user.is_authenticated else None
+            is_staff = bool(user and user.is_staff)
+            with transaction.atomic():
+                game = Game.objects.create(
+                    title=title,
+                    description=description,
+                    slug=slug,
+                    type="WORLD_CUP",
+                    status="ACTIVE",
+                    created_by=user,
+                    is_official=is_staff,
+                    visibility="PRIVATE",
+                    thumbnail_image_url=thumbnail_url,
+                    storage_prefix=storage_prefix,
                 )
-
-            if thumbnail is not None:
-                thumbnail_url = self._save_file(
-                    storage, storage_prefix, thumbnail, "thumbnail"
+                GameItem.objects.bulk_create(
+                    [
+                        GameItem(
+                            game=game,
+                            name=name,
+                            file_name=url,
+                            sort_order=sort_order,
+                            uploaded_by=user,
+                            source_type=(
+                                GameItemSourceType.OFFICIAL
+                                if is_staff
+                                else GameItemSourceType.USER_UPLOAD
+                            ),
+                        )
+                        for sort_order, ((name, _, _), url) in enumerate(zip(items, item_urls))
+                    ]
                 )
-            elif thumbnail_url:
-                thumbnail_url = self._copy_from_media_url(storage, storage_prefix, thumbnail_url)
-            else:
-                thumbnail_url = item_urls[0]
+        except Exception:
+            _cleanup_media_prefix(storage_prefix)
+            raise
 
-            game.thumbnail_image_url = thumbnail_url
-            game.save(update_fields=["thumbnail_image_url"])
+        # 리사이즈 이미지는 응답 뒤에 만든다. 그 전까지 화면은 원본 URL 을 쓴다.
+        schedule_game_images(game.id, thumbnail=True)
 
+        # 드래프트 폴더는 sweep_media_prefixes 가 고아 prefix 로 정리한다.
         draft_id = request.data.get("draft_id")
         if draft_id and request.user.is_authenticated:
-            draft = WorldcupDraft.objects.filter(id=draft_id, user=request.user).first()
-            if draft and draft.draft_prefix:
-                draft_path = os.path.join(settings.MEDIA_ROOT, draft.draft_prefix)
-                if os.path.isdir(draft_path):
-                    shutil.rmtree(draft_path, ignore_errors=True)
             WorldcupDraft.objects.filter(id=draft_id, user=request.user).delete()
         else:
             draft_code = request.data.get("draft_code")
             if draft_code and request.user.is_authenticated:
-                draft = WorldcupDraft.objects.filter(
-                    draft_code=draft_code, user=request.user
-                ).first()
-                if draft and draft.draft_prefix:
-                    draft_path = os.path.join(settings.MEDIA_ROOT, draft.draft_prefix)
-                    if os.path.isdir(draft_path):
-                        shutil.rmtree(draft_path, ignore_errors=True)
                 WorldcupDraft.objects.filter(
                     draft_code=draft_code, user=request.user
                 ).delete()
@@ -619,16 +876,6 @@ class WorldcupDraftView(BaseAPIView):
             raise ValidationError("로그인이 필요합니다.")
         return request.user
 
-    def _cleanup_old_drafts(self, user):
-        cutoff = timezone.now() - timedelta(days=1)
-        old_drafts = WorldcupDraft.objects.filter(user=user, updated_at__lt=cutoff)
-        for draft in old_drafts:
-            if draft.draft_prefix:
-                draft_path = os.path.join(settings.MEDIA_ROOT, draft.draft_prefix)
-                if os.path.isdir(draft_path):
-                    shutil.rmtree(draft_path, ignore_errors=True)
-        old_drafts.delete()
-
     def _generate_draft_code(self):
         return f"draft_{uuid.uuid4().hex[:12]}"
 
@@ -638,52 +885,132 @@ class WorldcupDraftView(BaseAPIView):
             code = self._generate_draft_code()
         return code
 
-    def _save_draft_files(self, user, request):
-        draft_prefix = f"worldcup/drafts/{user.id}/{uuid.uuid4().hex}/"
+    def _draft_file_key(self, url: str) -> str:
+        return media_relative_path(url) or url
+
+    def _known_draft_files(self, payload: dict) -> dict[str, tuple[str, str]]:
+        """기존 payload 의 이미지. {정규화한 경로: (저장된 URL, sha256 또는 "")}"""
+        entries = [(payload.get("thumbnail_url"), payload.get("thumbnail_hash"))]
+        entries.extend(
+            (item.get("image_url"), item.get("image_hash"))
+            for item in payload.get("items") or []
+        )
+        known = {}
+        for url, digest in entries:
+            if not url:
+                continue
+            relative_path = media_relative_path(url)
+            if relative_path and not os.path.exists(os.path.join(settings.MEDIA_ROOT, relative_path)):
+                continue
+            key = self._draft_file_key(url)
+            if key not in known or digest:
+                known[key] = (url, digest or "")
+        return known
+
+    def _remove_draft_files(self, relative_paths) -> None:
+        for relative_path in relative_paths:
+            try:
+                os.unlink(os.path.join(settings.MEDIA_ROOT, relative_path))
+            except FileNotFoundError:
+                pass
+
+    def _save_draft_files(self, user, request, existing=None):
+        """바뀐 이미지만 저장하고 기존 payload 를 패치한다.
+
+        기존 드래프트의 이미지와 URL 이 같거나 업로드 내용(sha256)이 같으면 다시 검증하거나
+        쓰지 않는다. (prefix, payload, 새로 쓴 경로, 더 이상 쓰지 않는 경로) 를 돌려준다.
+        """
+        previous = (existing.payload if existing else None) or {}
+        draft_prefix = (
+            existing.draft_prefix if existing else ""
+        ) or f"worldcup/drafts/{user.id}/{uuid.uuid4().hex}/"
         storage = FileSystemStorage(
             location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL
         )
-        items = []
-        index = 0
-        while True:
-            name = request.data.get(f"items[{index}].name")
-            image = request.FILES.get(f"items[{index}].image")
-            image_url = request.data.get(f"items[{index}].image_url")
-            if name is None and image is None and image_url is None:
-                break
-            if image is not None:
-                validate_image_file(image, f"items[{index}].image")
-                url = WorldcupCreateView._save_file(
-                    self, storage, draft_prefix, image, f"item-{index + 1}"
-                )
-            else:
-                validate_image_url(image_url or "", f"items[{index}].image_url")
-                url = image_url or ""
-            items.append({"name": name or "", "image_url": url})
-            index += 1
+        known = self._known_draft_files(previous)
+        by_hash = {digest: url for url, digest in known.values() if digest}
+        image_urls = {}
+        written = []
+
+        def store_upload(file_obj, field_name: str, fallback: str) -> tuple[str, str]:
+            digest = blob_store.content_digest(file_obj)
+            if digest in by_hash:
+                return by_hash[digest], digest
+            validate_image_file(file_obj, field_name)
+            url = WorldcupCreateView._save_file(self, storage, draft_prefix, file_obj, fallback)
+            written.append(media_relative_path(url))
+            by_hash[digest] = url
+            return url, digest
+
+        def reuse_url(image_url: str, field_name: str) -> tuple[str, str]:
+            entry = known.get(self._draft_file_key(image_url))
+            if entry:
+                return entry
+            image_urls[field_name] = image_url
+            return image_url, ""
 
-        thumbnail = request.FILES.get("thumbnail")
-        thumbnail_url = request.data.get("thumbnail_url") or ""
-        if thumbnail is not None:
-            validate_image_file(thumbnail, "thumbnail")
-            thumbnail_url = WorldcupCreateView._save_file(
-                self, storage, draft_prefix, thumbnail, "thumbnail"
-            )
-        elif thumbnail_url:
-            validate_image_url(thumbnail_url, "thumbnail_url")
+        try:
+            items = []
+            index = 0
+            while True:
+                name = request.data.get(f"items[{index}].name")
+                image = request.FILES.get(f"items[{index}].image")
+                image_url = request.data.get(f"items[{index}].image_url")
+                if name is None and image is None and image_url is None:
+                    break
+                digest = ""
+                if image is not None:
+                    url, digest = store_upload(image, f"items[{index}].image", f"item-{index + 1}")
+                elif image_url:
+                    url, digest = reuse_url(image_url, f"items[{index}].image_url")
+                else:
+                    url = ""
+                item = {"name": name or "", "image_url": url}
+                if digest:
+                    item["image_hash"] = digest
+                items.append(item)
+                index += 1
+
+            thumbnail = request.FILES.get("thumbnail")
+            thumbnail_url = request.data.get("thumbnail_url") or ""
+            thumbnail_hash = ""
+            if thumbnail is not None:
+                thumbnail_url, thumbnail_hash = store_upload(thumbnail, "thumbnail", "thumbnail")
+            elif thumbnail_url:
+                thumbnail_url, thumbnail_hash = reuse_url(thumbnail_url, "thumbnail_url")
+            validate_image_urls(image_urls)
+        except ValidationError:
+            self._remove_draft_files(written)
+            if not existing:
+                _cleanup_media_prefix(draft_prefix)
+            raise
 
-        payload = {
-            "title": (request.data.get("title") or "").strip(),
-            "description": (request.data.get("description") or "").strip(),
-            "thumbnail_url": thumbnail_url,
-            "items": items,
-        }
-        return draft_prefix, payload
+        payload = dict(previous)
+        payload.update(
+            {
+                "title": (request.data.get("title") or "").strip(),
+                "description": (request.data.get("description") or "").strip(),
+                "thumbnail_url": thumbnail_url,
+                "items": items,
+            }
+        )
+        if thumbnail_hash:
+            payload["thumbnail_hash"] = thumbnail_hash
+        else:
+            payload.pop("thumbnail_hash", None)
+
+        # 드래프트 prefix 안의 파일 중 새 payload 에서 빠진 것만 지운다.
+        in_use = set(self._known_draft_files(payload))
+        removed = [
+            key
+            for key in known
+            if key.startswith(draft_prefix) and key not in in_use
+        ]
+        return draft_prefix, payload, written, removed
 
     def get(self, request, *args, **kwargs):
         user = self._require_user(request)
-        self._cleanup_old_drafts(user)
-        draft = WorldcupDraft.objects.filter(user=user).order_by("-updated_at").first()
+        draft = active_drafts(user).order_by("-updated_at").first()
         if not draft:
             return self.respond(data={"draft": None})
         return self.respond(
@@ -698,30 +1025,42 @@ class WorldcupDraftView(BaseAPIView):
 
     def post(self, request, *args, **kwargs):
         user = self._require_user(request)
-        self._cleanup_old_drafts(user)
         draft_code = (request.data.get("draft_code") or "").strip()
-        existing = None
-        if draft_code:
-            existing = WorldcupDraft.objects.filter(
-                user=user, draft_code=draft_code
-            ).first()
-        draft_prefix, payload = self._save_draft_files(user, request)
-        if existing:
-            if existing.draft_prefix:
-                draft_path = os.path.join(settings.MEDIA_ROOT, existing.draft_prefix)
-                if os.path.isdir(draft_path):
-                    shutil.rmtree(draft_path, ignore_errors=True)
-            existing.draft_prefix = draft_prefix
-            existing.payload = payload
-            existing.save(update_fields=["draft_prefix", "payload", "updated_at"])
-            draft = existing
-        else:
-            draft = WorldcupDraft.objects.create(
-                user=user,
-                draft_prefix=draft_prefix,
-                payload=payload,
-                draft_code=self._ensure_draft_code(),
-            )
+        written = []
+        try:
+            with transaction.atomic():
+                existing = None
+                if draft_code:
+                    existing = (
+                        active_drafts(user)
+                        .select_for_update()
+                        .filter(draft_code=draft_code)
+                        .first()
+                    )
+                draft_prefix, payload, written, removed = self._save_draft_files(
+                    user, request, existing
+                )
+                if existing:
+                    updates = ["updated_at"]
+                    if existing.draft_prefix != draft_prefix:
+                        existing.draft_prefix = draft_prefix
+                        updates.append("draft_prefix")
+                    if existing.payload != payload:
+                        existing.payload = payload
+                        updates.append("payload")
+                    existing.save(update_fields=updates)
+                    draft = existing
+                else:
+                    draft = WorldcupDraft.objects.create(
+                        user=user,
+                        draft_prefix=draft_prefix,
+                        payload=payload,
+                        draft_code=self._ensure_draft_code(),
+                    )
+                transaction.on_commit(lambda: self._remove_draft_files(removed))
+        except Exception:
+            self._remove_draft_files(written)
+            raise
         return self.respond(
             data={"draft": {"draft_code": draft.draft_code, **payload}},
             status_code=201,
@@ -734,11 +1073,7 @@ class WorldcupDraftListView(BaseAPIView):
     def get(self, request, *args, **kwargs):
         if not request.user or not request.user.is_authenticated:
             raise ValidationError("로그인이 필요합니다.")
-        WorldcupDraftView()._cleanup_old_drafts(request.user)
-        drafts = (
-            WorldcupDraft.objects.filter(user=request.user)
-            .order_by("-updated_at")
-        )
+        drafts = active_drafts(request.user).order_by("-updated_at")
         return self.respond(
             data={
                 "drafts": [
@@ -759,10 +1094,7 @@ class WorldcupDraftDetailView(BaseAPIView):
     def get(self, request, draft_code, *args, **kwargs):
         if not request.user or not request.user.is_authenticated:
             raise ValidationError("로그인이 필요합니다.")
-        WorldcupDraftView()._cleanup_old_drafts(request.user)
-        draft = WorldcupDraft.objects.filter(
-            user=request.user, draft_code=draft_code
-        ).first()
+        draft = active_drafts(request.user).filter(draft_code=draft_code).first()
         if not draft:
             return self.respond(data={"draft": None})
         return self.respond(
@@ -871,6 +1203,7 @@ class AdminBannerListView(WorldcupCreateView):
             start_at=start_at,
             end_at=end_at,
         )
+        schedule_banner_variants(banner.id)
         serializer = AdminBannerSerializer(banner)
         return self.respond(data={"banner": serializer.data}, status_code=201)
 
@@ -974,7 +1307,12 @@ class AdminBannerDetailView(WorldcupCreateView):
         if not updates:
             raise ValidationError({"detail": "수정할 값이 없습니다."})
 
+        if "image_url" in updates:
+            # 이전 이미지의 변환본이 새 이미지로 보이지 않도록 비우고 응답 뒤에 다시 만든다.
+            updates.extend(clear_image_fields(banner, BANNER_IMAGE_FIELDS))
         banner.save(update_fields=list(set(updates)))
+        if "image_url" in updates:
+            schedule_banner_variants(banner.id)
         serializer = AdminBannerSerializer(banner)
         return self.respond(data={"banner": serializer.data})
 
@@ -1008,7 +1346,7 @@ class GameEditRequestView(WorldcupCreateView):
     api_name = "games.edit_request"
     parser_classes = (MultiPartParser, FormParser)
 
-    def _parse_items(self, request):
+    def _parse_items(self, request, image_urls: dict):
         items = []
         index = 0
         while True:
@@ -1023,7 +1361,7 @@ class GameEditRequestView(WorldcupCreateView):
             if image is not None:
                 validate_image_file(image, f"items[{index}].image")
             elif image_url:
-                validate_image_url(image_url, f"items[{index}].image_url")
+                image_urls[f"items[{index}].image_url"] = image_url
             parsed_id = None
             if item_id not in (None, ""):
                 try:
@@ -1069,7 +1407,8 @@ class GameEditRequestView(WorldcupCreateView):
             raise ValidationError({"title": "게임 제목을 입력해 주세요."})
         description = (request.data.get("description") or "").strip()
 
-        items = self._parse_items(request)
+        image_urls = {}
+        items = self._parse_items(request, image_urls)
         if len(items) < 2:
             raise ValidationError({"items": "아이템은 최소 2개 필요합니다."})
 
@@ -1078,7 +1417,8 @@ class GameEditRequestView(WorldcupCreateView):
         if thumbnail is not None:
             validate_image_file(thumbnail, "thumbnail")
         elif thumbnail_url:
-            validate_image_url(thumbnail_url, "thumbnail_url")
+            image_urls["thumbnail_url"] = thumbnail_url
+        validate_image_urls(image_urls)
 
         request_prefix = f"worldcup/edit-requests/{game.id}/{uuid.uuid4().hex}/"
         storage = FileSystemStorage(
@@ -1270,7 +1610,9 @@ class AdminGameEditRequestApproveView(WorldcupCreateView):
     api_name = "admin.edit_requests.approve"
     parser_classes = (JSONParser, FormParser, MultiPartParser)
 
-    def _normalize_image_url(self, storage, game: Game, image_url: str) -> str:
+    def _normalize_image_url(
+        self, storage, game: Game, image_url: str, moves=None, request_prefix: str = ""
+    ) -> str:
         if not image_url:
             return ""
         path = urlparse(image_url).path
@@ -1278,6 +1620,13 @@ class AdminGameEditRequestApproveView(WorldcupCreateView):
             relative_path = path[len(settings.MEDIA_URL) :]
             if relative_path.startswith(game.storage_prefix):
                 return image_url
+            if moves is not None and request_prefix and relative_path.startswith(request_prefix):
+                # 수정 요청에서 올린 파일은 복사하지 않고 게임 경로로 옮긴다.
+                filename = os.path.basename(relative_path)
+                moved = moves.move(relative_path, f"{game.storage_prefix}{filename}")
+                if moved == relative_path:
+                    raise ValidationError({"image_url": "원본 이미지를 찾을 수 없습니다."})
+                return storage.url(moved)
             return self._copy_from_media_url(storage, game.storage_prefix, image_url)
         return image_url
 
@@ -1300,8 +1649,11 @@ class AdminGameEditRequestApproveView(WorldcupCreateView):
         storage = FileSystemStorage(
             location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL
         )
+        moves = blob_store.MediaMoves(storage)
+        request_prefix = edit_request.request_prefix or ""
 
-        with transaction.atomic():
+        # DB 트랜잭션이 실패하면 옮긴 파일을 요청 경로로 되돌린다.
+        with moves.undo_on_error(), transaction.atomic():
             game = edit_request.game
             updates = []
             title = (payload.get("title") or "").strip()
@@ -1313,56 +1665,23 @@ class AdminGameEditRequestApproveView(WorldcupCreateView):
             updates.append("description")
             thumbnail_url = payload.get("thumbnail_url")
             if thumbnail_url:
-                game.thumbnail_image_url = self._normalize_image_url(storage, game, thumbnail_url)
+                game.thumbnail_image_url = self._normalize_image_url(
+                    storage, game, thumbnail_url, moves, request_prefix
+                )
                 updates.append("thumbnail_image_url")
+                updates.extend(clear_image_fields(game, GAME_THUMBNAIL_FIELDS))
             if updates:
                 game.save(update_fields=updates)
 
-            existing_items = {item.id: item for item in game.items.all()}
-            payload_ids = set()
-            for item_data in items:
-                item_id = item_data.get("id")
-                name = (item_data.get("name") or "").strip()
-                image_url = item_data.get("image_url")
-                sort_order = item_data.get("sort_order")
-                try:
-                    sort_order = int(sort_order) if sort_order is not None else 0
-                except (TypeError, ValueError):
-                    sort_order = 0
-                if item_id and item_id in existing_items:
-                    item = existing_items[item_id]
-                    item_updates = []
-                    if item.name != name:
-                        item.name = name
-                        item_updates.append("name")
-                    if image_url:
-                        normalized = self._normalize_image_url(storage, game, image_url)
-                        if item.file_name != normalized:
-                            item.file_name = normalized
-                            item_updates.append("file_name")
-                    if item.sort_order != sort_order:
-                        item.sort_order = sort_order
-                        item_updates.append("sort_order")
-                    if item_updates:
-                        item.save(update_fields=item_updates)
-                    payload_ids.add(item_id)
-                else:
-                    if not image_url:
-                        raise ValidationError({"items": "새 아이템에는 이미지가 필요합니다."})
-                    normalized = self._normalize_image_url(storage, game, image_url)
-                    created = GameItem.objects.create(
-                        game=game,
-                        name=name,
-                        file_name=normalized,
-                        sort_order=sort_order,
-                        uploaded_by=edit_request.user,
-                        source_type=GameItemSourceType.USER_UPLOAD,
-                    )
-                    payload_ids.add(created.id)
-
-            for item_id, item in existing_items.items():
-                if item_id not in payload_ids:
-                    item.delete()
+            diff = diff_items(
+                game,
+                items,
+                lambda image_url: self._normalize_image_url(
+                    storage, game, image_url, moves, request_prefix
+                ),
+                uploaded_by=edit_request.user,
+            )
+            apply_item_diff(diff)
 
             edit_request.status = GameEditRequestStatus.APPROVED
             edit_request.reviewed_by = request.user
@@ -1376,10 +1695,16 @@ class AdminGameEditRequestApproveView(WorldcupCreateView):
                 action=GameEditRequestAction.APPROVED,
                 payload=payload,
             )
-            _cleanup_media_prefix(edit_request.request_prefix)
+            # 커밋된 뒤에만 요청 경로를 지운다. 옮긴 파일은 이미 빠져 있다.
+            transaction.on_commit(lambda: _cleanup_media_prefix(request_prefix))
+            schedule_game_images(game.id, thumbnail="thumbnail_image_url" in updates)
 
         return self.respond(
-            data={"request_id": edit_request.id, "status": edit_request.status}
+            data={
+                "request_id": edit_request.id,
+                "status": edit_request.status,
+                "diff": diff.summary(),
+            }
         )
 
 
@@ -1519,7 +1844,13 @@ class AdminGameItemUpdateView(BaseAPIView):
         if not updates:
             raise ValidationError({"detail": "수정할 값이 없습니다."})
 
+        if "file_name" in updates:
+            updates.extend(clear_image_fields(item, ITEM_IMAGE_FIELDS))
         item.save(update_fields=updates)
+        if "file_name" in updates:
+            schedule_game_images(item.game_id, [item.id])
+        else:
+            schedule_atlas_build(item.game_id)
         return self.respond(
             data={
                 "item_id": item.id,
@@ -1568,6 +1899,7 @@ class AdminGameItemCreateView(BaseAPIView):
                 else GameItemSourceType.USER_UPLOAD
             ),
         )
+        schedule_game_images(item.game_id, [item.id])
         return self.respond(
             data={"item_id": item.id, "file_name": item.file_name, "sort_order": item.sort_order},
             status_code=201,
@@ -1583,9 +1915,32 @@ class AdminGameItemDeleteView(BaseAPIView):
             return denied
         item = get_object_or_404(GameItem, pk=item_id)
         item.delete()
+        schedule_atlas_build(item.game_id)
         return self.respond(data={"deleted": True, "item_id": item_id})
 
 
+def _parse_id_param(request, name: str) -> int | None:
+    value = request.query_params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValidationError({name: f"{name}는 숫자여야 합니다."}) from exc
+
+
+def _log_filters(request, time_field: str, user_field: str = "user_id") -> dict:
+    """관리자 로그 공통 필터: game_id, user_id, date_from/date_to."""
+    filters = date_range_filters(request, time_field)
+    game_id = _parse_id_param(request, "game_id")
+    if game_id is not None:
+        filters["game_id"] = game_id
+    user_id = _parse_id_param(request, "user_id")
+    if user_id is not None:
+        filters[user_field] = user_id
+    return filters
+
+
 class AdminGameChoiceLogListView(BaseAPIView):
     api_name = "admin.logs.choice"
 
@@ -1593,9 +1948,15 @@ class AdminGameChoiceLogListView(BaseAPIView):
         denied = _require_staff(self, request)
         if denied:
             return denied
-        qs = GameChoiceLog.objects.select_related("game", "user").order_by("-started_at")[:200]
-        serializer = AdminGameChoiceLogSerializer(qs, many=True)
-        return self.respond(data={"logs": serializer.data})
+        qs = GameChoiceLog.objects.select_related("game", "user").filter(
+            **_log_filters(request, "started_at")
+        )
+        source = request.query_params.get("source")
+        if source:
+            qs = qs.filter(source=source)
+        page = keyset_paginate(qs, request, "started_at")
+        serializer = AdminGameChoiceLogSerializer(page.object_list, many=True)
+        return self.respond_paginated(page=page, data={"logs": serializer.data})
 
 
 class AdminWorldcupPickLogListView(BaseAPIView):
@@ -1605,9 +1966,98 @@ class AdminWorldcupPickLogListView(BaseAPIView):
         denied = _require_staff(self, request)
         if denied:
             return denied
-        qs = WorldcupPickLog.objects.select_related("game", "selected_item").order_by("-created_at")[:200]
-        serializer = AdminWorldcupPickLogSerializer(qs, many=True)
-        return self.respond(data={"logs": serializer.data})
+        filters = _log_filters(request, "created_at", user_field="choice__user_id")
+        source = request.query_params.get("source")
+        if source:
+            filters["choice__source"] = source
+        cursor = request.query_params.get("cursor")
+        cursor_key = decode_time_cursor(cursor, size=3) if cursor else None
+        page_size = parse_page_size(request)
+        picks, next_key = page_picks(filters, cursor_key, page_size)
+        next_cursor = None
+        if next_key:
+            next_cursor = encode_cursor([next_key[0].isoformat(), next_key[1], next_key[2]])
+        page = KeysetPage(picks, page_size, next_cursor, has_previous=bool(cursor))
+        serializer = AdminWorldcupPickLogSerializer(picks, many=True)
+        return self.respond_paginated(page=page, data={"logs": serializer.data})
+
+
+class AdminLogExportView(BaseAPIView):
+    api_name = "admin.logs.export"
+
+    def get(self, request, *args, **kwargs):
+        denied = _require_staff(self, request)
+        if denied:
+            return denied
+        dataset = request.query_params.get("dataset") or ""
+        fields = get_export_fields(dataset)
+        # DRF 가 ?format= 을 렌더러 선택에 쓰므로 export_format 으로 받는다.
+        export_format = request.query_params.get("export_format") or "csv"
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"export_format": "csv 또는 ndjson만 가능합니다."})
+        filters = build_export_filters(
+            dataset,
+            _parse_id_param(request, "game_id"),
+            request.query_params.get("date_from"),
+            request.query_params.get("date_to"),
+        )
+        response = StreamingHttpResponse(
+            render_export(iter_export_rows(dataset, filters), fields, export_format),
+            content_type=(
+                "application/x-ndjson; charset=utf-8"
+                if export_format == "ndjson"
+                else "text/csv; charset=utf-8"
+            ),
+        )
+        filename = f"{dataset}-{timezone.localdate().isoformat()}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+# 기간을 주지 않았을 때 보여 줄 범위
+ACTIVITY_DEFAULT_RANGE = {
+    GameActivityGranularity.HOUR: timedelta(hours=48),
+    GameActivityGranularity.DAY: timedelta(days=30),
+}
+
+
+class AdminGameActivityView(BaseAPIView):
+    api_name = "admin.activity"
+
+    def get(self, request, *args, **kwargs):
+        denied = _require_staff(self, request)
+        if denied:
+            return denied
+        granularity = request.query_params.get("granularity") or GameActivityGranularity.DAY
+        if granularity not in GameActivityGranularity.values:
+            raise ValidationError({"granularity": "granularity는 hour 또는 day 이어야 합니다."})
+        # 원본 로그 대신 rollup_game_activity 커맨드가 채운 집계만 읽는다.
+        filters = date_range_filters(request, "bucket_start")
+        if "bucket_start__gte" not in filters:
+            filters["bucket_start__gte"] = timezone.now() - ACTIVITY_DEFAULT_RANGE[granularity]
+        game_id = _parse_id_param(request, "game_id")
+        if game_id is not None:
+            filters["game_id"] = game_id
+        rows = (
+            GameActivityRollup.objects.filter(granularity=granularity, **filters)
+            .values("bucket_start")
+            .annotate(**{field: models.Sum(field) for field in ROLLUP_FIELDS})
+            .order_by("bucket_start")
+        )
+        processed_until = get_processed_until()
+        return self.respond(
+            data={
+                "granularity": granularity,
+                "processed_until": processed_until.isoformat() if processed_until else None,
+                "series": [
+                    {
+                        "bucket_start": row["bucket_start"].isoformat(),
+                        **{field: row[field] or 0 for field in ROLLUP_FIELDS},
+                    }
+                    for row in rows
+                ],
+            }
+        )
 
 
 class AdminGameResultListView(BaseAPIView):
@@ -1618,30 +2068,38 @@ class AdminGameResultListView(BaseAPIView):
         if denied:
             return denied
         game_id_value = request.query_params.get("game_id")
-        if game_id_value:
+        # game_id 만 주면 우승 집계, mode=list 를 함께 주면 해당 게임의 결과 목록
+        if game_id_value and request.query_params.get("mode") != "list":
             try:
                 game_id = int(game_id_value)
             except (TypeError, ValueError) as exc:
                 raise ValidationError({"game_id": "올바른 게임 ID가 아닙니다."}) from exc
-            qs = GameResult.objects.filter(game_id=game_id)
-            total_results = qs.count()
-            ranking_rows = (
-                qs.values("winner_item_id", "winner_item__name")
-                .annotate(count=models.Count("id"))
-                .order_by("-count", "winner_item__name", "winner_item_id")
+            # 결과 테이블 대신 결과 저장 시 갱신되는 우승 집계에서 읽는다.
+            counts = get_champion_counts(game_id)
+            names = dict(
+                GameItem.objects.filter(id__in=[i for i in counts if i]).values_list("id", "name")
             )
             ranking = [
                 {
-                    "id": row["winner_item_id"],
-                    "name": row["winner_item__name"] or "미지정",
-                    "count": row["count"],
+                    "id": winner_item_id,
+                    "name": names.get(winner_item_id) or "미지정",
+                    "count": count,
                 }
-                for row in ranking_rows
+                for winner_item_id, count in counts.items()
+                if count
             ]
+            ranking.sort(key=lambda row: (-row["count"], row["name"], row["id"] or 0))
+            total_results = sum(counts.values())
             return self.respond(data={"total_results": total_results, "ranking": ranking})
-        qs = GameResult.objects.select_related("game", "winner_item").order_by("-created_at")[:200]
-        serializer = AdminGameResultSerializer(qs, many=True)
-        return self.respond(data={"results": serializer.data})
+        qs = GameResult.objects.select_related("game", "winner_item").filter(
+            **_log_filters(request, "created_at", user_field="choice__user_id")
+        )
+        source = request.query_params.get("source")
+        if source:
+            qs = qs.filter(choice__source=source)
+        page = keyset_paginate(qs, request, "created_at")
+        serializer = AdminGameResultSerializer(page.object_list, many=True)
+        return self.respond_paginated(page=page, data={"results": serializer.data})
 
 
 class AdminJsonListView(BaseAPIView):
@@ -1677,9 +2135,9 @@ class AdminJsonDetailView(BaseAPIView):
         frontend_path = _resolve_frontend_json_path(normalized)
         if not os.path.exists(frontend_path):
             raise ValidationError({"path": f"파일이 없습니다: {normalized}"})
-        with open(frontend_path, "r", encoding="utf-8") as handle:
-            content = json.load(handle)
-        return self.respond(data={"path": normalized, "content": content})
+        return json_document_response(
+            request, frontend_path, normalized, self.api_name, cache_control="private, no-cache"
+        )
 
     def post(self, request, *args, **kwargs):
         denied = _require_staff(self, request)
@@ -1690,11 +2148,13 @@ class AdminJsonDetailView(BaseAPIView):
         _, normalized = _resolve_json_path(path_value or "")
         if content is None:
             raise ValidationError({"content": "저장할 내용이 없습니다."})
+        content, _ = extract_embedded_images(content)
         try:
             frontend_path = _resolve_frontend_json_path(normalized)
             os.makedirs(os.path.dirname(frontend_path), exist_ok=True)
             with open(frontend_path, "w", encoding="utf-8") as handle:
                 json.dump(content, handle, ensure_ascii=False, indent=2)
+            invalidate_json_document(frontend_path)
         except ValidationError:
             raise
         except OSError:
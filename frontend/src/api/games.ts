@@ -1,4 +1,5 @@
 // src/api/games.ts
+import type { CSSProperties } from "react";
 import { apiClient, requestWithMeta, resolveMediaUrl } from "./http";
 import type { ApiResponse } from "./http";
 
@@ -9,16 +10,61 @@ export interface Game {
   slug?: string;
   type: string;
   thumbnail: string;
+  thumbnail_width?: number | null;
+  thumbnail_height?: number | null;
+  // 16px WebP data URI. 원본이 오기 전 배경으로 깔아 둔다.
+  thumbnail_placeholder?: string;
   created_by?: { id: number; name: string; email: string; is_staff: boolean } | null;
+  item_atlas?: GameItemAtlas;
+}
+
+// 아이템 썸네일 스프라이트 시트. items 의 키는 아이템 id.
+export interface GameItemAtlas {
+  cell?: [number, number];
+  columns?: number;
+  sheets?: { url: string; columns: number; rows: number }[];
+  items?: Record<string, { sheet: number; column: number; row: number; src: string }>;
 }
 
 export interface GameItem {
   id: number;
   name: string;
   file_name: string;
+  // 폭(px) -> WebP URL. 폭은 960 이하이며 원본보다 크지 않다.
+  image_variants?: Record<string, string>;
+  image_width?: number | null;
+  image_height?: number | null;
+  image_placeholder?: string;
   sort_order: number;
 }
 
+export const buildImageSrcSet = (variants?: Record<string, string>) => {
+  if (!variants) return undefined;
+  const entries = Object.entries(variants).map(([width, url]) => `${url} ${width}w`);
+  return entries.length ? entries.join(", ") : undefined;
+};
+
+export const getPlaceholderStyle = (placeholder?: string): CSSProperties | undefined =>
+  placeholder
+    ? { backgroundImage: `url("${placeholder}")`, backgroundSize: "cover", backgroundPosition: "center" }
+    : undefined;
+
+export const getAtlasSpriteStyle = (
+  atlas: GameItemAtlas | undefined,
+  itemId: number
+): CSSProperties | undefined => {
+  const entry = atlas?.items?.[String(itemId)];
+  const sheet = entry ? atlas?.sheets?.[entry.sheet] : undefined;
+  if (!entry || !sheet) return undefined;
+  const x = sheet.columns > 1 ? (entry.column / (sheet.columns - 1)) * 100 : 0;
+  const y = sheet.rows > 1 ? (entry.row / (sheet.rows - 1)) * 100 : 0;
+  return {
+    backgroundImage: `url("${sheet.url}")`,
+    backgroundSize: `${sheet.columns * 100}% ${sheet.rows * 100}%`,
+    backgroundPosition: `${x}% ${y}%`,
+  };
+};
+
 type GameDetailFromApi = {
   id: number;
   title: string;
@@ -27,6 +73,7 @@ type GameDetailFromApi = {
   type: string;
   thumbnail_image_url?: string;
   items?: GameItem[];
+  item_atlas?: GameItemAtlas;
   created_by?: { id: number; name: string; email: string; is_staff: boolean } | null;
 };
 
@@ -36,6 +83,9 @@ type GameListItemFromApi = {
   slug?: string;
   type: string;
   thumbnail_image_url?: string;
+  thumbnail_width?: number | null;
+  thumbnail_height?: number | null;
+  thumbnail_placeholder?: string;
 };
 
 export interface GameDetailData {
@@ -62,11 +112,25 @@ export async function fetchGameDetail(
   const resolvedItems = normalizedItems.map((item) => ({
     ...item,
     file_name: item.file_name ? resolveMediaUrl(item.file_name) : item.file_name,
+    image_variants: Object.fromEntries(
+      Object.entries(item.image_variants ?? {}).map(([width, url]) => [width, resolveMediaUrl(url)])
+    ),
   }));
+  // 아틀라스는 백그라운드에서 갱신되므로 이미지가 바뀐 아이템의 칸은 쓰지 않는다.
+  const fileNames = new Map(normalizedItems.map((item) => [String(item.id), item.file_name]));
+  const atlas = game.item_atlas ?? {};
+  const itemAtlas: GameItemAtlas = {
+    ...atlas,
+    sheets: (atlas.sheets ?? []).map((sheet) => ({ ...sheet, url: resolveMediaUrl(sheet.url) })),
+    items: Object.fromEntries(
+      Object.entries(atlas.items ?? {}).filter(([id, entry]) => fileNames.get(id) === entry.src)
+    ),
+  };
   const normalizedGame: Game & { items: GameItem[] } = {
     ...game,
     thumbnail: game.thumbnail_image_url ? resolveMediaUrl(game.thumbnail_image_url) : "",
     items: resolvedItems,
+    item_atlas: itemAtlas,
     created_by: game.created_by ?? undefined,
   };
 
@@ -87,6 +151,9 @@ export async function fetchGamesList(): Promise<Game[]> {
       slug: g.slug,
       type: g.type,
       thumbnail: g.thumbnail_image_url ? resolveMediaUrl(g.thumbnail_image_url) : "",
+      thumbnail_width: g.thumbnail_width,
+      thumbnail_height: g.thumbnail_height,
+      thumbnail_placeholder: g.thumbnail_placeholder,
     })) ?? [];
   return games;
 }
@@ -117,6 +184,9 @@ export async function fetchMyGames(): Promise<Game[]> {
       slug: g.slug,
       type: g.type,
       thumbnail: g.thumbnail_image_url ? resolveMediaUrl(g.thumbnail_image_url) : "",
+      thumbnail_width: g.thumbnail_width,
+      thumbnail_height: g.thumbnail_height,
+      thumbnail_placeholder: g.thumbnail_placeholder,
     })) ?? [];
   return games;
 }
@@ -413,11 +483,21 @@ export async function fetchAdminEditRequestDetail(
   };
 }
 
+export type EditRequestDiffSummary = {
+  created: number;
+  updated: number;
+  deleted: number;
+  unchanged: number;
+  updated_fields: string[];
+};
+
 export async function approveAdminEditRequest(
   requestId: number
-): Promise<{ request_id: number; status: string }> {
+): Promise<{ request_id: number; status: string; diff?: EditRequestDiffSummary }> {
   const response = await requestWithMeta(
-    apiClient.post<ApiResponse<{ request_id: number; status: string }>>(
+    apiClient.post<
+      ApiResponse<{ request_id: number; status: string; diff?: EditRequestDiffSummary }>
+    >(
       "/games/admin/edit-requests/approve/",
       { request_id: requestId }
     )
@@ -575,7 +655,8 @@ export type AdminChoiceLog = {
 };
 
 export type AdminPickLog = {
-  id: number;
+  // 압축 저장(packed) 로그는 행 ID 가 없다.
+  id: number | null;
   choice_id: number;
   game: { id: number; title: string };
   left_item: { id: number; name: string } | null;
@@ -636,6 +717,57 @@ export async function fetchAdminResultSummary(gameId: number): Promise<AdminResu
   return response;
 }
 
+export type AdminActivityGranularity = "hour" | "day";
+
+export type AdminActivityBucket = {
+  bucket_start: string;
+  sessions_started: number;
+  sessions_finished: number;
+  picks: number;
+  results: number;
+};
+
+export type AdminActivitySeries = {
+  granularity: AdminActivityGranularity;
+  processed_until: string | null;
+  series: AdminActivityBucket[];
+};
+
+export async function fetchAdminActivity(params: {
+  granularity?: AdminActivityGranularity;
+  gameId?: number;
+  dateFrom?: string;
+  dateTo?: string;
+} = {}): Promise<AdminActivitySeries> {
+  const response = await requestWithMeta(
+    apiClient.get<ApiResponse<AdminActivitySeries>>("/games/admin/activity/", {
+      params: {
+        granularity: params.granularity,
+        game_id: params.gameId,
+        date_from: params.dateFrom,
+        date_to: params.dateTo,
+      },
+    })
+  );
+  return response;
+}
+
+export type AdminLogExportParams = {
+  dataset: "choices" | "picks" | "results";
+  export_format?: "csv" | "ndjson";
+  game_id?: number;
+  date_from?: string;
+  date_to?: string;
+};
+
+export async function downloadAdminLogExport(params: AdminLogExportParams): Promise<Blob> {
+  const response = await apiClient.get<Blob>("/games/admin/logs/export/", {
+    params,
+    responseType: "blob",
+  });
+  return response.data;
+}
+
 
 export async function createWorldcupGame(formData: FormData): Promise<{
   game_id: number;
@@ -657,7 +789,9 @@ export type WorldcupDraftPayload = {
   title?: string;
   description?: string;
   thumbnail_url?: string;
-  items?: { name?: string; image_url?: string }[];
+  thumbnail_hash?: string;
+  // image_hash 는 업로드한 파일의 sha256. 같은 파일을 다시 올리면 서버가 저장을 건너뛴다.
+  items?: { name?: string; image_url?: string; image_hash?: string }[];
 };
 
 export type WorldcupDraftSummary = {
@@ -1,20 +1,64 @@
 import { apiClient, requestWithMeta } from "./http";
 import type { ApiResponse } from "./http";
 
+export type WorldcupBracket = {
+  round_size: number;
+  item_ids: number[];
+  token: string;
+};
+
 export async function createGameSession(params: {
   game_id: number;
   source?: string;
+  mode?: "tournament";
+  round_size?: number;
 }) {
   const response = await requestWithMeta(
     apiClient.post<
       ApiResponse<{
         session_id: number;
+        bracket?: WorldcupBracket;
       }>
     >("/games/session/", params)
   );
   return response;
 }
 
+// 경기 순서대로 0(왼쪽 승)/1(오른쪽 승) 비트를 base64url 문자열로 인코딩
+export const encodeWorldcupPicks = (bits: number[]) => {
+  const bytes = new Uint8Array(Math.ceil(bits.length / 8));
+  bits.forEach((bit, index) => {
+    if (bit) {
+      bytes[index >> 3] |= 1 << (index & 7);
+    }
+  });
+  let binary = "";
+  bytes.forEach((value) => {
+    binary += String.fromCharCode(value);
+  });
+  return btoa(binary).replace(/\+/g, "-").replace(/\//g, "_").replace(/=+$/, "");
+};
+
+export async function submitWorldcupTournament(params: {
+  choice_id: number;
+  bracket_token: string;
+  picks: string;
+  result_title?: string;
+  share_url?: string;
+  result_payload?: Record<string, unknown> | null;
+}) {
+  const response = await requestWithMeta(
+    apiClient.post<
+      ApiResponse<{
+        result_id: number;
+        winner_item_id: number;
+        pick_count: number;
+      }>
+    >("/games/worldcup/tournament/submit/", params)
+  );
+  return response;
+}
+
 export async function createWorldcupPickLog(params: {
   choice_id: number;
   game_id: number;
@@ -33,6 +77,50 @@ export async function createWorldcupPickLog(params: {
   return response;
 }
 
+export type WorldcupPickEntry = {
+  left_item_id?: number | null;
+  right_item_id?: number | null;
+  selected_item_id?: number | null;
+  step_index: number;
+};
+
+export type WorldcupMatchupSide = {
+  id: number;
+  wins: number;
+  percent: number | null;
+};
+
+export type WorldcupMatchup = {
+  total: number;
+  left: WorldcupMatchupSide;
+  right: WorldcupMatchupSide;
+};
+
+export async function fetchWorldcupMatchup(gameId: number, leftItemId: number, rightItemId: number) {
+  const response = await requestWithMeta(
+    apiClient.get<ApiResponse<WorldcupMatchup>>("/games/worldcup/matchup/", {
+      params: { game_id: gameId, left_item_id: leftItemId, right_item_id: rightItemId },
+    })
+  );
+  return response;
+}
+
+export async function createWorldcupPickLogBatch(params: {
+  choice_id: number;
+  game_id: number;
+  picks: WorldcupPickEntry[];
+}) {
+  const response = await requestWithMeta(
+    apiClient.post<
+      ApiResponse<{
+        created: number;
+        errors: { index: number; errors: Record<string, string[]> }[];
+      }>
+    >("/games/worldcup/pick/batch/", params)
+  );
+  return response;
+}
+
 export async function createGameResult(params: {
   choice_id: number;
   game_id: number;
@@ -53,6 +141,13 @@ export async function createGameResult(params: {
   return response;
 }
 
+export type ChampionShare = {
+  total_results: number;
+  same_champion_count: number;
+  same_champion_percent: number;
+  percentile: number;
+};
+
 export type GameResultDetail = {
   id: number;
   choice_id: number;
@@ -95,17 +190,22 @@ export type WorldcupPickSummary = {
     file_name: string;
     sort_order: number;
     wins: number;
+    rating?: number;
   }[];
 };
 
-export async function fetchWorldcupPickSummary(gameId: number, choiceId?: number) {
+export async function fetchWorldcupPickSummary(
+  gameId: number,
+  choiceId?: number,
+  sort: "wins" | "rating" = "wins"
+) {
   const response = await requestWithMeta(
     apiClient.get<
       ApiResponse<{
         summary: WorldcupPickSummary | null;
       }>
     >("/games/worldcup/pick/summary/", {
-      params: { game_id: gameId, choice_id: choiceId },
+      params: { game_id: gameId, choice_id: choiceId, sort },
     })
   );
   return response;
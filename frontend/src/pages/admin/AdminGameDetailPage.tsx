@@ -1,7 +1,7 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 import { useNavigate, useParams } from "react-router-dom";
 import "./admin-games.css";
-import { ApiError } from "../../api/http";
+import { ApiError, resolveMediaUrl } from "../../api/http";
 import type { AdminGameDetail } from "../../api/games";
 import {
   createAdminGameItem,
@@ -241,7 +241,7 @@ export function AdminGameDetailPage() {
       );
       setPsychoThumbnailFile(null);
       setPsychoThumbnailUrl(String(thumbnail_url || ""));
-      setPsychoThumbnailPreview(String(thumbnail_url || ""));
+      setPsychoThumbnailPreview(thumbnail_url ? resolveMediaUrl(String(thumbnail_url)) : "");
       const scoringRecord = (scoring || {}) as Record<string, unknown>;
       setPsychoScoring({
         mode:
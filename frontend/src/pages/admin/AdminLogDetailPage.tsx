@@ -350,7 +350,7 @@ export function AdminLogDetailPage() {
                     .slice()
                     .sort((a, b) => a.step_index - b.step_index)
                     .map((pick) => (
-                      <div key={pick.id}>
+                      <div key={pick.id ?? `${pick.choice_id}-${pick.step_index}`}>
                         <div className="admin-modal-step">판 {pick.step_index + 1}</div>
                         <div className="admin-pick-row admin-pick-row-large">
                           <span
@@ -7,6 +7,7 @@ import { GameStartScreen } from "../../components/GameStartScreen";
 import { MajorArcanaResultActions } from "../../components/MajorArcanaResultActions";
 import { fetchGamesList, fetchGameDetail, type GameDetailData } from "../../api/games";
 import { createGameResult } from "../../api/gamesSession";
+import { resolveMediaUrl } from "../../api/http";
 import { useGameSessionStart } from "../../hooks/useGameSessionStart";
 
 type PsychoOption = {
@@ -344,7 +345,7 @@ export function PsychoTestPage() {
               className={`arcana-page arcana-${result.main.id}`}
               style={
                 result.main.image_url
-                  ? ({ "--arcana-card-image": `url("${result.main.image_url}")` } as CSSProperties)
+                  ? ({ "--arcana-card-image": `url("${resolveMediaUrl(result.main.image_url)}")` } as CSSProperties)
                   : undefined
               }
             >
@@ -390,7 +391,7 @@ export function PsychoTestPage() {
                     {option.image_url ? (
                       <img
                         className="psycho-option-media"
-                        src={option.image_url}
+                        src={resolveMediaUrl(option.image_url)}
                         alt={option.text}
                       />
                     ) : null}
@@ -3,9 +3,15 @@ import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 import { Link, useLocation, useNavigate, useParams } from "react-router-dom";
 import "./worldcup.css";
 import { ApiError } from "../../api/http";
-import { fetchGameDetail } from "../../api/games";
-import { createGameResult, createWorldcupPickLog } from "../../api/gamesSession";
-import { getStoredGameSessionId, startGameSession } from "../../utils/gameSession";
+import { buildImageSrcSet, fetchGameDetail, getPlaceholderStyle } from "../../api/games";
+import {
+  createGameResult,
+  createWorldcupPickLog,
+  encodeWorldcupPicks,
+  fetchWorldcupMatchup,
+  submitWorldcupTournament,
+} from "../../api/gamesSession";
+import { startGameSession, startTournamentSession } from "../../utils/gameSession";
 import type { GameDetailData, GameItem } from "../../api/games";
 import placeholderImage from "../../assets/worldcup-placeholder.svg";
 
@@ -35,6 +41,18 @@ type WorldcupResultPayload = {
   }[];
 };
 
+const pickRandomItems = (items: GameItem[], count: number) => {
+  if (count <= 0 || items.length <= count) {
+    return [...items];
+  }
+  const pool = [...items];
+  for (let i = pool.length - 1; i > 0; i -= 1) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [pool[i], pool[j]] = [pool[j], pool[i]];
+  }
+  return pool.slice(0, count);
+};
+
 export function WorldcupArenaPage() {
   const { gameId } = useParams<{ gameId: string }>();
   const parsedGameId = useMemo(() => {
@@ -59,8 +77,13 @@ export function WorldcupArenaPage() {
   );
   const [selectedId, setSelectedId] = useState<number | null>(null);
   const [sessionId, setSessionId] = useState<number | null>(null);
+  const [matchupShare, setMatchupShare] = useState<{ itemId: number; percent: number } | null>(null);
   const isSelecting = selectedId !== null;
   const pickIndexRef = useRef(0);
+  // 대진표를 받았으면 경기마다 기록하지 않고 0(왼쪽)/1(오른쪽) 비트를 모아 끝에서 한 번 제출한다.
+  const bracketTokenRef = useRef<string | null>(null);
+  const pickBitsRef = useRef<number[]>([]);
+  const startingRef = useRef(false);
   const winCountsRef = useRef<Record<number, number>>({});
   const resultPayloadRef = useRef<WorldcupResultPayload | null>(null);
   const navigate = useNavigate();
@@ -110,18 +133,6 @@ export function WorldcupArenaPage() {
     return Math.max(size, 2);
   }, []);
 
-  const pickRandomItems = (items: GameItem[], count: number) => {
-    if (count <= 0 || items.length <= count) {
-      return [...items];
-    }
-    const pool = [...items];
-    for (let i = pool.length - 1; i > 0; i -= 1) {
-      const j = Math.floor(Math.random() * (i + 1));
-      [pool[i], pool[j]] = [pool[j], pool[i]];
-    }
-    return pool.slice(0, count);
-  };
-
   const startNewSession = useCallback(
     async (source: string) => {
       if (parsedGameId === null) {
@@ -136,6 +147,41 @@ export function WorldcupArenaPage() {
     [parsedGameId]
   );
 
+  const beginTournament = useCallback(
+    async (source: string, items: GameItem[], size: number) => {
+      if (parsedGameId === null || startingRef.current) {
+        return;
+      }
+      startingRef.current = true;
+      pickIndexRef.current = 0;
+      pickBitsRef.current = [];
+      try {
+        const tournament = await startTournamentSession(parsedGameId, source, size);
+        const itemsById = new Map(items.map((item) => [item.id, item]));
+        const bracketItems = (tournament?.bracket.item_ids ?? [])
+          .map((id) => itemsById.get(id))
+          .filter((item): item is GameItem => Boolean(item));
+        if (tournament && bracketItems.length === tournament.bracket.item_ids.length) {
+          // 서버가 정한 대진 순서 그대로 진행해야 비트열로 복원할 수 있다.
+          bracketTokenRef.current = tournament.bracket.token;
+          setSessionId(tournament.sessionId);
+          setPlayItems(bracketItems);
+          startRound(bracketItems, 1);
+          return;
+        }
+        bracketTokenRef.current = null;
+        await startNewSession(source);
+        const selectedItems = pickRandomItems(items, size);
+        const shuffled = [...selectedItems].sort(() => Math.random() - 0.5);
+        setPlayItems(selectedItems);
+        startRound(shuffled, 1);
+      } finally {
+        startingRef.current = false;
+      }
+    },
+    [parsedGameId, startNewSession, startRound]
+  );
+
   useEffect(() => {
     window.scrollTo({ top: 0, behavior: "auto" });
   }, []);
@@ -200,19 +246,18 @@ export function WorldcupArenaPage() {
       return;
     }
     const { items } = state.data;
-    const resolvedSize = resolveRoundSize(selectedRound, items.length);
-    const selectedItems = pickRandomItems(items, resolvedSize);
-    const shuffled = [...selectedItems].sort(() => Math.random() - 0.5);
-    pickIndexRef.current = 0;
-    setPlayItems(selectedItems);
-    startRound(shuffled, 1);
+    void beginTournament(
+      "worldcup_play_start",
+      items,
+      resolveRoundSize(selectedRound, items.length)
+    );
   }, [
+    beginTournament,
     champion,
     currentRound.length,
     roundConfirmed,
     resolveRoundSize,
     selectedRound,
-    startRound,
     state,
   ]);
 
@@ -227,16 +272,6 @@ export function WorldcupArenaPage() {
     setIsRoundModalOpen(true);
   }, [roundConfirmed, selectedRound, state.status]);
 
-  useEffect(() => {
-    if (parsedGameId === null) {
-      return;
-    }
-    const stored = getStoredGameSessionId(parsedGameId);
-    if (stored) {
-      setSessionId(stored);
-    }
-  }, [parsedGameId]);
-
   const handleSelect = (winner: GameItem, target: HTMLElement | null) => {
     if (target) {
       const rect = target.getBoundingClientRect();
@@ -245,10 +280,25 @@ export function WorldcupArenaPage() {
       setSelectedSize(null);
     }
     setSelectedId(winner.id);
+    setMatchupShare(null);
     winCountsRef.current[winner.id] = (winCountsRef.current[winner.id] || 0) + 1;
     const left = a;
     const right = b;
-    if (sessionId && left && right && parsedGameId !== null) {
+    if (left && right && parsedGameId !== null) {
+      void fetchWorldcupMatchup(parsedGameId, left.id, right.id)
+        .then((matchup) => {
+          const side = matchup.left.id === winner.id ? matchup.left : matchup.right;
+          if (side.percent !== null) {
+            setMatchupShare({ itemId: winner.id, percent: side.percent });
+          }
+        })
+        .catch(() => {
+          // 맞대결 통계 실패는 표시만 생략
+        });
+    }
+    if (bracketTokenRef.current && left && right) {
+      pickBitsRef.current.push(winner.id === right.id ? 1 : 0);
+    } else if (sessionId && left && right && parsedGameId !== null) {
       const stepIndex = pickIndexRef.current;
       pickIndexRef.current += 1;
       void createWorldcupPickLog({
@@ -358,6 +408,23 @@ export function WorldcupArenaPage() {
       ? `${resolvedGame.title} 우승`
       : "월드컵 우승";
     const payload = resultPayloadRef.current;
+    const bracketToken = bracketTokenRef.current;
+    if (bracketToken) {
+      // 우승자와 라운드는 서버가 대진표와 비트열로 다시 계산한다.
+      void submitWorldcupTournament({
+        choice_id: sessionId,
+        bracket_token: bracketToken,
+        picks: encodeWorldcupPicks(pickBitsRef.current),
+        result_title: resultTitle,
+        result_payload: {
+          total_items: payload?.totalItems ?? itemsCount,
+          ranking: payload?.ranking,
+        },
+      }).catch(() => {
+        // 결과 로그 실패는 진행을 막지 않음
+      });
+      return;
+    }
     const selectedRoundValue = selectedRound ?? itemsCount;
     void createGameResult({
       choice_id: sessionId,
@@ -523,13 +590,12 @@ export function WorldcupArenaPage() {
                 className="btn btn-primary"
                 type="button"
                 onClick={() => {
-                  const baseItems = playItems.length ? playItems : items;
-                  const shuffled = [...baseItems].sort(() => Math.random() - 0.5);
-                  pickIndexRef.current = 0;
-                  void startNewSession("worldcup_restart");
-                  setChampion(null);
                   setSelectedSize(null);
-                  startRound(shuffled, 1);
+                  void beginTournament(
+                    "worldcup_restart",
+                    items,
+                    playItems.length || resolveRoundSize(selectedRound ?? undefined, items.length)
+                  );
                 }}
               >
                 다시 플레이
@@ -569,7 +635,15 @@ export function WorldcupArenaPage() {
                         video ? (
                           <video src={mediaUrl} controls playsInline muted loop />
                         ) : (
-                          <img src={mediaUrl} alt={contestant.name || contestant.file_name} />
+                          <img
+                            src={mediaUrl}
+                            srcSet={buildImageSrcSet(contestant.image_variants)}
+                            sizes="(max-width: 768px) 50vw, 480px"
+                            width={contestant.image_width ?? undefined}
+                            height={contestant.image_height ?? undefined}
+                            style={getPlaceholderStyle(contestant.image_placeholder)}
+                            alt={contestant.name || contestant.file_name}
+                          />
                         )
                       ) : (
                         <div className="arena-media-fallback">
@@ -583,6 +657,9 @@ export function WorldcupArenaPage() {
                   {contestant.name || contestant.file_name}
                 </div>
                 <div className="arena-full-meta">#{contestant.sort_order + 1}</div>
+                {isSelected && matchupShare?.itemId === contestant.id ? (
+                  <div className="arena-matchup-share">{matchupShare.percent}%가 이 선택을 했어요</div>
+                ) : null}
               </button>
             );
           })}
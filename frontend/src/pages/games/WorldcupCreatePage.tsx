@@ -349,9 +349,20 @@ export function WorldcupCreatePage() {
           formData.append(`items[${index}].image_url`, item.imageUrl);
         }
       });
+      const sentFiles = items.map((item) => item.imageFile);
       saveWorldcupDraft(formData)
         .then((draft) => {
           setActiveDraftCode(draft.draft_code || activeDraftCode);
+          // 저장된 파일은 URL 로 바꿔서 다음 자동 저장 때 다시 올리지 않는다.
+          setItems((prev) =>
+            prev.map((item, index) => {
+              const savedUrl = draft.items?.[index]?.image_url;
+              if (!savedUrl || !item.imageFile || item.imageFile !== sentFiles[index]) {
+                return item;
+              }
+              return { ...item, imageFile: null, imageUrl: resolveMediaUrl(savedUrl) };
+            })
+          );
         })
         .catch(() => {
           // 드래프트 저장 실패는 진행을 막지 않음
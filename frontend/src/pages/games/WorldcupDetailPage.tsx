@@ -3,7 +3,12 @@ import { useEffect, useMemo, useState } from "react";
 import { Link, useParams } from "react-router-dom";
 import "./worldcup.css";
 import { ApiError } from "../../api/http";
-import { fetchGameDetail } from "../../api/games";
+import {
+  buildImageSrcSet,
+  fetchGameDetail,
+  getAtlasSpriteStyle,
+  getPlaceholderStyle,
+} from "../../api/games";
 import type { GameDetailData } from "../../api/games";
 import placeholderImage from "../../assets/worldcup-placeholder.svg";
 
@@ -57,7 +62,13 @@ export function WorldcupDetailPage() {
       <div className="detail-header">
         <div className="detail-thumb">
           <div className="detail-thumb-message">🎉 월드컵이 생성되었습니다! 🎉</div>
-          <img src={game.thumbnail} alt={game.title} />
+          <img
+            src={game.thumbnail}
+            alt={game.title}
+            width={game.thumbnail_width ?? undefined}
+            height={game.thumbnail_height ?? undefined}
+            style={getPlaceholderStyle(game.thumbnail_placeholder)}
+          />
         </div>
         <div>
           <p className="badge badge-hot" style={{ display: "inline-flex" }}>
@@ -78,18 +89,37 @@ export function WorldcupDetailPage() {
           <div className="state-box">아직 등록된 항목이 없습니다.</div>
         ) : (
           <ul className="detail-items">
-            {items.map((item) => (
+            {items.map((item) => {
+              // 시트에 있는 아이템은 이미지 요청 없이 스프라이트로 그린다.
+              const sprite = getAtlasSpriteStyle(game.item_atlas, item.id);
+              return (
               <li key={item.id} className="detail-item">
                 <div className="detail-item-image">
-                  {item.file_name ? (
-                    <img src={item.file_name} alt={item.name || "게임 아이템"} />
+                  {sprite ? (
+                    <div
+                      className="detail-item-sprite"
+                      style={sprite}
+                      role="img"
+                      aria-label={item.name || "게임 아이템"}
+                    />
+                  ) : item.file_name ? (
+                    <img
+                      src={item.file_name}
+                      srcSet={buildImageSrcSet(item.image_variants)}
+                      sizes="160px"
+                      width={item.image_width ?? undefined}
+                      height={item.image_height ?? undefined}
+                      style={getPlaceholderStyle(item.image_placeholder)}
+                      alt={item.name || "게임 아이템"}
+                    />
                   ) : (
                     <img src={placeholderImage} alt="NO IMAGE" />
                   )}
                 </div>
                 <div className="detail-item-name">{item.name || "이름 없음"}</div>
               </li>
-            ))}
+              );
+            })}
           </ul>
         )}
       </div>
@@ -4,7 +4,6 @@ import { Link, useParams } from "react-router-dom";
 import "./worldcup.css";
 import { ApiError } from "../../api/http";
 import { fetchGameDetail } from "../../api/games";
-import { useGameSessionStart } from "../../hooks/useGameSessionStart";
 import type { GameDetailData, GameItem } from "../../api/games";
 import { GameStartScreen } from "../../components/GameStartScreen";
 
@@ -28,7 +27,6 @@ export function WorldcupPlayPage() {
   const [currentRound, setCurrentRound] = useState<GameItem[]>([]);
   const [nextRound, setNextRound] = useState<GameItem[]>([]);
   const [matchIndex, setMatchIndex] = useState(0);
-  const { startSession } = useGameSessionStart(parsedGameId, "worldcup_play_start");
 
   useEffect(() => {
     if (parsedGameId === null) {
@@ -81,13 +79,9 @@ export function WorldcupPlayPage() {
     setMatchIndex(0);
   };
 
-  const startGame = async () => {
+  const startGame = () => {
     if (!items.length || parsedGameId === null) return;
-    try {
-      await startSession();
-    } catch {
-      // 로그 실패는 게임 진행을 막지 않음
-    }
+    // 세션은 arena 에서 대진표와 함께 만든다.
     window.location.href = `/worldcup/${parsedGameId}/arena`;
   };
 
@@ -2,7 +2,7 @@ import { useEffect, useMemo, useState } from "react";
 import { Link, useLocation, useParams } from "react-router-dom";
 import "./worldcup.css";
 import { fetchGameResult, fetchWorldcupPickSummary } from "../../api/gamesSession";
-import type { GameResultDetail } from "../../api/gamesSession";
+import type { ChampionShare, GameResultDetail } from "../../api/gamesSession";
 import placeholderImage from "../../assets/worldcup-placeholder.svg";
 import { getStoredGameSessionId } from "../../utils/gameSession";
 import { resolveMediaUrl } from "../../api/http";
@@ -25,6 +25,7 @@ type ResultPayload = {
     sort_order: number;
     wins: number;
   }[];
+  championShare?: ChampionShare | null;
 };
 
 type LocationState = ResultPayload | null;
@@ -72,6 +73,23 @@ const normalizeRanking = (rankingValue: unknown): ResultPayload["ranking"] => {
     .filter((entry): entry is ResultPayload["ranking"][number] => !!entry);
 };
 
+const normalizeChampionShare = (value: unknown): ChampionShare | null => {
+  if (!value || typeof value !== "object") return null;
+  const record = value as Record<string, unknown>;
+  const total = Number(record.total_results);
+  const percent = Number(record.same_champion_percent);
+  const percentile = Number(record.percentile);
+  if (!Number.isFinite(total) || total <= 0 || !Number.isFinite(percent) || !Number.isFinite(percentile)) {
+    return null;
+  }
+  return {
+    total_results: total,
+    same_champion_count: Number(record.same_champion_count ?? 0),
+    same_champion_percent: percent,
+    percentile,
+  };
+};
+
 const mapResultFromApi = (data: GameResultDetail): ResultPayload | null => {
   const payload = data.result_payload ?? {};
   const payloadRecord = payload && typeof payload === "object" ? (payload as Record<string, unknown>) : {};
@@ -110,6 +128,7 @@ const mapResultFromApi = (data: GameResultDetail): ResultPayload | null => {
     totalItems: Number.isFinite(totalItemsValue) ? totalItemsValue : ranking.length || 0,
     champion,
     ranking: ranking.length ? ranking : [{ ...champion, wins: 1 }],
+    championShare: normalizeChampionShare(payloadRecord.champion_share),
   };
 };
 
@@ -174,6 +193,7 @@ export function WorldcupResultPage() {
               sort_order: championSource.sort_order || 0,
             },
             ranking,
+            championShare: base?.championShare ?? null,
           };
         });
       } catch {
@@ -212,6 +232,7 @@ export function WorldcupResultPage() {
   const video = isVideo(mediaUrl);
   const selectedRound = result.round || result.totalItems;
   const productCount = result.totalItems || result.ranking.length;
+  const championShare = result.championShare;
   return (
     <div className="worldcup-result-page">
       <div className="worldcup-dashboard">
@@ -258,6 +279,18 @@ export function WorldcupResultPage() {
               <span>상품 갯수</span>
               <strong>{productCount}개</strong>
             </div>
+            {championShare ? (
+              <>
+                <div className="worldcup-stat-card">
+                  <span>같은 우승자를 고른 플레이어</span>
+                  <strong>{championShare.same_champion_percent}%</strong>
+                </div>
+                <div className="worldcup-stat-card">
+                  <span>더 드문 우승자를 고른 플레이어</span>
+                  <strong>{championShare.percentile}%</strong>
+                </div>
+              </>
+            ) : null}
           </section>
         </div>
       </div>
@@ -12,7 +12,12 @@ import {
 import { Link } from "react-router-dom";
 import "../games/worldcup.css";
 import type { BannerItem, Game } from "../../api/games";
-import { fetchBanners, fetchGamesList, fetchTodayPick } from "../../api/games";
+import {
+  fetchBanners,
+  fetchGamesList,
+  fetchTodayPick,
+  getPlaceholderStyle,
+} from "../../api/games";
 
 
 
@@ -570,7 +575,14 @@ function CategorySection({
                 <>
                   <div className="gc-thumb">
                     {game.thumbnail ? (
-                      <img src={game.thumbnail} alt={game.title} draggable={false} />
+                      <img
+                        src={game.thumbnail}
+                        alt={game.title}
+                        width={game.thumbnail_width ?? undefined}
+                        height={game.thumbnail_height ?? undefined}
+                        style={getPlaceholderStyle(game.thumbnail_placeholder)}
+                        draggable={false}
+                      />
                     ) : (
                       <div className="gc-thumb-placeholder">준비중</div>
                     )}
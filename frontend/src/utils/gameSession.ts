@@ -29,6 +29,25 @@ export const startGameSession = async (gameId: number, source: string) => {
   return null;
 };
 
+// 서버가 섞은 대진표를 함께 받는다. 실패하면 null 을 돌려주고 호출한 쪽이 기존 방식으로 진행한다.
+export const startTournamentSession = async (gameId: number, source: string, roundSize: number) => {
+  try {
+    const session = await createGameSession({
+      game_id: gameId,
+      source,
+      mode: "tournament",
+      round_size: roundSize,
+    });
+    if (session?.session_id && session.bracket) {
+      storeGameSessionId(gameId, session.session_id);
+      return { sessionId: session.session_id, bracket: session.bracket };
+    }
+  } catch {
+    // 대진표 발급 실패는 진행을 막지 않음
+  }
+  return null;
+};
+
 export const ensureGameSession = async (gameId: number, source: string) => {
   const existing = getStoredGameSessionId(gameId);
   if (existing) {